@@ -0,0 +1,57 @@
+"""
+Benchmark: bare requests.get vs the pooled RiotClient against a local stub server.
+
+Usage:
+    python -m benchmarks.bench_http_client --requests 500
+
+Sample run (500 requests, loopback):
+    bare requests.get      500 requests in 1.80s -> 278 req/s
+    pooled RiotClient      500 requests in 1.29s -> 386 req/s
+    Speedup: 1.39x
+
+The stub must send each response without Nagle delays (disable_nagle_algorithm),
+otherwise every reused keep-alive connection stalls ~40 ms on delayed ACKs and
+the pooled client looks ~20x slower than opening a new connection per request.
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("RIOT_API_KEY", "RGAPI-benchmark")
+
+import requests
+from src.api.client import RiotClient
+from src.api.stub_server import RiotStubServer
+
+
+def _run(label, fetch, url, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        fetch(url).raise_for_status()
+    elapsed = time.perf_counter() - start
+    print(f" {label:<22} {n} requests in {elapsed:.2f}s -> {n / elapsed:,.0f} req/s")
+    return n / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    # Limits are advertised but not enforced: this measures connection cost only
+    server = RiotStubServer(enforce_limits=False)
+    url = f"{server.start()}/lol/match/v5/matches/EUW1_7000000001"
+
+    headers = {"X-Riot-Token": os.environ["RIOT_API_KEY"]}
+    before = _run("bare requests.get", lambda u: requests.get(u, headers=headers), url, args.requests)
+
+    client = RiotClient(api_keys=[os.environ["RIOT_API_KEY"]])
+    after = _run("pooled RiotClient", client.get, url, args.requests)
+    client.close()
+
+    server.stop()
+    print(f" Speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from src.api.key_pool import ApiKeyPool, get_key_pool
+from src.api.retry import RetryPolicy, RETRYABLE_STATUS, get_retry_stats
+from src.api.scheduler import PriorityScheduler, get_scheduler
+from src.api.telemetry import get_telemetry
+from src.utils.concurrency import observe_response
+
+# Connection pool sizing. Riot routes every call for a region through one host
+# (e.g. europe.api.riotgames.com), so a handful of hosts is all we ever talk to.
+DEFAULT_POOL_CONNECTIONS = 4     # Number of distinct hosts kept in the pool
+DEFAULT_POOL_MAXSIZE = 16        # Max keep-alive connections per host
+DEFAULT_TIMEOUT = 10             # Seconds before a request is abandoned
+
+
+class RiotClient:
+    """
+    Shared HTTP client for every Riot API call.
+
+    Wraps a single requests.Session so TCP/TLS connections are kept alive and
+    reused between calls. Each request is signed with whichever pooled API key
+    the scheduler granted the permit from.
+    """
+
+    def __init__(self, api_keys: list = None, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE, timeout: float = DEFAULT_TIMEOUT,
+                 retry_policy: RetryPolicy = None):
+        """
+        Args:
+            api_keys (list): Riot API keys to rotate between; defaults to the configured pool.
+            pool_connections (int): Number of per-host pools to keep.
+            pool_maxsize (int): Max connections kept alive per host.
+            timeout (float): Request timeout in seconds.
+            retry_policy (RetryPolicy): Retry behaviour for 429/5xx/connection errors.
+        """
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        if api_keys is None:
+            self.key_pool = get_key_pool()
+            self.scheduler = get_scheduler()
+        else:
+            self.key_pool = ApiKeyPool(api_keys)
+            self.scheduler = PriorityScheduler(self.key_pool)
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+        })
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, params: dict = None, method: str = None, region: str = None) -> requests.Response:
+        """
+        Sends a GET request through the pooled session, retrying 429/5xx responses.
+
+        Args:
+            url (str): Full endpoint URL.
+            params (dict): Optional query parameters.
+            method (str): Rate-limit bucket (e.g. "match"). When set, the request waits
+                for a permit from the PriorityScheduler (at the priority set with
+                request_priority) and feeds the response's rate-limit headers back
+                into the limiter of the API key that was used.
+            region (str): Regional cluster the URL points at (e.g. "asia"). Each region
+                has its own rate lane, so requests to different regions never wait on
+                each other.
+
+        Returns:
+            requests.Response: The last response (caller checks status). Its
+            `retry_count` attribute says how many retries it took.
+        """
+        policy = self.retry_policy
+        stats = get_retry_stats()
+        telemetry = get_telemetry()
+        bucket = method or "unknown"
+        started = time.monotonic()
+        attempt = 0
+        rate_wait = 0.0
+
+        while True:
+            if method:
+                api_key, waited = self.scheduler.acquire(method, region=region)
+                rate_wait += waited
+            else:
+                api_key = self.key_pool.first_active()
+            sent = time.perf_counter()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout,
+                                            headers={"X-Riot-Token": api_key.key})
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                telemetry.record_response(bucket, type(e).__name__, time.perf_counter() - sent)
+                observe_response(None, time.perf_counter() - sent, endpoint=bucket)
+                delay = policy.backoff_delay(attempt)
+                if not policy.should_retry(attempt, started, delay):
+                    stats.record_give_up(bucket)
+                    telemetry.record_call(bucket, attempt, rate_wait)
+                    raise
+                stats.record_retry(bucket, type(e).__name__)
+                print(f" {bucket}: {type(e).__name__}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            # Without stream=True the body is already read, so this is the full round trip
+            latency = time.perf_counter() - sent
+            telemetry.record_response(bucket, response.status_code, latency, len(response.content))
+            observe_response(response.status_code, latency, response.headers, endpoint=bucket)
+            if method:
+                api_key.limiter_for(region).update_from_headers(method, response.headers)
+
+            if response.status_code == 401 and len(self.key_pool.active_keys()) > 1:
+                # Revoked or expired key: drop it and send the same request with another one
+                self.key_pool.disable(api_key, "HTTP 401")
+                stats.record_retry(bucket, "401")
+                continue
+            if response.status_code == 403:
+                # May only be this endpoint or route; the key goes after 403s on several endpoints
+                if len(self.key_pool.active_keys()) > 1 and self.key_pool.record_forbidden(api_key, bucket):
+                    stats.record_retry(bucket, "403")
+                    continue
+            elif response.ok:
+                self.key_pool.record_success(api_key)
+
+            if response.status_code not in RETRYABLE_STATUS:
+                response.retry_count = attempt
+                telemetry.record_call(bucket, attempt, rate_wait)
+                return response
+
+            delay = policy.retry_delay(attempt, response)
+            if not policy.should_retry(attempt, started, delay):
+                stats.record_give_up(bucket)
+                response.retry_count = attempt
+                telemetry.record_call(bucket, attempt, rate_wait)
+                return response
+
+            stats.record_retry(bucket, str(response.status_code))
+            if response.status_code == 429 and method:
+                # Make every thread using this key wait out Retry-After, not just this one. Only
+                # an application 429 stops the whole lane; method, service (an upstream problem
+                # with this endpoint) or untyped 429s only hold back this method
+                scope = None if response.headers.get("X-Rate-Limit-Type") == "application" else method
+                api_key.limiter_for(region).block(delay, scope)
+            else:
+                time.sleep(delay)
+            print(f" {bucket}: HTTP {response.status_code}, retrying in {delay:.1f}s")
+            attempt += 1
+
+    def close(self):
+        """Closes all pooled connections."""
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> RiotClient:
+    """Returns the process-wide RiotClient, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = RiotClient()
+    return _client
+
+
+def set_client(client: RiotClient):
+    """Replaces the process-wide RiotClient (e.g. to point it at a stub server)."""
+    global _client
+    with _client_lock:
+        if _client is not None and _client is not client:
+            _client.close()
+        _client = client
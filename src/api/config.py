@@ -7,6 +7,25 @@ load_dotenv()
 # Riot API Key (Loaded from .env)
 RIOT_API_KEY = os.getenv("RIOT_API_KEY")
 
-# Check if the key is loaded correctly
-if not RIOT_API_KEY:
-    raise ValueError(" ERROR: Riot API Key is missing! Add it to the .env file.")
+# Optional pool of keys, comma-separated; each key gets its own rate budget
+RIOT_API_KEYS = [k.strip() for k in os.getenv("RIOT_API_KEYS", "").split(",") if k.strip()]
+if RIOT_API_KEY and RIOT_API_KEY not in RIOT_API_KEYS:
+    RIOT_API_KEYS.insert(0, RIOT_API_KEY)
+
+# A missing key only fails once a request is actually made (see ApiKeyPool), so offline
+# replays and processing-only runs work without one
+RIOT_API_KEY = RIOT_API_KEY or (RIOT_API_KEYS[0] if RIOT_API_KEYS else None)
+
+
+def api_base_url(region: str) -> str:
+    """
+    Returns the base URL for a Riot routing region.
+
+    Set RIOT_API_BASE_URL (e.g. "http://127.0.0.1:8080") to send every region to a
+    local stand-in server instead of the real API. A "{region}" placeholder in it
+    (e.g. "http://127.0.0.1:8080/{region}") is replaced with the region.
+    """
+    override = os.getenv("RIOT_API_BASE_URL")
+    if override:
+        return override.replace("{region}", region).rstrip("/")
+    return f"https://{region}.api.riotgames.com"
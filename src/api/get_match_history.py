@@ -1,12 +1,12 @@
-import streamlit as st
 import requests
 import time
-from src.api.config import RIOT_API_KEY
+from src.api.client import get_client
+from src.api.config import api_base_url
 from src.utils.rate_tracker import update_rate_limit
+from src.utils.rate_limiter import summarize_rate_headers
 
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def get_match_history(region: str, puuid: str, max_matches: int = 300) -> list:
+def get_match_history(region: str, puuid: str, max_matches: int = 300, known_ids: frozenset = None) -> list:
     """
     Fetches up to 'max_matches' Solo Queue match IDs for a given player.
 
@@ -14,13 +14,14 @@ def get_match_history(region: str, puuid: str, max_matches: int = 300) -> list:
         region (str): Riot API region (e.g., "europe").
         puuid (str): Player's unique PUUID.
         max_matches (int): Max number of matches to fetch (up to 100 per call).
+        known_ids (frozenset): Match IDs we already have. Paging stops at the first
+            known ID, so only newer matches are returned (delta sync).
 
     Returns:
         list: A list of match IDs (newest to oldest).
     """
 
-    url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/by-puuid/{puuid}/ids"
-    headers = {"X-Riot-Token": RIOT_API_KEY}
+    url = f"{api_base_url(region)}/lol/match/v5/matches/by-puuid/{puuid}/ids"
 
     all_matches = []
     start = 0
@@ -39,7 +40,7 @@ def get_match_history(region: str, puuid: str, max_matches: int = 300) -> list:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = get_client().get(url, params=params, method='match_history', region=region)
             response.raise_for_status()
             batch = response.json()
 
@@ -47,12 +48,20 @@ def get_match_history(region: str, puuid: str, max_matches: int = 300) -> list:
                 print(" No more matches found.")
                 break
 
+            # Delta sync: history is newest first, so everything after a known ID is known too
+            reached_known = False
+            if known_ids:
+                for i, match_id in enumerate(batch):
+                    if match_id in known_ids:
+                        batch = batch[:i]
+                        reached_known = True
+                        break
+
             all_matches.extend(batch)
             print(f" Retrieved {len(batch)} matches (Total: {len(all_matches)})".encode('ascii', 'ignore').decode())
 
             # Update rate-limit info from headers
-            rate_info["used"] = int(response.headers.get("X-App-Rate-Limit-Count", "0:1").split(":")[0])
-            rate_info["max"] = int(response.headers.get("X-App-Rate-Limit", "20:1").split(":")[0])
+            rate_info = summarize_rate_headers(response.headers)
 
 
             start += len(batch)
@@ -61,6 +70,10 @@ def get_match_history(region: str, puuid: str, max_matches: int = 300) -> list:
             # time.sleep(1.1)
             update_rate_limit('match_history', rate_info['used'], rate_info['max'])
 
+            if reached_known:
+                print(" Reached already stored matches.")
+                break
+
         except requests.exceptions.RequestException as e:
             print(f" Error fetching match history: {e}".encode('ascii', 'ignore').decode())
             break
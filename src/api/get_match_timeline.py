@@ -1,40 +1,72 @@
-import streamlit as st
 import requests
 import time
-from src.api.config import RIOT_API_KEY
+from src.api.client import get_client
+from src.api.config import api_base_url
+from src.api.routing import region_for_match
 from src.utils.rate_tracker import update_rate_limit
+from src.utils.rate_limiter import summarize_rate_headers
+from src.utils.match_cache import get_match_cache
+from src.utils.payload_archive import get_payload_archive
+from src.utils.single_flight import SingleFlight
+from src.utils.json_codec import decode_response
+
+# Coalesces concurrent fetches of the same match ID into one request
+_in_flight = SingleFlight()
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_match_timeline(region: str, match_id: str) -> dict:
     """
     Fetches the detailed timeline for a given match ID.
 
     Args:
-        region (str): Riot API region (e.g., "europe").
+        region (str): Riot API region (e.g., "europe"), used when the match ID's
+            platform prefix is not recognised.
         match_id (str): Unique match ID (e.g., "EUW1_7313131872").
 
     Returns:
         dict: Match timeline data or empty dict if failed.
     """
 
+    # Match payloads are immutable, so a disk cache hit never needs the API
+    cached = get_match_cache().get('timeline', match_id)
+    if cached is not None:
+        return cached, {"used": 0, "max": 20}
+
+    # Older matches evicted from the cache may still be in the payload archive (if enabled)
+    archive = get_payload_archive()
+    archived = archive.get('timeline', match_id) if archive is not None else None
+    if archived is not None:
+        return archived, {"used": 0, "max": 20}
+
+    # The match ID's platform prefix decides the cluster, whatever region the caller passed
+    region = region_for_match(match_id, default=region)
+
+    # Players scouted together share matches; they all wait on the same request
+    return _in_flight.do(match_id, _fetch_match_timeline, region, match_id)
+
+
+def _fetch_match_timeline(region: str, match_id: str):
+    """Fetches a match timeline from the API, caches it on disk (and archives it, if enabled)."""
     # Riot API endpoint for match timeline
-    url = f"https://{region}.api.riotgames.com/lol/match/v5/matches/{match_id}/timeline"
+    url = f"{api_base_url(region)}/lol/match/v5/matches/{match_id}/timeline"
 
-    headers = {
-        "X-Riot-Token": RIOT_API_KEY
-    }
     rate_info = {"used": 0, "max": 20}
 
-
     try:
-        response = requests.get(url, headers=headers)
+        response = get_client().get(url, method='timeline', region=region)
         response.raise_for_status()  # Raise error if request fails
 
-        timeline_data = response.json()  # Full match timeline
+        timeline_data = decode_response(response)  # Full match timeline, decoded from raw bytes
         # Update rate-limit info from headers
-        rate_info["used"] = int(response.headers.get("X-App-Rate-Limit-Count", "0:1").split(":")[0])
-        rate_info["max"] = int(response.headers.get("X-App-Rate-Limit", "20:1").split(":")[0])
+        rate_info = summarize_rate_headers(response.headers)
         update_rate_limit('timeline', rate_info['used'], rate_info['max'])
+        if timeline_data.get("info", {}).get("frames"):
+            get_match_cache().put('timeline', match_id, timeline_data)
+            archive = get_payload_archive()
+            if archive is not None:
+                archive.put('timeline', match_id, timeline_data)
+        else:
+            # Remembered so backfills stop asking for it on every run
+            get_match_cache().mark_empty('timeline', match_id)
         return timeline_data ,rate_info
 
     except requests.exceptions.RequestException as e:
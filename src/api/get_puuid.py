@@ -1,17 +1,18 @@
-import streamlit as st
 import requests
 from src.utils.rate_tracker import update_rate_limit
+from src.utils.rate_limiter import summarize_rate_headers
 
-# Load API Key from a config file (better security)
-from src.api.config import RIOT_API_KEY
+from src.api.client import get_client
+from src.api.config import api_base_url
+from src.api.routing import account_region
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
 def get_puuid(region: str, game_name: str, tag_line: str):
     """
     Fetches the PUUID (Player Unique ID) from Riot API using game name and tagline.
     
     Args:
-        region (str): Riot API region (e.g., "europe").
+        region (str): Riot API region (e.g., "europe"). "sea" is looked up on
+            "asia", since account-v1 has no SEA cluster.
         game_name (str): Player's in-game name (e.g., "Nakla").
         tag_line (str): Player's tagline (e.g., "EUW").
 
@@ -21,13 +22,13 @@ def get_puuid(region: str, game_name: str, tag_line: str):
             - dict: rate-limit info {'used': int, 'max': int} or None
     """
 
-    url = f"https://{region}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
-    headers = {"X-Riot-Token": RIOT_API_KEY}
+    region = account_region(region)
+    url = f"{api_base_url(region)}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
     rate_info = {"used": 0, "max": 20}
 
 
     try:
-        response = requests.get(url, headers=headers)
+        response = get_client().get(url, method='account', region=region)
         response.raise_for_status()
 
         # Extract PUUID
@@ -35,10 +36,7 @@ def get_puuid(region: str, game_name: str, tag_line: str):
         puuid = data["puuid"]
 
         # Extract rate-limit info from headers
-        rate_info = {
-            "used": int(response.headers.get("X-App-Rate-Limit-Count", "0:1").split(":")[0]),
-            "max": int(response.headers.get("X-App-Rate-Limit", "20:1").split(":")[0])
-        }
+        rate_info = summarize_rate_headers(response.headers)
 
         update_rate_limit('account', rate_info['used'], rate_info['max'])
 
@@ -0,0 +1,149 @@
+import hashlib
+import threading
+from src.api.config import RIOT_API_KEYS
+from src.utils.rate_limiter import create_limiter
+
+# Lane used by calls that don't say which region they hit
+GLOBAL_LANE = "global"
+
+# A key is only dropped after 403s on this many different endpoints with no success in
+# between; Riot also answers 403 for a single endpoint or route the key can't use
+FORBIDDEN_ENDPOINTS_TO_DISABLE = 3
+
+
+class ApiKey:
+    """
+    One Riot API key and its own rate-limit state.
+
+    Riot enforces limits per key and per regional cluster, so each region the key
+    is used on gets its own limiter (its "lane").
+    """
+
+    def __init__(self, key: str, limiter_factory=create_limiter):
+        self.key = key
+        # Stable, non-secret id used for ledger namespaces and log lines
+        self.name = hashlib.sha256(key.encode()).hexdigest()[:12]
+        self.limiter_factory = limiter_factory
+        self.limiters = {}
+        self.disabled_reason = None
+        self.forbidden_endpoints = set()   # Endpoints that answered 403 since the last success
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.disabled_reason is None
+
+    def limiter_for(self, region: str = None):
+        """Returns the limiter for this key on `region` (None is a shared global lane)."""
+        lane = region or GLOBAL_LANE
+        limiter = self.limiters.get(lane)
+        if limiter is None:
+            with self._lock:
+                limiter = self.limiters.get(lane)
+                if limiter is None:
+                    limiter = self.limiters[lane] = self.limiter_factory(f"{self.name}:{lane}")
+        return limiter
+
+
+class ApiKeyPool:
+    """
+    Pool of Riot API keys, each with its own budget.
+
+    Requests go to the key with the most remaining budget for that method, so
+    throughput scales with the number of keys. Keys the API rejects (401, or 403
+    on several endpoints) are dropped from rotation for the rest of the process.
+    """
+
+    def __init__(self, keys: list = None, limiter_factory=create_limiter):
+        """
+        Args:
+            keys (list): API keys; defaults to RIOT_API_KEYS from the config.
+            limiter_factory (callable): Builds a limiter for a "<key>:<region>" namespace.
+        """
+        keys = keys if keys is not None else RIOT_API_KEYS
+        if not keys:
+            raise ValueError(" ERROR: No Riot API keys configured! Add RIOT_API_KEY or RIOT_API_KEYS to the .env file.")
+        self._lock = threading.Lock()
+        # Drop duplicates, keep order
+        self.keys = [ApiKey(key, limiter_factory) for key in dict.fromkeys(keys)]
+
+    def active_keys(self) -> list:
+        with self._lock:
+            return [k for k in self.keys if k.active]
+
+    def disable(self, api_key: ApiKey, reason: str):
+        """Takes a key out of rotation (e.g. after a 401/403)."""
+        with self._lock:
+            if api_key.active:
+                api_key.disabled_reason = reason
+                print(f" API key {api_key.name} disabled: {reason}")
+
+    def record_forbidden(self, api_key: ApiKey, endpoint: str) -> bool:
+        """
+        Counts a 403 for `endpoint` against a key and disables the key once
+        FORBIDDEN_ENDPOINTS_TO_DISABLE different endpoints have refused it.
+
+        Returns:
+            bool: True if the key was disabled.
+        """
+        with self._lock:
+            api_key.forbidden_endpoints.add(endpoint)
+            endpoints = sorted(api_key.forbidden_endpoints)
+        if len(endpoints) < FORBIDDEN_ENDPOINTS_TO_DISABLE:
+            return False
+        self.disable(api_key, f"HTTP 403 on {', '.join(endpoints)}")
+        return True
+
+    def record_success(self, api_key: ApiKey):
+        """A key that still gets answers is not revoked: forget its 403s."""
+        if api_key.forbidden_endpoints:
+            with self._lock:
+                api_key.forbidden_endpoints.clear()
+
+    def try_acquire_key(self, method: str, region: str = None):
+        """
+        Takes a permit on `region` from the key with the most remaining budget there.
+
+        Returns:
+            tuple: (0, ApiKey) if a permit was taken, otherwise (seconds until the
+                   soonest key frees up, None).
+        """
+        keys = self.active_keys()
+        if not keys:
+            raise ValueError(" ERROR: Every Riot API key has been rejected by the API.")
+        keys.sort(key=lambda k: k.limiter_for(region).remaining(method), reverse=True)
+        delays = []
+        for api_key in keys:
+            delay = api_key.limiter_for(region).try_acquire(method)
+            if delay <= 0:
+                return 0.0, api_key
+            delays.append(delay)
+        return min(delays), None
+
+    def first_active(self) -> ApiKey:
+        keys = self.active_keys()
+        if not keys:
+            raise ValueError(" ERROR: Every Riot API key has been rejected by the API.")
+        return keys[0]
+
+    def remaining(self, method: str, region: str = None) -> int:
+        """Requests for `method` on `region` that fit right now across every active key."""
+        return sum(k.limiter_for(region).remaining(method) for k in self.active_keys())
+
+    def wait_time(self, method: str, region: str = None) -> float:
+        """Seconds until any active key can send a request for `method` on `region`."""
+        return min((k.limiter_for(region).wait_time(method) for k in self.active_keys()), default=0.0)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_key_pool() -> ApiKeyPool:
+    """Returns the process-wide ApiKeyPool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ApiKeyPool()
+    return _pool
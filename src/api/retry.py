@@ -0,0 +1,106 @@
+import random
+import threading
+import time
+from collections import defaultdict
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class RetryPolicy:
+    """
+    Shared retry policy for every Riot API endpoint.
+
+    429s wait exactly as long as Retry-After says; 5xx and connection errors back
+    off exponentially with full jitter. Every request gives up once max_attempts
+    or the overall deadline is reached, whichever comes first.
+    """
+
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0,
+                 deadline: float = 120.0):
+        """
+        Args:
+            max_attempts (int): Total attempts per request, including the first.
+            base_delay (float): Backoff base in seconds for 5xx/connection errors.
+            max_delay (float): Cap on a single backoff sleep.
+            deadline (float): Max seconds spent on one request across all attempts.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (0-based) retry attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def retry_delay(self, attempt: int, response=None) -> float:
+        """
+        Seconds to wait before retrying.
+
+        Uses Retry-After when the response carries one (429s from Riot always do
+        for application/method limits), otherwise jittered backoff.
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return float(retry_after)
+                except ValueError:
+                    pass
+        return self.backoff_delay(attempt)
+
+    def should_retry(self, attempt: int, started: float, delay: float) -> bool:
+        """True if another attempt fits within max_attempts and the deadline."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return time.monotonic() - started + delay <= self.deadline
+
+
+class RetryStats:
+    """Thread-safe tally of retries per endpoint and reason, for end-of-run reporting."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = defaultdict(lambda: defaultdict(int))
+        self.gave_up = defaultdict(int)
+
+    def record_retry(self, method: str, reason: str):
+        with self._lock:
+            self.counts[method][reason] += 1
+
+    def record_give_up(self, method: str):
+        with self._lock:
+            self.gave_up[method] += 1
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: {method: {'retries': {reason: int}, 'gave_up': int}}
+        """
+        with self._lock:
+            methods = set(self.counts) | set(self.gave_up)
+            return {m: {"retries": dict(self.counts.get(m, {})), "gave_up": self.gave_up.get(m, 0)} for m in methods}
+
+    def reset(self):
+        with self._lock:
+            self.counts.clear()
+            self.gave_up.clear()
+
+
+_retry_stats = RetryStats()
+
+
+def get_retry_stats() -> RetryStats:
+    """Returns the process-wide RetryStats."""
+    return _retry_stats
+
+
+def print_retry_summary():
+    """Prints what was retried during this run (nothing if no retries happened)."""
+    summary = get_retry_stats().summary()
+    if not summary:
+        return
+    print("\n Retry summary:")
+    for method, info in sorted(summary.items()):
+        reasons = ", ".join(f"{reason}: {n}" for reason, n in sorted(info["retries"].items())) or "none"
+        print(f"   {method}: {reasons} (gave up: {info['gave_up']})")
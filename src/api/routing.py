@@ -0,0 +1,55 @@
+# Riot platform -> regional routing value for match-v5
+PLATFORM_REGIONS = {
+    "NA1": "americas", "BR1": "americas", "LA1": "americas", "LA2": "americas",
+    "KR": "asia", "JP1": "asia",
+    "EUW1": "europe", "EUN1": "europe", "TR1": "europe", "RU": "europe", "ME1": "europe",
+    "OC1": "sea", "PH2": "sea", "SG2": "sea", "TH2": "sea", "TW2": "sea", "VN2": "sea",
+}
+
+REGIONS = ["europe", "americas", "asia", "sea"]
+
+# account-v1 is only served by these clusters; any of them can look up any Riot ID
+ACCOUNT_REGIONS = {"americas": "americas", "asia": "asia", "europe": "europe", "sea": "asia"}
+
+
+def account_region(region: str) -> str:
+    """
+    Returns the cluster to send account-v1 calls to for a match-v5 region
+    (e.g. "sea" -> "asia"). Unknown values are passed through unchanged.
+    """
+    return ACCOUNT_REGIONS.get(region, region)
+
+
+def region_for_platform(platform: str, default: str = None) -> str:
+    """
+    Returns the regional cluster serving a platform (e.g. "EUW1" -> "europe").
+
+    Args:
+        platform (str): Platform ID, case-insensitive.
+        default (str): Returned for unknown platforms.
+    """
+    return PLATFORM_REGIONS.get((platform or "").upper(), default)
+
+
+def region_for_match(match_id: str, default: str = None) -> str:
+    """
+    Returns the regional cluster a match lives on, from its platform prefix.
+
+    Example:
+        region_for_match("KR_7012345678") -> "asia"
+    """
+    platform, _, _ = (match_id or "").partition("_")
+    return region_for_platform(platform, default)
+
+
+def group_by_region(match_ids: list, default: str = None) -> dict:
+    """
+    Splits match IDs into one list per regional cluster, keeping their order.
+
+    Returns:
+        dict: {region: [match_id, ...]}
+    """
+    groups = {}
+    for match_id in match_ids:
+        groups.setdefault(region_for_match(match_id, default), []).append(match_id)
+    return groups
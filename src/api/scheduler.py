@@ -0,0 +1,145 @@
+import contextvars
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from src.api.key_pool import get_key_pool
+
+# Priority classes, most urgent first
+INTERACTIVE = 0   # A user is waiting on the result (e.g. "Collect Data" in the app)
+REFRESH = 1       # Routine syncs of players we already track
+BACKFILL = 2      # Bulk historical pulls that can run in the background
+
+PRIORITY_NAMES = {INTERACTIVE: "interactive", REFRESH: "refresh", BACKFILL: "backfill"}
+
+# Priority of API calls made from the current thread/task (see request_priority)
+_current_priority = contextvars.ContextVar("riot_request_priority", default=REFRESH)
+
+
+@contextmanager
+def request_priority(priority: int):
+    """
+    Runs every Riot API call inside the block at the given priority.
+
+    Example:
+        with request_priority(INTERACTIVE):
+            ensure_player_data(region, game_name, tag_line)
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> int:
+    return _current_priority.get()
+
+
+class PriorityScheduler:
+    """
+    Hands out rate-limit permits by priority class.
+
+    Waiting requests are served most urgent first, so interactive lookups jump
+    ahead of a running backfill. Each regional cluster is its own lane with its
+    own queue, so a region that is out of budget never holds up the others, and
+    within a lane a request whose method is blocked (a method 429 or a full
+    method window) is passed over, so it never holds up other methods. To keep
+    backfills from starving, they are guaranteed `backfill_share` of the recent
+    grants whenever they are waiting.
+    """
+
+    def __init__(self, key_pool=None, backfill_share: float = 0.2, history: int = 50):
+        """
+        Args:
+            key_pool (ApiKeyPool): Keys (and their limiters) that permits are drawn from.
+            backfill_share (float): Minimum fraction of recent grants reserved for backfill.
+            history (int): Number of recent grants the share is measured over.
+        """
+        self.key_pool = key_pool or get_key_pool()
+        self.backfill_share = backfill_share
+        self._cond = threading.Condition()
+        self._waiting = {}                       # ticket -> (priority, method, region)
+        self._tickets = itertools.count()
+        self._recent = deque(maxlen=history)     # Priorities of recent grants
+        self.granted = {p: 0 for p in PRIORITY_NAMES}
+
+    def _next_ticket(self, region: str = None):
+        """
+        Picks which waiting ticket in `region`'s lane is served next: the most
+        urgent one whose method can send right now, or the most urgent one if no
+        method can (it then waits for the earliest permit).
+        """
+        lane = {t: (p, m) for t, (p, m, r) in self._waiting.items() if r == region}
+        if not lane:
+            return None
+        order = sorted(lane, key=lambda t: (lane[t][0], t))
+        if self._recent and any(lane[t][0] == BACKFILL for t in order):
+            share = sum(1 for p in self._recent if p == BACKFILL) / len(self._recent)
+            if share < self.backfill_share:
+                order.sort(key=lambda t: lane[t][0] != BACKFILL)
+        ready = {}
+        for ticket in order:
+            method = lane[ticket][1]
+            if method not in ready:
+                ready[method] = self.key_pool.wait_time(method, region) <= 0
+            if ready[method]:
+                return ticket
+        return order[0]
+
+    def acquire(self, method: str, priority: int = None, region: str = None):
+        """
+        Blocks until this request is next in line and some API key has a permit.
+
+        Args:
+            method (str): Rate-limit bucket (e.g. "match").
+            priority (int): Priority class; defaults to the one set by request_priority.
+            region (str): Regional cluster (lane) the request is sent to.
+
+        Returns:
+            tuple: (ApiKey the permit was taken from, seconds spent waiting)
+        """
+        priority = current_priority() if priority is None else priority
+        started = time.monotonic()
+        with self._cond:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = (priority, method, region)
+            try:
+                while True:
+                    if self._next_ticket(region) == ticket:
+                        delay, api_key = self.key_pool.try_acquire_key(method, region)
+                        if api_key is not None:
+                            self._recent.append(priority)
+                            self.granted[priority] += 1
+                            return api_key, time.monotonic() - started
+                    else:
+                        # This method's own budget may free up before the one being served
+                        delay = self.key_pool.wait_time(method, region)
+                    # Wake up when the window frees up, or when notified that the line moved
+                    self._cond.wait(timeout=delay or 1.0)
+            finally:
+                del self._waiting[ticket]
+                self._cond.notify_all()
+
+    def waiting_counts(self) -> dict:
+        """Number of queued requests per priority name (for status pages)."""
+        with self._cond:
+            counts = {name: 0 for name in PRIORITY_NAMES.values()}
+            for priority, _, _ in self._waiting.values():
+                counts[PRIORITY_NAMES[priority]] += 1
+            return counts
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> PriorityScheduler:
+    """Returns the process-wide PriorityScheduler, creating it on first use."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = PriorityScheduler()
+    return _scheduler
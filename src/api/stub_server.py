@@ -0,0 +1,464 @@
+"""
+Local stand-in for the Riot API, for offline throughput and rate-limit testing.
+
+Serves the account, match-ids, match and timeline routes from fixture files when
+available and from deterministic generated payloads otherwise, with Riot-style
+rate-limit headers, optional injected 429s and configurable latency.
+
+Usage:
+    python -m src.api.stub_server --port 8080 --latency-ms 40 --error-rate 0.02
+    RIOT_API_BASE_URL=http://127.0.0.1:8080 python -c "..."   # point src/api at it
+    RIOT_API_BASE_URL=http://127.0.0.1:8080/{region} ...      # separate rate lane per region
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+from src.api.routing import REGIONS
+from src.utils.rate_limiter import parse_rate_header
+
+POSITIONS = ["TOP", "JUNGLE", "MIDDLE", "BOTTOM", "UTILITY"]
+CHAMPIONS = ["Aatrox", "Ahri", "Ashe", "Garen", "LeeSin", "Lux", "Jinx", "Thresh", "Orianna", "Vi",
+             "Sett", "Kaisa", "Nautilus", "Viego", "Syndra", "Ezreal", "Leona", "Graves", "Renekton", "Azir"]
+
+# Method limits per route, modelled on a development key
+METHOD_LIMITS = {
+    "account": "1000:60",
+    "match_history": "2000:10",
+    "match": "2000:10",
+    "timeline": "2000:10",
+}
+
+ROUTES = [
+    ("account", re.compile(r"^/riot/account/v1/accounts/by-riot-id/([^/]+)/([^/]+)$")),
+    ("match_history", re.compile(r"^/lol/match/v5/matches/by-puuid/([^/]+)/ids$")),
+    ("timeline", re.compile(r"^/lol/match/v5/matches/([^/]+)/timeline$")),
+    ("match", re.compile(r"^/lol/match/v5/matches/([^/]+)$")),
+]
+
+
+def _seed(*parts) -> int:
+    return int(hashlib.sha256(":".join(str(p) for p in parts).encode()).hexdigest()[:12], 16)
+
+
+class _Limits:
+    """Server-side sliding windows, tracked per API key like the real API does."""
+
+    def __init__(self, spec: str):
+        self.limits = parse_rate_header(spec)
+        self.logs = defaultdict(lambda: [deque() for _ in self.limits])
+
+    def hit(self, key: str, now: float):
+        """
+        Records a request. Returns (counts_header, retry_after) where retry_after is
+        None if the request is within every window.
+        """
+        logs = self.logs[key]
+        retry_after = None
+        for (limit, seconds), log in zip(self.limits, logs):
+            while log and log[0] <= now - seconds:
+                log.popleft()
+            if len(log) >= limit:
+                wait = log[0] + seconds - now
+                retry_after = max(retry_after or 0, wait)
+        if retry_after is None:
+            for log in logs:
+                log.append(now)
+        counts = ",".join(f"{len(log)}:{seconds}" for (_, seconds), log in zip(self.limits, logs))
+        return counts, retry_after
+
+
+class RiotStubServer:
+    """
+    Threaded HTTP server mimicking the Riot routes the pipeline uses.
+
+    Generated matches are drawn from a fixed pool of players and a shared pool of
+    match numbers, so different players overlap on some matches the way premades
+    and duos do in real data. A match's participants depend only on its ID, so
+    the same match always returns the same payload; account lookups map each
+    Riot ID to one of the pool's players and histories list that player's matches.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, fixtures_dir: str = None,
+                 latency_ms: float = 0.0, error_rate: float = 0.0, app_limits: str = "20:1,100:120",
+                 enforce_limits: bool = True, platform: str = "EUW1", matches_per_player: int = 500,
+                 player_pool_size: int = 100, seed: int = 0):
+        """
+        Args:
+            host (str): Interface to bind.
+            port (int): Port to bind (0 picks a free one).
+            fixtures_dir (str): Optional directory with matches/<id>.json and timelines/<id>.json.
+            latency_ms (float): Mean added latency per request.
+            error_rate (float): Probability of an injected 429 on any request.
+            app_limits (str): X-App-Rate-Limit value to advertise and enforce.
+            enforce_limits (bool): Reply 429 when a client exceeds the advertised limits.
+            platform (str): Platform prefix for generated match IDs.
+            matches_per_player (int): Length of each generated match history.
+            player_pool_size (int): Number of distinct generated players (and Riot IDs
+                that get their own puuid before lookups start sharing one).
+            seed (int): Seed for generated payloads and injected errors.
+        """
+        self.fixtures_dir = fixtures_dir
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.app_limits_spec = app_limits
+        self.enforce_limits = enforce_limits
+        self.platform = platform
+        self.matches_per_player = matches_per_player
+        self.player_pool_size = max(player_pool_size, 10)
+        # Each match seats 10 of the pool: size it so every player has ~20% more
+        # matches than a history needs
+        self.match_pool_size = matches_per_player * self.player_pool_size * 12 // 100
+        self.seed = seed
+
+        self._app_limits = _Limits(app_limits)
+        self._method_limits = {name: _Limits(spec) for name, spec in METHOD_LIMITS.items()}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._histories = None   # puuid -> match numbers, built on the first history request
+        self._players = {}       # Riot ID -> pool index of players looked up so far
+        self.request_counts = defaultdict(int)
+
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Starts serving in a background thread and returns the base URL."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # Generated data
+
+    def player_puuid(self, index: int) -> str:
+        return hashlib.sha256(f"{self.seed}:player:{index}".encode()).hexdigest()[:78]
+
+    def puuid_for(self, game_name: str, tag_line: str) -> str:
+        """
+        The pool player a Riot ID maps to. Chosen from the ID's hash, moving on to
+        the next free player if another Riot ID already has that one.
+        """
+        riot_id = f"{game_name.lower()}#{tag_line.lower()}"
+        with self._lock:
+            if riot_id not in self._players:
+                index = _seed(self.seed, "player", riot_id) % self.player_pool_size
+                taken = set(self._players.values())
+                if len(taken) < self.player_pool_size:
+                    while index in taken:
+                        index = (index + 1) % self.player_pool_size
+                self._players[riot_id] = index
+            return self.player_puuid(self._players[riot_id])
+
+    def history_for(self, puuid: str) -> list:
+        """Match numbers for a player, newest first (empty for a puuid not in the pool)."""
+        with self._lock:
+            if self._histories is None:
+                histories = defaultdict(list)
+                for number in range(self.match_pool_size - 1, -1, -1):
+                    for player in self._participants(self.match_id(number)):
+                        histories[player].append(number)
+                self._histories = {p: numbers[:self.matches_per_player] for p, numbers in histories.items()}
+            return self._histories.get(puuid, [])
+
+    def match_id(self, number: int) -> str:
+        return f"{self.platform}_{7000000000 + number}"
+
+    def _match_number(self, match_id: str):
+        prefix, _, number = match_id.partition("_")
+        return int(number) - 7000000000 if number.isdigit() else None
+
+    def _participants(self, match_id: str) -> list:
+        """Ten puuids from the player pool, picked from the match ID alone."""
+        rng = random.Random(_seed(self.seed, "participants", match_id))
+        return [self.player_puuid(i) for i in rng.sample(range(self.player_pool_size), 10)]
+
+    def generate_match(self, match_id: str) -> dict:
+        rng = random.Random(_seed(self.seed, "match", match_id))
+        duration = rng.randint(20 * 60, 45 * 60)
+        created = 1700000000000 + (self._match_number(match_id) or 0) * 3600 * 1000
+        participants = []
+        winning_team = rng.choice([100, 200])
+        champions = rng.sample(CHAMPIONS, 10)
+        for i, puuid in enumerate(self._participants(match_id)):
+            team_id = 100 if i < 5 else 200
+            position = POSITIONS[i % 5]
+            kills, deaths, assists = rng.randint(0, 15), rng.randint(0, 10), rng.randint(0, 20)
+            participants.append({
+                "participantId": i + 1,
+                "puuid": puuid,
+                "riotIdGameName": f"Player{puuid[:6]}",
+                "riotIdTagline": "STUB",
+                "teamId": team_id,
+                "individualPosition": position,
+                "teamPosition": position,
+                "lane": position,
+                "championName": champions[i],
+                "championId": _seed(champions[i]) % 900,
+                "win": team_id == winning_team,
+                "gameEndedInSurrender": False,
+                "gameEndedInEarlySurrender": False,
+                "kills": kills,
+                "deaths": deaths,
+                "assists": assists,
+                "goldEarned": rng.randint(6000, 18000),
+                "goldSpent": rng.randint(5000, 17000),
+                "totalMinionsKilled": rng.randint(20, 300),
+                "neutralMinionsKilled": rng.randint(0, 200),
+                "visionScore": rng.randint(5, 90),
+                "wardsPlaced": rng.randint(3, 40),
+                "wardsKilled": rng.randint(0, 15),
+                "totalDamageDealtToChampions": rng.randint(5000, 50000),
+                "timePlayed": duration,
+                "champLevel": rng.randint(11, 18),
+                "firstBloodKill": False,
+                "firstTowerKill": False,
+                **{f"item{n}": rng.randint(1000, 7000) for n in range(7)},
+                "challenges": {
+                    "kda": round((kills + assists) / max(1, deaths), 2),
+                    "damagePerMinute": rng.uniform(300, 1200),
+                    "goldPerMinute": rng.uniform(250, 550),
+                    "csPerMinute": rng.uniform(1, 10),
+                    "visionScorePerMinute": rng.uniform(0.2, 3),
+                    "gameLength": duration,
+                    "soloKills": rng.randint(0, 5),
+                    "firstTurretKilled": 0,
+                    "quickFirstTurret": 0,
+                    "hadOpenNexus": 0,
+                },
+            })
+        return {
+            "metadata": {"matchId": match_id, "participants": [p["puuid"] for p in participants]},
+            "info": {
+                "queueId": 420,
+                "gameDuration": duration,
+                "gameCreation": created,
+                "gameStartTimestamp": created,
+                "gameEndTimestamp": created + duration * 1000,
+                "platformId": match_id.partition("_")[0],
+                "participants": participants,
+            },
+        }
+
+    def generate_timeline(self, match_id: str) -> dict:
+        rng = random.Random(_seed(self.seed, "timeline", match_id))
+        match = self.generate_match(match_id)
+        minutes = match["info"]["gameDuration"] // 60
+        state = {pid: {"gold": 500, "xp": 0, "cs": 0, "jcs": 0} for pid in range(1, 11)}
+        frames = []
+        for minute in range(minutes + 1):
+            events = []
+            if minute:
+                for _ in range(rng.randint(5, 25)):
+                    ts = (minute - 1) * 60000 + rng.randint(0, 59999)
+                    pid = rng.randint(1, 10)
+                    kind = rng.random()
+                    if kind < 0.25:
+                        victim = rng.choice([v for v in range(1, 11) if (v > 5) != (pid > 5)])
+                        allies = [a for a in range(1, 11) if a != pid and (a > 5) == (pid > 5)]
+                        events.append({"type": "CHAMPION_KILL", "timestamp": ts, "killerId": pid, "victimId": victim,
+                                       "assistingParticipantIds": rng.sample(allies, rng.randint(0, 2))})
+                    elif kind < 0.55:
+                        events.append({"type": "WARD_PLACED", "timestamp": ts, "creatorId": pid,
+                                       "wardType": rng.choice(["YELLOW_TRINKET", "CONTROL_WARD", "SIGHT_WARD"])})
+                    elif kind < 0.65:
+                        events.append({"type": "WARD_KILL", "timestamp": ts, "killerId": pid, "wardType": "YELLOW_TRINKET"})
+                    elif kind < 0.85:
+                        events.append({"type": "ITEM_PURCHASED", "timestamp": ts, "participantId": pid,
+                                       "itemId": rng.choice([1055, 2003, 2055, 3006, 3031, 6672])})
+                    elif kind < 0.9:
+                        events.append({"type": "TURRET_PLATE_DESTROYED", "timestamp": ts, "killerId": pid})
+                    elif kind < 0.95:
+                        events.append({"type": "ELITE_MONSTER_KILL", "timestamp": ts, "killerId": pid,
+                                       "assistingParticipantIds": [],
+                                       "monsterType": rng.choice(["DRAGON", "RIFTHERALD", "BARON_NASHOR", "VOIDGRUB"])})
+                    else:
+                        events.append({"type": "BUILDING_KILL", "timestamp": ts, "killerId": pid,
+                                       "assistingParticipantIds": [], "buildingType": "TOWER_BUILDING"})
+                if minute == 1:
+                    for pid in range(1, 11):
+                        events.append({"type": "SKILL_LEVEL_UP", "timestamp": 1000 + pid, "participantId": pid,
+                                       "skillSlot": rng.randint(1, 3)})
+                events.sort(key=lambda e: e["timestamp"])
+            if minute == minutes:
+                events.append({"type": "GAME_END", "timestamp": minute * 60000, "winningTeam": 100})
+
+            participant_frames = {}
+            for pid, s in state.items():
+                if minute:
+                    s["gold"] += rng.randint(250, 500)
+                    s["xp"] += rng.randint(200, 600)
+                    s["cs"] += rng.randint(0, 10)
+                    s["jcs"] += rng.randint(0, 2)
+                participant_frames[str(pid)] = {
+                    "participantId": pid,
+                    "totalGold": s["gold"],
+                    "currentGold": s["gold"] % 1500,
+                    "xp": s["xp"],
+                    "level": min(18, 1 + s["xp"] // 1000),
+                    "minionsKilled": s["cs"],
+                    "jungleMinionsKilled": s["jcs"],
+                    "position": {"x": rng.randint(0, 14800), "y": rng.randint(0, 14800)},
+                }
+            frames.append({"timestamp": minute * 60000, "participantFrames": participant_frames, "events": events})
+
+        return {
+            "metadata": {"matchId": match_id, "participants": match["metadata"]["participants"]},
+            "info": {
+                "frameInterval": 60000,
+                "frames": frames,
+                "participants": [{"participantId": p["participantId"], "puuid": p["puuid"]}
+                                 for p in match["info"]["participants"]],
+            },
+        }
+
+    def _fixture(self, kind: str, match_id: str):
+        if not self.fixtures_dir:
+            return None
+        path = os.path.join(self.fixtures_dir, kind, f"{match_id}.json")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        return None
+
+    # Request handling
+
+    def _route(self, path: str, query: dict):
+        """Returns (method_name, status, body_bytes)."""
+        for name, pattern in ROUTES:
+            m = pattern.match(path)
+            if not m:
+                continue
+            if name == "account":
+                game_name, tag_line = unquote(m.group(1)), unquote(m.group(2))
+                body = {"puuid": self.puuid_for(game_name, tag_line), "gameName": game_name, "tagLine": tag_line}
+                return name, 200, json.dumps(body).encode()
+            if name == "match_history":
+                history = self.history_for(m.group(1))
+                start = int(query.get("start", ["0"])[0])
+                count = min(100, int(query.get("count", ["20"])[0]))
+                start_time = query.get("startTime", [None])[0]
+                ids = [self.match_id(n) for n in history]
+                if start_time:
+                    ids = [i for i in ids if 1700000000 + self._match_number(i) * 3600 > int(start_time)]
+                return name, 200, json.dumps(ids[start:start + count]).encode()
+            match_id = m.group(1)
+            if self._match_number(match_id) is None:
+                return name, 404, b'{"status": {"message": "Data not found", "status_code": 404}}'
+            if name == "timeline":
+                body = self._fixture("timelines", match_id) or json.dumps(self.generate_timeline(match_id)).encode()
+            else:
+                body = self._fixture("matches", match_id) or json.dumps(self.generate_match(match_id)).encode()
+            return name, 200, body
+        return None, 404, b'{"status": {"message": "Not found", "status_code": 404}}'
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+            # Headers and body go out in separate writes; with Nagle on, every reused
+            # connection would stall ~40 ms on delayed ACKs and cap a session near 25 req/s
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                if server.latency_ms:
+                    time.sleep(max(0.0, server._random.gauss(server.latency_ms, server.latency_ms / 4)) / 1000)
+
+                parsed = urlparse(self.path)
+                path = parsed.path
+                # An optional /<region> prefix stands in for the regional hosts, each with its own limits
+                region, _, rest = path.lstrip("/").partition("/")
+                if region in REGIONS:
+                    path = "/" + rest
+                else:
+                    region = ""
+                method_name, status, body = server._route(path, parse_qs(parsed.query))
+                api_key = f"{self.headers.get('X-Riot-Token', '')}@{region}"
+                headers = {"Content-Type": "application/json;charset=utf-8"}
+
+                if method_name:
+                    now = time.monotonic()
+                    with server._lock:
+                        server.request_counts[method_name] += 1
+                        app_counts, app_retry = server._app_limits.hit(api_key, now)
+                        method_counts, method_retry = server._method_limits[method_name].hit(api_key, now)
+                        injected = server.error_rate and server._random.random() < server.error_rate
+                    headers.update({
+                        "X-App-Rate-Limit": server.app_limits_spec,
+                        "X-App-Rate-Limit-Count": app_counts,
+                        "X-Method-Rate-Limit": METHOD_LIMITS[method_name],
+                        "X-Method-Rate-Limit-Count": method_counts,
+                    })
+                    if server.enforce_limits and (app_retry is not None or method_retry is not None):
+                        status, body = 429, b'{"status": {"message": "Rate limit exceeded", "status_code": 429}}'
+                        headers["Retry-After"] = str(max(1, int(max(app_retry or 0, method_retry or 0)) + 1))
+                        headers["X-Rate-Limit-Type"] = "application" if app_retry is not None else "method"
+                    elif injected:
+                        status, body = 429, b'{"status": {"message": "Rate limit exceeded", "status_code": 429}}'
+                        headers["Retry-After"] = "1"
+                        headers["X-Rate-Limit-Type"] = "service"
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Riot API stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixtures", default=None, help="Directory with matches/ and timelines/ JSON fixtures")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of an injected 429")
+    parser.add_argument("--app-limits", default="20:1,100:120")
+    parser.add_argument("--no-enforce", action="store_true", help="Advertise limits but never enforce them")
+    parser.add_argument("--platform", default="EUW1")
+    args = parser.parse_args()
+
+    server = RiotStubServer(args.host, args.port, args.fixtures, args.latency_ms, args.error_rate,
+                            args.app_limits, not args.no_enforce, args.platform)
+    print(f" Riot stub server listening on {server.base_url}")
+    print(f" Point the pipeline at it with RIOT_API_BASE_URL={server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
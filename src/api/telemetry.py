@@ -0,0 +1,173 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in milliseconds (the last bucket catches everything above)
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class Histogram:
+    """Fixed-bucket histogram of millisecond durations."""
+
+    def __init__(self, bounds: tuple = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float):
+        self.counts[bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (0 < q <= 1), capped at the max seen."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(float(self.bounds[i]), self.max) if i < len(self.bounds) else self.max
+        return self.max
+
+    def snapshot(self) -> dict:
+        labels = [f"<={b}ms" for b in self.bounds] + [f">{self.bounds[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 1) if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": round(self.max, 1),
+            "buckets": {label: n for label, n in zip(labels, self.counts) if n},
+        }
+
+
+class EndpointStats:
+    """Everything recorded for one endpoint (rate-limit bucket)."""
+
+    def __init__(self):
+        self.calls = 0
+        self.responses = 0
+        self.bytes = 0
+        self.retries = 0
+        self.statuses = defaultdict(int)
+        self.latency = Histogram()
+        self.rate_wait = Histogram()
+
+
+class Telemetry:
+    """
+    Thread-safe per-endpoint HTTP telemetry for a fetch run.
+
+    Every HTTP attempt records its latency, status and response size; every
+    logical call records its retry count and how long it waited on the rate
+    limiter. Processing stages can be timed with `stage()`, so a run summary
+    shows whether time went to network latency, rate limits or processing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = defaultdict(EndpointStats)
+        self.stages = defaultdict(float)
+        self.started = time.time()
+
+    def record_response(self, endpoint: str, status, latency_s: float, size: int = 0):
+        """
+        Records one HTTP attempt.
+
+        Args:
+            endpoint (str): Rate-limit bucket (e.g. "match").
+            status (int | str): HTTP status, or an exception name for connection errors.
+            latency_s (float): Seconds from sending the request to having the body.
+            size (int): Response body size in bytes.
+        """
+        with self._lock:
+            stats = self.endpoints[endpoint]
+            stats.responses += 1
+            stats.bytes += size
+            stats.statuses[str(status)] += 1
+            stats.latency.observe(latency_s * 1000)
+
+    def record_call(self, endpoint: str, retries: int, rate_wait_s: float):
+        """Records one logical call: how often it was retried and how long it waited for permits."""
+        with self._lock:
+            stats = self.endpoints[endpoint]
+            stats.calls += 1
+            stats.retries += retries
+            stats.rate_wait.observe(rate_wait_s * 1000)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Adds the wall time of the block to a named processing stage."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.stages[name] += elapsed
+
+    def summary(self) -> dict:
+        """
+        Returns:
+            dict: {'endpoints': {endpoint: {...}}, 'stages': {name: seconds}, 'elapsed_s': float}
+        """
+        with self._lock:
+            endpoints = {}
+            for name, stats in self.endpoints.items():
+                endpoints[name] = {
+                    "calls": stats.calls,
+                    "responses": stats.responses,
+                    "retries": stats.retries,
+                    "bytes": stats.bytes,
+                    "statuses": dict(stats.statuses),
+                    "latency": stats.latency.snapshot(),
+                    "rate_wait": stats.rate_wait.snapshot(),
+                }
+            return {
+                "endpoints": endpoints,
+                "stages": {name: round(seconds, 3) for name, seconds in self.stages.items()},
+                "elapsed_s": round(time.time() - self.started, 3),
+            }
+
+    def dump_json(self, path: str):
+        """Writes the summary to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+            self.stages.clear()
+            self.started = time.time()
+
+
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """Returns the process-wide Telemetry."""
+    return _telemetry
+
+
+def print_telemetry_summary():
+    """Prints per-endpoint latency, size, status and rate-wait figures (nothing if no requests were made)."""
+    summary = get_telemetry().summary()
+    if not summary["endpoints"]:
+        return
+    print("\n Request telemetry:")
+    for name, info in sorted(summary["endpoints"].items()):
+        latency, wait = info["latency"], info["rate_wait"]
+        statuses = ", ".join(f"{status}: {n}" for status, n in sorted(info["statuses"].items()))
+        print(f"   {name}: {info['calls']} calls, {info['bytes'] / 1e6:.1f} MB, "
+              f"latency p50 {latency['p50_ms']:.0f}ms / p95 {latency['p95_ms']:.0f}ms, "
+              f"rate wait mean {wait['mean_ms']:.0f}ms, retries {info['retries']} ({statuses})")
+    for name, seconds in sorted(summary["stages"].items()):
+        print(f"   stage {name}: {seconds:.1f}s")
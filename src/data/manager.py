@@ -12,13 +12,17 @@ def player_has_data(game_name: str, tag_line: str, max_age_hours: int = 24) -> b
     to update later 
     """
 
-def ensure_player_data(region: str, game_name: str, tag_line: str, max_matches: int = 100):
+def ensure_player_data(region: str, game_name: str, tag_line: str, max_matches: int = 100, recent_timelines: int = 50):
     """
     Smart function: only runs pipeline if needed
+
+    Timelines of the `recent_timelines` newest matches are fetched right away;
+    older ones are backfilled in the background.
     """
     # Check if we need fresh data
     if not player_has_data(game_name, tag_line):
         print(f"🔄 Fetching fresh data for {game_name}#{tag_line}")
-        run_full_pipeline(region, game_name, tag_line, max_matches, save=True)
+        run_full_pipeline(region, game_name, tag_line, max_matches, save=True, incremental=True,
+                          recent_timelines=recent_timelines)
     else:
         print(f"✅ Using existing data for {game_name}#{tag_line}")
\ No newline at end of file
@@ -0,0 +1,33 @@
+# src/database/reader.py
+from .connection import get_db_connection
+
+
+def get_stored_match_ids(puuid: str) -> set:
+    """
+    Returns the IDs of every match already stored for a player.
+
+    Used by incremental syncs to stop paging match history once we reach
+    matches we already have.
+    """
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT match_id FROM match_stats WHERE puuid = %s", (puuid,))
+            return {row[0] for row in cur.fetchall()}
+    finally:
+        conn.close()
+
+
+def get_stored_timeline_match_ids(puuid: str) -> set:
+    """
+    Returns the IDs of every match whose timeline metrics are stored for a player.
+
+    Matches in match_stats but not here still need their timeline fetched.
+    """
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT match_id FROM match_timelines WHERE puuid = %s", (puuid,))
+            return {row[0] for row in cur.fetchall()}
+    finally:
+        conn.close()
@@ -1,5 +1,6 @@
 # src/database/writer.py
 from .connection import get_db_connection
+from src.processing.match_fields import build_match_stats_row
 import json
 
 
@@ -246,41 +247,6 @@ def save_timeline_metrics(metrics_list):
         conn.close()
 
 
-def convert_value_for_db(value, column_name):
-    """Convert values to match the database column types."""
-    if value is None:
-        return None
-    
-    # Boolean columns
-    boolean_columns = [
-        'challenges_firstturretkilled',
-        'challenges_quickfirstturret', 
-        'challenges_hadopennexus',
-        'win',
-        'firstbloodkill',
-        'firstbloodassist',
-        'firsttowerkill',
-        'firsttowerassist',
-        'gameendedinsurrender',
-        'gameendedinearlysurrender'
-    ]
-    
-    if column_name in boolean_columns:
-        # Convert to boolean: 0/1 -> False/True, "true"/"false" -> True/False
-        if isinstance(value, bool):
-            return value
-        elif isinstance(value, int):
-            return bool(value)
-        elif isinstance(value, str):
-            return value.lower() in ['true', '1', 'yes']
-        else:
-            return bool(value)
-    
-    # For other types, let PostgreSQL handle the conversion
-    return value
-
-
-
 def save_match_stats(stats_list):
     """
     Takes a list of match stat dicts (with camelCase keys from API) 
@@ -294,191 +260,14 @@ def save_match_stats(stats_list):
     try:
         with conn.cursor() as cur:
             for stats in stats_list:
-                # Map camelCase API keys to snake_case database columns
-                mapped_data = {
-                    # Identifiers and Metadata
-                    'match_id': stats.get('matchId'),
-                    'puuid': stats.get('puuid'),
-                    'enemychampion': stats.get('enemyChampion'),
-                    'enemypuuid': stats.get('enemyPuuid'),
-                    'enemyindividualposition': stats.get('enemyIndividualPosition'),
-                    'championid': stats.get('championId'),
-                    'championname': stats.get('championName'),
-                    'individualposition': stats.get('individualPosition'),
-                    'lane': stats.get('lane'),
-                    'teamposition': stats.get('teamPosition'),
-                    'side': stats.get('side'),
-                    'teamid': stats.get('teamId'),
-                    
-                    # Match Outcome
-                    'win': stats.get('win'),
-                    'gameendedinsurrender': stats.get('gameEndedInSurrender'),
-                    'gameendedinearlysurrender': stats.get('gameEndedInEarlySurrender'),
-                    
-                    # Core Stats
-                    'kills': stats.get('kills'),
-                    'deaths': stats.get('deaths'),
-                    'assists': stats.get('assists'),
-                    'killingsprees': stats.get('killingSprees'),
-                    'doublekills': stats.get('doubleKills'),
-                    'triplekills': stats.get('tripleKills'),
-                    'quadrakills': stats.get('quadraKills'),
-                    'pentakills': stats.get('pentaKills'),
-                    'firstbloodkill': stats.get('firstBloodKill'),
-                    'firstbloodassist': stats.get('firstBloodAssist'),
-                    
-                    # Damage Stats
-                    'totaldamagedealttochampions': stats.get('totalDamageDealtToChampions'),
-                    'totaldamagedealt': stats.get('totalDamageDealt'),
-                    'damagedealttobuildings': stats.get('damageDealtToBuildings'),
-                    'damagedealttoobjectives': stats.get('damageDealtToObjectives'),
-                    'damagedealttoturrets': stats.get('damageDealtToTurrets'),
-                    'totaldamagetaken': stats.get('totalDamageTaken'),
-                    'damageselfmitigated': stats.get('damageSelfMitigated'),
-                    'magicdamagedealt': stats.get('magicDamageDealt'),
-                    'magicdamagedealttochampions': stats.get('magicDamageDealtToChampions'),
-                    'magicdamagetaken': stats.get('magicDamageTaken'),
-                    'physicaldamagedealt': stats.get('physicalDamageDealt'),
-                    'physicaldamagedealttochampions': stats.get('physicalDamageDealtToChampions'),
-                    'physicaldamagetaken': stats.get('physicalDamageTaken'),
-                    'truedamagedealt': stats.get('trueDamageDealt'),
-                    'truedamagedealttochampions': stats.get('trueDamageDealtToChampions'),
-                    'truedamagetaken': stats.get('trueDamageTaken'),
-                    'totaldamageshieldedonteammates': stats.get('totalDamageShieldedOnTeammates'),
-                    
-                    # Healing and Survival
-                    'totalheal': stats.get('totalHeal'),
-                    'totalhealsonteammates': stats.get('totalHealsOnTeammates'),
-                    'totaltimespentdead': stats.get('totalTimeSpentDead'),
-                    'longesttimespentliving': stats.get('longestTimeSpentLiving'),
-                    
-                    # Challenges
-                    'challenges_kda': stats.get('challenges.kda'),
-                    'challenges_damageperminute': stats.get('challenges.damagePerMinute'),
-                    'challenges_teamdamagepercentage': stats.get('challenges.teamDamagePercentage'),
-                    
-                    # Gold and Economy
-                    'goldearned': stats.get('goldEarned'),
-                    'goldspent': stats.get('goldSpent'),
-                    'bountylevel': stats.get('bountyLevel'),
-                    'challenges_goldperminute': stats.get('challenges.goldPerMinute'),
-                    'challenges_goldshare': stats.get('challenges.goldShare'),
-                    
-                    # Minions and CS
-                    'totalminionskilled': stats.get('totalMinionsKilled'),
-                    'neutralminionskilled': stats.get('neutralMinionsKilled'),
-                    'totalallyjungleminionskilled': stats.get('totalAllyJungleMinionsKilled'),
-                    'totalenemyjungleminionskilled': stats.get('totalEnemyJungleMinionsKilled'),
-                    'challenges_csperminute': stats.get('challenges.csPerMinute'),
-                    'challenges_maxcsadvantageonlaneopponent': stats.get('challenges.maxCsAdvantageOnLaneOpponent'),
-                    'challenges_junglecsbefore10minutes': stats.get('challenges.jungleCsBefore10Minutes'),
-                    
-                    # Vision
-                    'visionscore': stats.get('visionScore'),
-                    'wardsplaced': stats.get('wardsPlaced'),
-                    'wardskilled': stats.get('wardsKilled'),
-                    'visionwardsboughtingame': stats.get('visionWardsBoughtInGame'),
-                    'sightwardsboughtingame': stats.get('sightWardsBoughtInGame'),
-                    'challenges_visionscoreperminute': stats.get('challenges.visionScorePerMinute'),
-                    'challenges_visionscoreadvantagelaneopponent': stats.get('challenges.visionScoreAdvantageLaneOpponent'),
-                    'challenges_wardtakedowns': stats.get('challenges.wardTakedowns'),
-                    'challenges_wardtakedownsbefore20m': stats.get('challenges.wardTakedownsBefore20M'),
-                    'challenges_wardsguarded': stats.get('challenges.wardsGuarded'),
-                    'challenges_stealthwardsplaced': stats.get('challenges.stealthWardsPlaced'),
-                    
-                    # Objectives
-                    'turretkills': stats.get('turretKills'),
-                    'turrettakedowns': stats.get('turretTakedowns'),
-                    'turretslost': stats.get('turretsLost'),
-                    'inhibitorkills': stats.get('inhibitorKills'),
-                    'inhibitortakedowns': stats.get('inhibitorTakedowns'),
-                    'inhibitorslost': stats.get('inhibitorsLost'),
-                    'baronkills': stats.get('baronKills'),
-                    'dragonkills': stats.get('dragonKills'),
-                    'objectivesstolen': stats.get('objectivesStolen'),
-                    'objectivesstolenassists': stats.get('objectivesStolenAssists'),
-                    'firsttowerkill': stats.get('firstTowerKill'),
-                    'firsttowerassist': stats.get('firstTowerAssist'),
-                    'challenges_dragontakedowns': stats.get('challenges.dragonTakedowns'),
-                    'challenges_elderdragonmultikills': stats.get('challenges.elderDragonMultikills'),
-                    'challenges_elderdragonkillswithopposingsoul': stats.get('challenges.elderDragonKillsWithOpposingSoul'),
-                    'challenges_teambaronkills': stats.get('challenges.teamBaronKills'),
-                    'challenges_teamelderdragonkills': stats.get('challenges.teamElderDragonKills'),
-                    'challenges_teamriftheraldkills': stats.get('challenges.teamRiftHeraldKills'),
-                    'challenges_riftheraldtakedowns': stats.get('challenges.riftHeraldTakedowns'),
-                    'challenges_turretplatestaken': stats.get('challenges.turretPlatesTaken'),
-                    'challenges_turretstakenwithriftherald': stats.get('challenges.turretsTakenWithRiftHerald'),
-                    'challenges_firstturretkilled': stats.get('challenges.firstTurretKilled'),
-                    'challenges_firstturretkilledtime': stats.get('challenges.firstTurretKilledTime'),
-                    'challenges_quickfirstturret': stats.get('challenges.quickFirstTurret'),
-                    
-                    # Pings
-                    'onmywaypings': stats.get('onMyWayPings'),
-                    'retreatpings': stats.get('retreatPings'),
-                    'getbackpings': stats.get('getBackPings'),
-                    'dangerpings': stats.get('dangerPings'),
-                    'enemymissingpings': stats.get('enemyMissingPings'),
-                    'enemyvisionpings': stats.get('enemyVisionPings'),
-                    'pushpings': stats.get('pushPings'),
-                    'commandpings': stats.get('commandPings'),
-                    'needvisionpings': stats.get('needVisionPings'),
-                    'visionclearedpings': stats.get('visionClearedPings'),
-                    'holdpings': stats.get('holdPings'),
-                    
-                    # Items
-                    'item0': stats.get('item0'),
-                    'item1': stats.get('item1'),
-                    'item2': stats.get('item2'),
-                    'item3': stats.get('item3'),
-                    'item4': stats.get('item4'),
-                    'item5': stats.get('item5'),
-                    'item6': stats.get('item6'),
-                    'itemspurchased': stats.get('itemsPurchased'),
-                    
-                    # More Challenges
-                    'challenges_dodgeskillshotssmallwindow': stats.get('challenges.dodgeSkillShotsSmallWindow'),
-                    'challenges_skillshotshit': stats.get('challenges.skillshotsHit'),
-                    'challenges_tooklargedamagesurvived': stats.get('challenges.tookLargeDamageSurvived'),
-                    'challenges_pickkillwithally': stats.get('challenges.pickKillWithAlly'),
-                    'challenges_solokills': stats.get('challenges.soloKills'),
-                    'challenges_quicksolokills': stats.get('challenges.quickSoloKills'),
-                    'challenges_unseenrecalls': stats.get('challenges.unseenRecalls'),
-                    'challenges_gamelength': stats.get('challenges.gameLength'),
-                    'challenges_outnumberedkills': stats.get('challenges.outnumberedKills'),
-                    'challenges_earlylaningphasegoldexpadvantage': stats.get('challenges.earlyLaningPhaseGoldExpAdvantage'),
-                    'challenges_effectivehealandshielding': stats.get('challenges.effectiveHealAndShielding'),
-                    'challenges_maxlevelleadlaneopponent': stats.get('challenges.maxLevelLeadLaneOpponent'),
-                    'challenges_takedowns': stats.get('challenges.takedowns'),
-                    'challenges_takedownsaftergainingleveladvantage': stats.get('challenges.takedownsAfterGainingLevelAdvantage'),
-                    'challenges_takedownsbeforejungleminionspawn': stats.get('challenges.takedownsBeforeJungleMinionSpawn'),
-                    'challenges_hadopennexus': stats.get('challenges.hadOpenNexus'),
-                    'challenges_voidmonsterkill': stats.get('challenges.voidMonsterKill'),
-                    
-                    # Experience and Time
-                    'timeplayed': stats.get('timePlayed'),
-                    'champexperience': stats.get('champExperience'),
-                    'champlevel': stats.get('champLevel'),
-                }
-                # Add this right after the mapped_data definition:
-                print(f" DEBUG - Raw side from stats: {stats.get('side')}")
-                print(f" DEBUG - Raw teamId from stats: {stats.get('teamId')}")
-                print(f" DEBUG - Mapped side: {mapped_data.get('side')}")
-                print(f" DEBUG - Mapped teamid: {mapped_data.get('teamid')}")
-                print(f" DEBUG - All keys in stats: {list(stats.keys())}")
-                converted_data = {}
-                for column_name, value in mapped_data.items():
-                    converted_data[column_name] = convert_value_for_db(value, column_name)
-                
-                # Filter out None values to avoid database errors
-                mapped_data = {k: v for k, v in converted_data.items() if v is not None}
-                
+                # camelCase stats -> snake_case match_stats columns, booleans converted,
+                # None values left out to avoid database errors (see MATCH_FIELDS)
+                mapped_data = build_match_stats_row(stats)
+
                 # Create the SQL query dynamically based on available keys
                 columns = ', '.join(mapped_data.keys())
                 placeholders = ', '.join([f'%({key})s' for key in mapped_data.keys()])
-                # Add this right before cur.execute():
-                print(f" DEBUG - About to insert - side: {mapped_data.get('side')}, teamid: {mapped_data.get('teamid')}")
-                print(f" DEBUG - Inserting columns: {columns}")
-                
+
                 cur.execute(f"""
                     INSERT INTO match_stats ({columns})
                     VALUES ({placeholders})
@@ -2,38 +2,106 @@ from src.pipelines.player_pipeline import run_player_pipeline
 from src.pipelines.player_timeline_pipeline import run_player_timeline_pipeline
 from src.utils.fetch_shared_data import fetch_puuid_and_match_ids, fetch_match_and_timeline_data
 from src.database.writer import save_player, save_match  # ADD THESE IMPORTS
+from src.api.retry import print_retry_summary
+from src.api.telemetry import get_telemetry, print_telemetry_summary
+from src.pipelines.timeline_backfill import start_timeline_backfill
+from src.utils.replay_source import ReplaySource
 import traceback
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-def run_full_pipeline(region: str, game_name: str, tag_line: str, max_matches: int = 400, save: bool = True):
+def _replay_puuid_and_match_ids(source, game_name, tag_line, max_matches, incremental):
+    """Offline counterpart of fetch_puuid_and_match_ids, answered from saved payloads."""
+    puuid = source.find_puuid(game_name, tag_line)
+    if puuid is None:
+        raise ValueError(f" ERROR: {game_name}#{tag_line} does not appear in any match in {source.path}")
+    match_ids = source.match_ids_for(puuid, max_matches)
+    if incremental:
+        from src.database.reader import get_stored_match_ids  # Only incremental syncs need the database
+        known_ids = get_stored_match_ids(puuid)
+        match_ids = [m for m in match_ids if m not in known_ids]
+    print(f" Replaying {len(match_ids)} stored matches from {source.path}")
+    return puuid, match_ids
+
+
+def run_full_pipeline(region: str, game_name: str, tag_line: str, max_matches: int = 400, save: bool = True, workers: int = 1,
+                      incremental: bool = False, recent_timelines: int = None, replay_from: str = None,
+                      processes: int = None):
+    """
+    Fetches, processes and stores a player's matches and timelines.
+
+    Args:
+        recent_timelines (int): Fetch timelines up front only for this many most recent
+            matches; the rest are fetched by a background backfill (when saving).
+            None fetches every timeline up front.
+        replay_from (str): Read matches and timelines from a payload archive or a
+            matches/ + timelines/ JSON folder instead of the API. No network and no
+            API key needed; use it to reprocess history or rebuild the database.
+        processes (int): Process matches and timelines on this many cores (-1 for all);
+            worth it when payloads are local and processing is the bottleneck.
+
+    Returns:
+        threading.Thread: The background thread fetching every stored match's missing
+            timeline (deferred ones included), or None if none was started.
+    """
     print(f" Starting full pipeline for {game_name}#{tag_line} ({max_matches} matches)")
     
     # Fetch PUUID and match IDs
-    puuid, match_ids = fetch_puuid_and_match_ids(region, game_name, tag_line, max_matches)
+    source = ReplaySource(replay_from) if replay_from else None
+    if source is not None:
+        puuid, match_ids = _replay_puuid_and_match_ids(source, game_name, tag_line, max_matches, incremental)
+        recent_timelines = None  # Everything is local, nothing worth deferring
+    else:
+        puuid, match_ids = fetch_puuid_and_match_ids(region, game_name, tag_line, max_matches, incremental=incremental)
     
     if save:
         # FIRST: Save player to players table (ONLY ONCE)
         save_player(puuid, game_name, tag_line, region)
         print(f"  Saved player {game_name}_{tag_line} to database")
 
+    if incremental and not match_ids:
+        print("\n  No new matches since last sync.")
+        if save and source is None:
+            # Timelines an earlier backfill never got to are not listed again by incremental syncs
+            return start_timeline_backfill(region, puuid, workers=workers)
+        return
+
+    telemetry = get_telemetry()
+
+    # Timelines cost a request each and are the biggest payloads: only the recent ones block the dashboard
+    timeline_ids = match_ids if recent_timelines is None else match_ids[:recent_timelines]
+    deferred_ids = match_ids[len(timeline_ids):]
+
     try:
         # Fetch match data for BOTH pipelines
-        print("\n Fetching match and timeline data...")
-        match_datas, timeline_datas = fetch_match_and_timeline_data(
-            region, match_ids, include_details=True, include_timeline=True
-        )
+        if source is not None:
+            with telemetry.stage("load"):
+                match_datas, timeline_datas = source.load(timeline_ids)
+        else:
+            print("\n Fetching match and timeline data...")
+            with telemetry.stage("fetch"):
+                match_datas, timeline_datas = fetch_match_and_timeline_data(
+                    region, timeline_ids, include_details=True, include_timeline=True, workers=workers
+                )
+                if deferred_ids:
+                    older_match_datas, _ = fetch_match_and_timeline_data(
+                        region, deferred_ids, include_details=True, include_timeline=False, workers=workers
+                    )
+                    match_datas += older_match_datas
         
         if save:
             # SECOND: Save all matches to matches table (ONLY ONCE)
-            for match_data, rate_info in match_datas:
-                save_match(match_data,puuid)
+            with telemetry.stage("save_matches"):
+                for match_data, rate_info in match_datas:
+                    save_match(match_data,puuid)
             print(f"  Saved {len(match_datas)} matches to database")
 
         print("\n Running match-level pipeline...")
         # Extract just the data for processing
         match_data_list = [data for data, rate_info in match_datas]
-        match_df = run_player_pipeline(puuid, match_data_list, region, game_name, tag_line, max_matches=max_matches, save=save)
+        with telemetry.stage("process_matches"):
+            match_df = run_player_pipeline(puuid, match_data_list, region, game_name, tag_line, max_matches=max_matches, save=save,
+                                           processes=processes)
         print(f" Match-level data collected: {len(match_df)} matches")
 
     except Exception as e:
@@ -45,9 +113,11 @@ def run_full_pipeline(region: str, game_name: str, tag_line: str, max_matches: i
         print("\n Running timeline-level pipeline...")
         # Extract just the timeline data for processing  
         timeline_data_list = [data for data, rate_info in timeline_datas]
-        timeline_df, pos_df, ward_df = run_player_timeline_pipeline(
-            puuid, timeline_data_list, region, game_name, tag_line, max_matches=max_matches, save=save
-        )
+        with telemetry.stage("process_timelines"):
+            timeline_df, pos_df, ward_df = run_player_timeline_pipeline(
+                puuid, timeline_data_list, region, game_name, tag_line, max_matches=max_matches, save=save,
+                processes=processes
+            )
         print(f" Timeline data collected: {len(timeline_df)} matches")
 
     except Exception as e:
@@ -55,8 +125,45 @@ def run_full_pipeline(region: str, game_name: str, tag_line: str, max_matches: i
         traceback.print_exc()
         return
 
+    backfill = None
+    if save and source is None:
+        # Deferred timelines, plus any stored match an earlier backfill left without one
+        backfill = start_timeline_backfill(region, puuid, workers=workers)
+    elif deferred_ids:
+        print(f" Skipped {len(deferred_ids)} older timelines (not saving, so nothing to backfill)")
+
+    print_retry_summary()
+    print_telemetry_summary()
     print("\n  All pipelines completed successfully.")
+    return backfill
 
 
+if __name__ == "__main__":
+    # Headless entry point for cron jobs and batch workers (no Streamlit needed)
+    import argparse
+    from src.api.routing import REGIONS
 
+    parser = argparse.ArgumentParser(description="Fetch, process and store a player's SoloQ matches")
+    parser.add_argument("game_name")
+    parser.add_argument("tag_line")
+    parser.add_argument("--region", default="europe", choices=REGIONS)
+    parser.add_argument("--max-matches", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--recent-timelines", type=int, default=None,
+                        help="Fetch only this many timelines up front, backfill the rest")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--telemetry-out", default=None, help="Write request telemetry to this JSON file")
+    parser.add_argument("--replay", default=None, metavar="PATH",
+                        help="Reprocess saved payloads (archive or matches/ + timelines/ folder) without the API")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="Process payloads on this many cores (-1 for all)")
+    args = parser.parse_args()
 
+    run_full_pipeline(args.region, args.game_name, args.tag_line, args.max_matches,
+                      save=not args.no_save, workers=args.workers, incremental=args.incremental,
+                      recent_timelines=args.recent_timelines, replay_from=args.replay,
+                      processes=args.processes)
+    if args.telemetry_out:
+        get_telemetry().dump_json(args.telemetry_out)
+        print(f" Telemetry written to {args.telemetry_out}")
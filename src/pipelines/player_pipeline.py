@@ -4,9 +4,9 @@ import pandas as pd
 import os
 from src.database.writer import save_match_stats
 
-def run_player_pipeline(puuid, match_data_list, region, game_name, tag_line, max_matches=1000, save=True):
+def run_player_pipeline(puuid, match_data_list, region, game_name, tag_line, max_matches=1000, save=True, processes=None):
     # Process the data (unchanged)
-    player_stats = process_multiple_matches(match_data_list, puuid)
+    player_stats = process_multiple_matches(match_data_list, puuid, processes=processes)
     
     if save:
         # ONLY save to match_stats - matches and players are already saved
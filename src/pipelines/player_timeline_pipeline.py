@@ -4,9 +4,9 @@ import pandas as pd
 import os
 from src.database.writer import save_timeline_metrics  # Import the new database writer
 
-def run_player_timeline_pipeline(puuid, timeline_data_list, region, game_name, tag_line, max_matches=1000, save=True):
+def run_player_timeline_pipeline(puuid, timeline_data_list, region, game_name, tag_line, max_matches=1000, save=True, processes=None):
     # Process the data (unchanged)
-    metrics_list, positions_list, wards_list = process_multiple_timelines(timeline_data_list, puuid)
+    metrics_list, positions_list, wards_list = process_multiple_timelines(timeline_data_list, puuid, processes=processes)
 
     if save:
         # ONLY save timeline data - matches and players are already saved
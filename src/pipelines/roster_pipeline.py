@@ -0,0 +1,163 @@
+from src.pipelines.player_pipeline import run_player_pipeline
+from src.pipelines.player_timeline_pipeline import run_player_timeline_pipeline
+from src.pipelines.timeline_backfill import start_timeline_backfill
+from src.utils.fetch_shared_data import fetch_puuid_and_match_ids, fetch_match_and_timeline_data
+from src.database.writer import save_player, save_match
+from src.api.retry import print_retry_summary
+from src.api.telemetry import get_telemetry, print_telemetry_summary
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import traceback
+
+
+def parse_riot_id(riot_id):
+    """
+    Splits a Riot ID into (game_name, tag_line).
+
+    Accepts "Name#TAG" strings or (game_name, tag_line) tuples.
+    """
+    if isinstance(riot_id, (tuple, list)):
+        return riot_id[0], riot_id[1]
+    game_name, sep, tag_line = riot_id.rpartition("#")
+    if not sep or not game_name or not tag_line:
+        raise ValueError(f" ERROR: Invalid Riot ID '{riot_id}', expected Name#TAG")
+    return game_name, tag_line
+
+
+def _resolve_players(region, players, max_matches, incremental, workers):
+    """Looks up every player's PUUID and match IDs concurrently."""
+    with ThreadPoolExecutor(max_workers=max(1, min(len(players), workers))) as executor:
+        futures = [executor.submit(contextvars.copy_context().run, fetch_puuid_and_match_ids,
+                                   region, game_name, tag_line, max_matches, incremental)
+                   for game_name, tag_line in players]
+        return [future.result() for future in futures]
+
+
+def run_roster_pipeline(region: str, riot_ids: list, max_matches: int = 100, save: bool = True, workers: int = 4,
+                        incremental: bool = False, recent_timelines: int = None):
+    """
+    Fetches, processes and stores the matches of a whole roster at once.
+
+    Teammates share most of their games, so match IDs are merged across players
+    and every unique match is fetched once, then handed to each player it
+    belongs to. A five-player scout costs unique matches, not players x matches.
+
+    Args:
+        region (str): Riot API region (e.g., "europe").
+        riot_ids (list): "Name#TAG" strings or (game_name, tag_line) tuples.
+        max_matches (int): Match history depth per player.
+        save (bool): Store players, matches and per-player stats in the database.
+        workers (int): Concurrency for PUUID lookups and match fetching.
+        incremental (bool): Only fetch matches newer than each player's stored ones.
+        recent_timelines (int): Per player, fetch only this many recent timelines up
+            front and backfill the rest (see run_full_pipeline).
+
+    Returns:
+        dict: {'players': {"Name#TAG": puuid}, 'unique_matches': int, 'player_matches': int}
+    """
+    players = [parse_riot_id(r) for r in riot_ids]
+    players = list(dict.fromkeys(players))  # Same player listed twice
+    print(f" Starting roster pipeline for {len(players)} players ({max_matches} matches each)")
+    telemetry = get_telemetry()
+
+    resolved = _resolve_players(region, players, max_matches, incremental, workers)
+    roster = [(game_name, tag_line, puuid, match_ids)
+              for (game_name, tag_line), (puuid, match_ids) in zip(players, resolved)]
+
+    if save:
+        for game_name, tag_line, puuid, _ in roster:
+            save_player(puuid, game_name, tag_line, region)
+        print(f"  Saved {len(roster)} players to database")
+
+    # Newest first per player; the first player listing a match "owns" its matches row
+    owners = {}
+    for _, _, puuid, match_ids in roster:
+        for match_id in match_ids:
+            owners.setdefault(match_id, puuid)
+    player_matches = sum(len(match_ids) for _, _, _, match_ids in roster)
+    print(f" {player_matches} player-matches -> {len(owners)} unique matches")
+
+    summary = {"players": {f"{g}#{t}": puuid for g, t, puuid, _ in roster},
+               "unique_matches": len(owners), "player_matches": player_matches}
+    if not owners:
+        print("\n  No new matches for this roster.")
+        return summary
+
+    # Timelines up front only for each player's recent subset
+    if recent_timelines is None:
+        timeline_ids = set(owners)
+    else:
+        timeline_ids = {m for _, _, _, match_ids in roster for m in match_ids[:recent_timelines]}
+    ordered_timeline_ids = [m for m in owners if m in timeline_ids]
+    detail_only_ids = [m for m in owners if m not in timeline_ids]
+
+    try:
+        print("\n Fetching unique match and timeline data...")
+        with telemetry.stage("fetch"):
+            match_datas, timeline_datas = fetch_match_and_timeline_data(
+                region, ordered_timeline_ids, include_details=True, include_timeline=True, workers=workers
+            )
+            if detail_only_ids:
+                older_match_datas, _ = fetch_match_and_timeline_data(
+                    region, detail_only_ids, include_details=True, include_timeline=False, workers=workers
+                )
+                match_datas += older_match_datas
+
+        matches_by_id = {data["metadata"]["matchId"]: data for data, rate_info in match_datas}
+        timelines_by_id = {data["metadata"]["matchId"]: data for data, rate_info in timeline_datas}
+
+        if save:
+            with telemetry.stage("save_matches"):
+                for match_id, match_data in matches_by_id.items():
+                    save_match(match_data, owners[match_id])
+            print(f"  Saved {len(matches_by_id)} matches to database")
+    except Exception as e:
+        print(f" Failed during roster fetch: {e}")
+        traceback.print_exc()
+        return summary
+
+    # Fan the shared payloads out to every player's own processing
+    for game_name, tag_line, puuid, match_ids in roster:
+        print(f"\n Processing {game_name}#{tag_line}...")
+        try:
+            with telemetry.stage("process_matches"):
+                player_match_data = [matches_by_id[m] for m in match_ids if m in matches_by_id]
+                run_player_pipeline(puuid, player_match_data, region, game_name, tag_line,
+                                    max_matches=max_matches, save=save)
+            with telemetry.stage("process_timelines"):
+                player_timeline_data = [timelines_by_id[m] for m in match_ids if m in timelines_by_id]
+                run_player_timeline_pipeline(puuid, player_timeline_data, region, game_name, tag_line,
+                                             max_matches=max_matches, save=save)
+        except Exception as e:
+            print(f" Failed processing {game_name}#{tag_line}: {e}")
+            traceback.print_exc()
+            continue
+
+        if save:
+            # Deferred and previously missed timelines; shared matches come from the match cache,
+            # so backfills don't refetch each other's timelines
+            start_timeline_backfill(region, puuid, workers=workers)
+
+    print_retry_summary()
+    print_telemetry_summary()
+    print("\n  Roster pipeline completed.")
+    return summary
+
+
+if __name__ == "__main__":
+    # Headless entry point for scouting a whole team
+    import argparse
+    from src.api.routing import REGIONS
+
+    parser = argparse.ArgumentParser(description="Fetch, process and store the SoloQ matches of a roster")
+    parser.add_argument("riot_ids", nargs="+", help='Riot IDs as "Name#TAG"')
+    parser.add_argument("--region", default="europe", choices=REGIONS)
+    parser.add_argument("--max-matches", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--recent-timelines", type=int, default=None)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    run_roster_pipeline(args.region, args.riot_ids, args.max_matches, save=not args.no_save, workers=args.workers,
+                        incremental=args.incremental, recent_timelines=args.recent_timelines)
@@ -0,0 +1,124 @@
+from src.pipelines.player_timeline_pipeline import run_player_timeline_pipeline
+from src.utils.fetch_shared_data import fetch_match_and_timeline_data
+from src.api.scheduler import request_priority, BACKFILL
+from src.utils.match_cache import get_match_cache
+import threading
+import traceback
+
+# Running backfills, one per player (puuid -> Thread)
+_backfills = {}
+_backfills_lock = threading.Lock()
+
+
+def fetch_timelines(region, puuid, match_ids, save=True, workers=1):
+    """
+    Fetches and processes the timelines of the given matches only.
+
+    Args:
+        region (str): Riot API region (e.g., "europe").
+        puuid (str): Player the timeline metrics are extracted for.
+        match_ids (list): Matches whose timelines are needed.
+        save (bool): Store the metrics in match_timelines.
+        workers (int): Max timelines fetched concurrently.
+
+    Returns:
+        list: Per-match timeline metrics.
+    """
+    if not match_ids:
+        return []
+    _, timeline_datas = fetch_match_and_timeline_data(
+        region, match_ids, include_details=False, include_timeline=True, workers=workers
+    )
+    timeline_data_list = [data for data, rate_info in timeline_datas]
+    metrics_list, _, _ = run_player_timeline_pipeline(puuid, timeline_data_list, region, None, None, save=save)
+    return metrics_list
+
+
+def ensure_timelines(region, puuid, match_ids=None, limit=None, workers=1):
+    """
+    Fetches the timelines a page or analysis needs that are not stored yet.
+
+    Call this before reading match_timelines, ideally inside
+    request_priority(INTERACTIVE) when a user is waiting on it. Matches whose
+    timeline recently came back empty (see MatchCache.known_empty) are skipped.
+
+    Args:
+        region (str): Riot API region (e.g., "europe").
+        puuid (str): Player whose timelines are needed.
+        match_ids (list): Matches needed; defaults to every stored match of the player.
+        limit (int): Only the `limit` most recent missing matches.
+        workers (int): Max timelines fetched concurrently.
+
+    Returns:
+        list: Match IDs whose timelines were fetched.
+    """
+    from src.database.reader import get_stored_match_ids, get_stored_timeline_match_ids
+
+    wanted = match_ids if match_ids is not None else get_stored_match_ids(puuid)
+    stored = get_stored_timeline_match_ids(puuid)
+    empty = get_match_cache().known_empty('timeline')
+    # Match numbers grow over time within a platform, so this is newest first
+    missing = sorted((m for m in wanted if m not in stored and m not in empty), key=_match_number, reverse=True)
+    if limit is not None:
+        missing = missing[:limit]
+    if missing:
+        print(f" Fetching {len(missing)} missing timelines for {puuid[:8]}...")
+        fetch_timelines(region, puuid, missing, save=True, workers=workers)
+    return missing
+
+
+def start_timeline_backfill(region, puuid, match_ids=None, workers=1):
+    """
+    Fetches deferred timelines in a background thread at BACKFILL priority.
+
+    Interactive requests keep jumping ahead of it in the scheduler, so the
+    backfill only uses budget nobody is waiting on. A player with a backfill
+    already running gets no second one.
+
+    With match_ids=None it covers every stored match of the player that still
+    has no timeline (see ensure_timelines), which also picks up timelines an
+    earlier backfill never got to (process exit, Streamlit restart, errors):
+    incremental syncs treat those matches as known and would never list them again.
+
+    Returns:
+        threading.Thread: The backfill thread, or None if nothing was started.
+    """
+    if match_ids is not None and not match_ids:
+        return None
+    with _backfills_lock:
+        running = _backfills.get(puuid)
+        if running is not None and running.is_alive():
+            print(f" Timeline backfill already running for {puuid[:8]}")
+            return None
+        match_ids = list(match_ids) if match_ids is not None else None
+        thread = threading.Thread(target=_run_backfill, args=(region, puuid, match_ids, workers),
+                                  name=f"timeline-backfill-{puuid[:8]}")
+        _backfills[puuid] = thread
+    if match_ids is None:
+        print(" Checking stored matches for missing timelines in the background")
+    else:
+        print(f" Deferred {len(match_ids)} timelines to a background backfill")
+    thread.start()
+    return thread
+
+
+def backfill_running(puuid) -> bool:
+    """True while a timeline backfill for this player is still going."""
+    with _backfills_lock:
+        thread = _backfills.get(puuid)
+        return thread is not None and thread.is_alive()
+
+
+def _run_backfill(region, puuid, match_ids, workers):
+    try:
+        with request_priority(BACKFILL):
+            fetched = ensure_timelines(region, puuid, match_ids, workers=workers)
+        print(f" Timeline backfill done: {len(fetched)} timelines fetched")
+    except Exception as e:
+        print(f" Timeline backfill failed: {e}")
+        traceback.print_exc()
+
+
+def _match_number(match_id):
+    _, _, number = match_id.partition("_")
+    return int(number) if number.isdigit() else 0
@@ -0,0 +1,243 @@
+from collections import namedtuple
+
+# Where a field's value comes from
+COMPUTED = "computed"         # Derived per match (IDs, lane opponent, side), passed in by the caller
+PARTICIPANT = "participant"   # A key of the participant object
+CHALLENGE = "challenge"       # A key of participant["challenges"]
+
+# One match_stats field: where it is read from, its flat output name, its
+# match_stats column, whether it is a boolean column (the only type the row
+# builder converts; PostgreSQL casts the rest) and the value used when the
+# source lacks it
+MatchField = namedtuple("MatchField", "source key output column boolean default")
+
+
+def _field(key, boolean=False, default=None, source=PARTICIPANT, column=None):
+    output = f"challenges.{key}" if source == CHALLENGE else key
+    column = column or output.lower().replace(".", "_")
+    return MatchField(source, key, output, column, boolean, default)
+
+
+def _challenge(key, boolean=False):
+    return _field(key, boolean, default=0, source=CHALLENGE)
+
+
+def _computed(key, column=None):
+    return _field(key, source=COMPUTED, column=column)
+
+
+# Every per-player match stat, in output order. process_match_data extracts
+# these and save_match_stats stores them, so adding a field here does both.
+MATCH_FIELDS = (
+    _computed("matchId", column="match_id"),
+    _computed("puuid"),
+
+    #  Enemy laner information
+    _computed("enemyChampion"),
+    _computed("enemyPuuid"),
+    _computed("enemyIndividualPosition"),
+
+    # 1. Identity & Context
+    _field("championId"),
+    _field("championName"),
+    _field("individualPosition"),
+    _field("lane"),
+    _field("teamPosition"),
+    _field("teamId"),
+
+    # 2. Outcome
+    _computed("side"),
+    _field("win", boolean=True),
+    _field("gameEndedInSurrender", boolean=True),
+    _field("gameEndedInEarlySurrender", boolean=True),
+
+    # 3. Combat Performance
+    _field("kills"),
+    _field("deaths"),
+    _field("assists"),
+    _field("killingSprees"),
+    _field("doubleKills"),
+    _field("tripleKills"),
+    _field("quadraKills"),
+    _field("pentaKills"),
+    _field("firstBloodKill", boolean=True),
+    _field("firstBloodAssist", boolean=True),
+    _field("totalDamageDealtToChampions"),
+    _field("totalDamageDealt"),
+    _field("damageDealtToBuildings"),
+    _field("damageDealtToObjectives"),
+    _field("damageDealtToTurrets"),
+    _field("totalDamageTaken"),
+    _field("damageSelfMitigated"),
+    _field("magicDamageDealt"),
+    _field("magicDamageDealtToChampions"),
+    _field("magicDamageTaken"),
+    _field("physicalDamageDealt"),
+    _field("physicalDamageDealtToChampions"),
+    _field("physicalDamageTaken"),
+    _field("trueDamageDealt"),
+    _field("trueDamageDealtToChampions"),
+    _field("trueDamageTaken"),
+    _field("totalDamageShieldedOnTeammates"),
+    _field("totalHeal"),
+    _field("totalHealsOnTeammates"),
+    _field("totalTimeSpentDead"),
+    _field("longestTimeSpentLiving"),
+    _challenge("kda"),
+    _challenge("damagePerMinute"),
+    _challenge("teamDamagePercentage"),
+
+    # 4. Gold & Economy
+    _field("goldEarned"),
+    _field("goldSpent"),
+    _field("bountyLevel"),
+    _challenge("goldPerMinute"),
+    _challenge("goldShare"),
+
+    # 5. Farming
+    _field("totalMinionsKilled"),
+    _field("neutralMinionsKilled"),
+    _field("totalAllyJungleMinionsKilled"),
+    _field("totalEnemyJungleMinionsKilled"),
+    _challenge("csPerMinute"),
+    _challenge("maxCsAdvantageOnLaneOpponent"),
+    _challenge("jungleCsBefore10Minutes"),
+
+    # 6. Vision
+    _field("visionScore"),
+    _field("wardsPlaced"),
+    _field("wardsKilled"),
+    _field("visionWardsBoughtInGame"),
+    _field("sightWardsBoughtInGame"),
+    _challenge("visionScorePerMinute"),
+    _challenge("visionScoreAdvantageLaneOpponent"),
+    _challenge("wardTakedowns"),
+    _challenge("wardTakedownsBefore20M"),
+    _challenge("wardsGuarded"),
+    _challenge("stealthWardsPlaced"),
+
+    # 7. Objectives
+    _field("turretKills"),
+    _field("turretTakedowns"),
+    _field("turretsLost"),
+    _field("inhibitorKills"),
+    _field("inhibitorTakedowns"),
+    _field("inhibitorsLost"),
+    _field("baronKills"),
+    _field("dragonKills"),
+    _field("objectivesStolen"),
+    _field("objectivesStolenAssists"),
+    _field("firstTowerKill", boolean=True),
+    _field("firstTowerAssist", boolean=True),
+    _challenge("dragonTakedowns"),
+    _challenge("elderDragonMultikills"),
+    _challenge("elderDragonKillsWithOpposingSoul"),
+    _challenge("teamBaronKills"),
+    _challenge("teamElderDragonKills"),
+    _challenge("teamRiftHeraldKills"),
+    _challenge("riftHeraldTakedowns"),
+    _challenge("turretPlatesTaken"),
+    _challenge("turretsTakenWithRiftHerald"),
+    _challenge("firstTurretKilled", boolean=True),
+    _challenge("firstTurretKilledTime"),
+    _challenge("quickFirstTurret", boolean=True),
+
+    # 8. Pings
+    _field("onMyWayPings"),
+    _field("retreatPings"),
+    _field("getBackPings"),
+    _field("dangerPings"),
+    _field("enemyMissingPings"),
+    _field("enemyVisionPings"),
+    _field("pushPings"),
+    _field("commandPings"),
+    _field("needVisionPings"),
+    _field("visionClearedPings"),
+    _field("holdPings"),
+
+    # 9. Items
+    *(_field(f"item{i}", default=0) for i in range(7)),
+    _field("itemsPurchased", default=0),
+
+    # 10. Misc / Utility
+    _challenge("dodgeSkillShotsSmallWindow"),
+    _challenge("skillshotsHit"),
+    _challenge("tookLargeDamageSurvived"),
+    _challenge("pickKillWithAlly"),
+    _challenge("soloKills"),
+    _challenge("quickSoloKills"),
+    _challenge("unseenRecalls"),
+    _challenge("gameLength"),
+    _challenge("outnumberedKills"),
+    _challenge("earlyLaningPhaseGoldExpAdvantage"),
+    _challenge("effectiveHealAndShielding"),
+    _challenge("maxLevelLeadLaneOpponent"),
+    _challenge("takedowns"),
+    _challenge("takedownsAfterGainingLevelAdvantage"),
+    _challenge("takedownsBeforeJungleMinionSpawn"),
+    _challenge("hadOpenNexus", boolean=True),
+    _challenge("voidMonsterKill"),
+    _field("timePlayed"),
+    _field("champExperience"),
+    _field("champLevel"),
+)
+
+# Compiled once: flat (output, source, key, default) steps for the extractor
+_EXTRACT_PLAN = tuple((f.output, f.source, f.key, f.default) for f in MATCH_FIELDS)
+
+
+def extract_match_fields(participant: dict, computed: dict) -> dict:
+    """
+    Flat stats of one participant following MATCH_FIELDS.
+
+    Args:
+        participant (dict): A participant object from the match payload.
+        computed (dict): Values of the COMPUTED fields (matchId, puuid, enemy..., side).
+
+    Returns:
+        dict: {output name: value} in MATCH_FIELDS order.
+    """
+    challenges = participant.get("challenges", {})
+    challenges_ok = isinstance(challenges, dict)
+    data = {}
+    for output, source, key, default in _EXTRACT_PLAN:
+        if source == PARTICIPANT:
+            data[output] = participant.get(key, default)
+        elif source == CHALLENGE:
+            if not challenges_ok:
+                data[output] = challenges
+            else:
+                value = challenges.get(key, default)
+                data[output] = value if not isinstance(value, dict) else (value or default)
+        else:
+            data[output] = computed.get(output)
+    return data
+
+
+def to_db_bool(value):
+    """0/1 -> False/True, "true"/"false" -> True/False."""
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, int):
+        return bool(value)
+    elif isinstance(value, str):
+        return value.lower() in ['true', '1', 'yes']
+    else:
+        return bool(value)
+
+
+# Compiled once: (column, output, converter) steps for the row builder
+_ROW_PLAN = tuple((f.column, f.output, to_db_bool if f.boolean else None) for f in MATCH_FIELDS)
+
+
+def build_match_stats_row(stats: dict) -> dict:
+    """
+    Maps one process_match_data dict to match_stats columns, with booleans
+    converted and missing (None) values left out so column defaults apply.
+    """
+    row = {}
+    for column, output, convert in _ROW_PLAN:
+        value = stats.get(output)
+        if value is not None:
+            row[column] = convert(value) if convert else value
+    return row
@@ -0,0 +1,41 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+
+
+def default_processes() -> int:
+    """One worker per available core."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS / Windows
+        return os.cpu_count() or 1
+
+
+def process_map(func, items: list, processes: int = None, chunksize: int = None, **kwargs) -> list:
+    """
+    Applies `func(item, **kwargs)` to every item, in input order.
+
+    With processes > 1 the items are split into chunks across a process pool,
+    so CPU-bound processing of many payloads runs on several cores; otherwise
+    it is a plain loop in this process. `func` must be a module-level function
+    (it is pickled to the workers) and should catch its own per-item errors.
+
+    Args:
+        func (callable): Module-level function taking one item.
+        items (list): Payloads to process.
+        processes (int): Pool size; None, 0 or 1 runs serially. -1 uses every core.
+        chunksize (int): Items per task sent to a worker (default: about 4 chunks per worker).
+
+    Returns:
+        list: func's result for each item, in the same order as `items`.
+    """
+    if processes == -1:
+        processes = default_processes()
+    call = partial(func, **kwargs) if kwargs else func
+    if not processes or processes <= 1 or len(items) < 2:
+        return [call(item) for item in items]
+
+    processes = min(processes, len(items))
+    chunksize = chunksize or max(1, len(items) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(call, items, chunksize=chunksize))
@@ -1,37 +1,174 @@
-def process_match_timeline(timeline_data: dict, target_puuid: str):
+from itertools import chain
+
+
+def iter_events(frames: list):
     """
-    Extracts timeline-based metrics and spatial tracking for a specific player from a match timeline.
+    Yields every event of a timeline in order, straight from the frames.
+
+    Timelines hold thousands of events; walking them in place avoids building a
+    second flat list per timeline while many timelines are held in memory.
+    """
+    return chain.from_iterable(frame.get("events", ()) for frame in frames)
+
+
+# Combat, vision and objective counters reported at every timepoint
+COUNTER_KEYS = (
+    "kills", "deaths", "assists", "soloKills",
+    "wardsPlaced", "wardsKilled", "controlWardsBought",
+    "plates", "turrets",
+    "dragon", "elder", "baron", "herald",
+    "voidGrub", "voidScuttler", "elite"
+)
+MONSTER_KEYS = {"DRAGON": "dragon", "ELDER_DRAGON": "elder", "BARON_NASHOR": "baron",
+                "RIFTHERALD": "herald", "VOIDGRUB": "voidGrub", "VOIDSCUTTLER": "voidScuttler"}
+
+
+def aggregate_events(frames: list, pid: int, timepoints: list):
+    """
+    Walks a timeline's events once and derives every per-timepoint counter.
+
+    Each event is added to the first 5-minute bucket that includes it (the first
+    timepoint t with timestamp <= t minutes); the counters at each timepoint are
+    then running sums over the buckets, instead of re-testing every event
+    against every timepoint.
+
+    Args:
+        frames (list): Timeline frames.
+        pid (int): The player's participantId.
+        timepoints (list): Minutes to report (5, 10, 15, ...).
 
     Returns:
-        metrics_dict (dict): key metrics across 5, 10, 15... up to match end
-        positions_list (list): list of dicts for player position per minute
-        wards_list (list): list of dicts for each ward placed (with position)
+        counters (list): One {counter: cumulative value} dict per timepoint
+        firsts (dict): Timestamps of one-time events (firstItemTime, ...) and firstSkillUsed
+        ward_events (list): WARD_PLACED events created by the player, in order
     """
-    import math
+    return aggregate_events_all(frames, [pid], timepoints)[pid]
 
-    frames = timeline_data.get("info", {}).get("frames", [])
-    events = []
-    for frame in frames:
-        events.extend(frame.get("events", []))
 
-    # Map puuid to participantId
-    puuid_to_pid = {entry["puuid"]: entry["participantId"] for entry in timeline_data.get("info", {}).get("participants", [])}
-    pid = puuid_to_pid.get(target_puuid)
-    if pid is None:
-        return {}, [], []
+def aggregate_events_all(frames: list, pids: list, timepoints: list) -> dict:
+    """
+    aggregate_events for several participants in the same single pass.
 
-    metrics = {"matchId": timeline_data.get("metadata", {}).get("matchId", "Unknown"), "puuid": target_puuid}
+    Every event is credited straight to the participants it names (killer,
+    victim, assisters, creator...), so the cost does not grow with len(pids).
+
+    Returns:
+        dict: {pid: (counters, firsts, ward_events)}, as returned by aggregate_events.
+    """
+    n_buckets = len(timepoints)
+    deltas = {pid: [dict.fromkeys(COUNTER_KEYS, 0) for _ in timepoints] for pid in pids}
+    firsts = {pid: {} for pid in pids}           # One-time events: first matching event's timestamp (or skill)
+    ward_events = {pid: [] for pid in pids}      # Wards placed by each player, positioned later
+
+    for event in iter_events(frames):
+        etype = event.get("type")
+        ts = event.get("timestamp")
+
+        # First timepoint t (5, 10, ...) with ts <= t minutes; None when past the last one
+        bucket = None
+        if ts is not None:
+            bucket = max(0, int(-(-ts // 300000)) - 1)
+            if bucket >= n_buckets:
+                bucket = None
+
+        # Combat
+        if etype == "CHAMPION_KILL":
+            killer, victim = event.get("killerId"), event.get("victimId")
+            assisting = event.get("assistingParticipantIds", [])
+            if killer in firsts:
+                firsts[killer].setdefault("firstKillTime", ts)
+            if victim in firsts:
+                firsts[victim].setdefault("firstDeathTime", ts)
+            if bucket is not None:
+                if killer in deltas:
+                    deltas[killer][bucket]["kills"] += 1
+                    if not assisting:
+                        deltas[killer][bucket]["soloKills"] += 1
+                if victim in deltas:
+                    deltas[victim][bucket]["deaths"] += 1
+                for assistant in set(assisting):
+                    if assistant in deltas:
+                        deltas[assistant][bucket]["assists"] += 1
+
+        # Vision
+        elif etype == "WARD_PLACED":
+            creator = event.get("creatorId")
+            if creator in firsts:
+                firsts[creator].setdefault("firstWardTime", ts)
+                ward_events[creator].append(event)
+                if bucket is not None:
+                    deltas[creator][bucket]["wardsPlaced"] += 1
+        elif etype == "WARD_KILL":
+            killer = event.get("killerId")
+            if bucket is not None and killer in deltas:
+                deltas[killer][bucket]["wardsKilled"] += 1
+        elif etype == "ITEM_PURCHASED":
+            buyer = event.get("participantId")
+            if buyer in firsts:
+                firsts[buyer].setdefault("firstItemTime", ts)
+                if bucket is not None and event.get("itemId") == 2055:
+                    deltas[buyer][bucket]["controlWardsBought"] += 1
+        elif etype == "SKILL_LEVEL_UP":
+            leveler = event.get("participantId")
+            if leveler in firsts and "firstSkillUsed" not in firsts[leveler]:
+                firsts[leveler]["firstSkillUsed"] = {1: "Q", 2: "W", 3: "E"}.get(event.get("skillSlot"))
+
+        # Objectives
+        # Plate destruction event
+        elif etype == "TURRET_PLATE_DESTROYED":
+            killer = event.get("killerId")
+            if bucket is not None and killer in deltas:
+                deltas[killer][bucket]["plates"] += 1
+
+        # Full tower destruction
+        elif etype == "BUILDING_KILL":
+            if bucket is not None and event.get("buildingType") == "TOWER_BUILDING":
+                for pid in {event.get("killerId"), *event.get("assistingParticipantIds", [])}:
+                    if pid in deltas:
+                        deltas[pid][bucket]["turrets"] += 1
+
+        elif etype == "ELITE_MONSTER_KILL":
+            if bucket is not None:
+                monster = MONSTER_KEYS.get(event.get("monsterType", ""))
+                for pid in {event.get("killerId"), *event.get("assistingParticipantIds", [])}:
+                    if pid in deltas:
+                        if monster:
+                            deltas[pid][bucket][monster] += 1
+                        deltas[pid][bucket]["elite"] += 1
 
+    results = {}
+    for pid in pids:
+        counters = []
+        running = dict.fromkeys(COUNTER_KEYS, 0)
+        for delta in deltas[pid]:
+            for k in COUNTER_KEYS:
+                running[k] += delta[k]
+            counters.append(dict(running))
+        results[pid] = (counters, firsts[pid], ward_events[pid])
+    return results
+
+
+def _timeline_header(timeline_data: dict):
+    """Returns (frames, timepoints, duration metrics) shared by every participant of a timeline."""
+    frames = timeline_data.get("info", {}).get("frames", [])
 
     # Dynamically compute valid timepoints (every 5 mins up to game end)
     max_minute = len(frames) - 1
     timepoints = [t for t in range(5, max_minute + 1, 5)]
-    timestamp_limits = {t: t * 60000 for t in timepoints}
-    metrics["matchDurationMin"] = max_minute                # Rounded down minute duration
-    metrics["matchDurationMs"] = frames[-1].get("timestamp")  # Precise ms duration
-    metrics["matchDurationExactMin"] = round(frames[-1].get("timestamp", 0) / 60000, 2)
+    duration = {
+        "matchDurationMin": max_minute,                                       # Rounded down minute duration
+        "matchDurationMs": frames[-1].get("timestamp"),                       # Precise ms duration
+        "matchDurationExactMin": round(frames[-1].get("timestamp", 0) / 60000, 2),
+    }
+    return frames, timepoints, duration
 
 
+def _player_timeline(timeline_data: dict, frames: list, timepoints: list, duration: dict,
+                     target_puuid: str, pid: int, aggregated: tuple):
+    """Builds one participant's (metrics, positions, wards) from the shared event pass."""
+    metrics = {"matchId": timeline_data.get("metadata", {}).get("matchId", "Unknown"), "puuid": target_puuid}
+    metrics.update(duration)
+
     # Snapshot metrics per timepoint
     for t in timepoints:
         if t < len(frames):
@@ -48,94 +185,21 @@ def process_match_timeline(timeline_data: dict, target_puuid: str):
             metrics[f"posYAt{t}Min"] = pos.get("y")
 
     # Combat, vision, objective counters per timepoint
-    counters = {t: {
-        "kills": 0, "deaths": 0, "assists": 0, "soloKills": 0,
-        "wardsPlaced": 0, "wardsKilled": 0, "controlWardsBought": 0,
-        "plates": 0, "turrets": 0,
-        "dragon": 0, "elder": 0, "baron": 0, "herald": 0,
-        "voidGrub": 0, "voidScuttler": 0, "elite": 0
-    } for t in timepoints}
-
-    for event in events:
-        ts = event.get("timestamp")
-        if ts is None:
-            continue
-
-        for t in timepoints:
-            if ts > timestamp_limits[t]:
-                continue
-
-            # Combat
-            if event["type"] == "CHAMPION_KILL":
-                if event.get("killerId") == pid:
-                    counters[t]["kills"] += 1
-                    if not event.get("assistingParticipantIds"):
-                        counters[t]["soloKills"] += 1
-                if event.get("victimId") == pid:
-                    counters[t]["deaths"] += 1
-                if pid in event.get("assistingParticipantIds", []):
-                    counters[t]["assists"] += 1
-
-            # Vision
-            if event["type"] == "WARD_PLACED" and event.get("creatorId") == pid:
-                counters[t]["wardsPlaced"] += 1
-            if event["type"] == "WARD_KILL" and event.get("killerId") == pid:
-                counters[t]["wardsKilled"] += 1
-            if event["type"] == "ITEM_PURCHASED" and event.get("participantId") == pid:
-                if event.get("itemId") == 2055:
-                    counters[t]["controlWardsBought"] += 1
-
-            # Objectives
-            # Plate destruction event
-            if event["type"] == "TURRET_PLATE_DESTROYED":
-                if event.get("killerId") == pid:
-                    counters[t]["plates"] += 1
-
-            # Full tower destruction
-            if event["type"] == "BUILDING_KILL":
-                if event.get("buildingType") == "TOWER_BUILDING":
-                    if event.get("killerId") == pid or pid in event.get("assistingParticipantIds", []):
-                        counters[t]["turrets"] += 1
-
-
-            if event["type"] == "ELITE_MONSTER_KILL":
-                if event.get("killerId") == pid or pid in event.get("assistingParticipantIds", []):
-                    mtype = event.get("monsterType", "")
-                    if mtype == "DRAGON": counters[t]["dragon"] += 1
-                    elif mtype == "ELDER_DRAGON": counters[t]["elder"] += 1
-                    elif mtype == "BARON_NASHOR": counters[t]["baron"] += 1
-                    elif mtype == "RIFTHERALD": counters[t]["herald"] += 1
-                    elif mtype == "VOIDGRUB": counters[t]["voidGrub"] += 1
-                    elif mtype == "VOIDSCUTTLER": counters[t]["voidScuttler"] += 1
-                    counters[t]["elite"] += 1
-
-    for t in timepoints:
-        for k, v in counters[t].items():
+    counters, firsts, ward_events = aggregated
+    for t, counts in zip(timepoints, counters):
+        for k, v in counts.items():
             metrics[f"{k}At{t}Min"] = v
-        kills = counters[t]['kills']
-        deaths = counters[t]['deaths']
-        assists = counters[t]['assists']
+        kills = counts['kills']
+        deaths = counts['deaths']
+        assists = counts['assists']
         metrics[f"kdaAt{t}Min"] = round((kills + assists) / max(1, deaths), 2)
 
     # One-time events
-    def get_first_event(e_type, condition_fn):
-        for e in events:
-            if e.get("type") == e_type and condition_fn(e):
-                return e.get("timestamp")
-        return None
-
-    def get_first_skill():
-        for e in events:
-            if e.get("type") == "SKILL_LEVEL_UP" and e.get("participantId") == pid:
-                slot = e.get("skillSlot")
-                return {1: "Q", 2: "W", 3: "E"}.get(slot)
-        return None
-
-    metrics["firstItemTime"] = get_first_event("ITEM_PURCHASED", lambda e: e.get("participantId") == pid)
-    metrics["firstSkillUsed"] = get_first_skill()
-    metrics["firstWardTime"] = get_first_event("WARD_PLACED", lambda e: e.get("creatorId") == pid)
-    metrics["firstKillTime"] = get_first_event("CHAMPION_KILL", lambda e: e.get("killerId") == pid)
-    metrics["firstDeathTime"] = get_first_event("CHAMPION_KILL", lambda e: e.get("victimId") == pid)
+    metrics["firstItemTime"] = firsts.get("firstItemTime")
+    metrics["firstSkillUsed"] = firsts.get("firstSkillUsed")
+    metrics["firstWardTime"] = firsts.get("firstWardTime")
+    metrics["firstKillTime"] = firsts.get("firstKillTime")
+    metrics["firstDeathTime"] = firsts.get("firstDeathTime")
 
     # Position per minute
     positions = []
@@ -154,23 +218,60 @@ def process_match_timeline(timeline_data: dict, target_puuid: str):
     # Ward positions per minute
     # Ward positions (approximate via participant position at that time)
     wards = []
-    for e in events:
-        if e.get("type") == "WARD_PLACED" and e.get("creatorId") == pid:
-            ts = e.get("timestamp", 0)
-            minute = int(ts // 60000)
-            if minute < len(frames):
-                pdata = frames[minute]["participantFrames"].get(str(pid), {})
-                pos = pdata.get("position", {})
-                if pos:  # Make sure position exists
-                    wards.append({
-                        "matchId": timeline_data.get("metadata", {}).get("matchId", "Unknown"),
-                        "puuid": target_puuid,
-                        "timestamp": ts,
-                        "minute": minute,
-                        "wardType": e.get("wardType", "Unknown"),
-                        "x": pos.get("x"),
-                        "y": pos.get("y")
-                    })
+    for e in ward_events:
+        ts = e.get("timestamp", 0)
+        minute = int(ts // 60000)
+        if minute < len(frames):
+            pdata = frames[minute]["participantFrames"].get(str(pid), {})
+            pos = pdata.get("position", {})
+            if pos:  # Make sure position exists
+                wards.append({
+                    "matchId": timeline_data.get("metadata", {}).get("matchId", "Unknown"),
+                    "puuid": target_puuid,
+                    "timestamp": ts,
+                    "minute": minute,
+                    "wardType": e.get("wardType", "Unknown"),
+                    "x": pos.get("x"),
+                    "y": pos.get("y")
+                })
 
 
     return metrics, positions, wards
+
+
+def process_match_timeline(timeline_data: dict, target_puuid: str):
+    """
+    Extracts timeline-based metrics and spatial tracking for a specific player from a match timeline.
+
+    Returns:
+        metrics_dict (dict): key metrics across 5, 10, 15... up to match end
+        positions_list (list): list of dicts for player position per minute
+        wards_list (list): list of dicts for each ward placed (with position)
+    """
+    # Map puuid to participantId
+    puuid_to_pid = {entry["puuid"]: entry["participantId"] for entry in timeline_data.get("info", {}).get("participants", [])}
+    pid = puuid_to_pid.get(target_puuid)
+    if pid is None:
+        return {}, [], []
+
+    frames, timepoints, duration = _timeline_header(timeline_data)
+    aggregated = aggregate_events(frames, pid, timepoints)
+    return _player_timeline(timeline_data, frames, timepoints, duration, target_puuid, pid, aggregated)
+
+
+def process_match_timeline_all(timeline_data: dict) -> dict:
+    """
+    Extracts timeline metrics, positions and wards for all ten participants in one
+    pass over the events.
+
+    Returns:
+        dict: {puuid: (metrics_dict, positions_list, wards_list)}, as returned by process_match_timeline.
+    """
+    puuid_to_pid = {entry["puuid"]: entry["participantId"] for entry in timeline_data.get("info", {}).get("participants", [])}
+    if not puuid_to_pid:
+        return {}
+
+    frames, timepoints, duration = _timeline_header(timeline_data)
+    aggregated = aggregate_events_all(frames, list(puuid_to_pid.values()), timepoints)
+    return {puuid: _player_timeline(timeline_data, frames, timepoints, duration, puuid, pid, aggregated[pid])
+            for puuid, pid in puuid_to_pid.items()}
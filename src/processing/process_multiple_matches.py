@@ -1,29 +1,30 @@
 from .process_match_data import process_match_data
+from .parallel import process_map
 
-def process_multiple_matches(match_datas: list, puuid: str) -> list:
+
+def _process_one_match(match_data: dict, puuid: str):
+    """One match, with failures isolated to that match (runs in pool workers too)."""
+    try:
+        if not match_data:
+            return None
+        return process_match_data(match_data, target_puuid=puuid)
+    except Exception as e:
+        print(f" Skipped a match due to error: {e}")
+        return None
+
+
+def process_multiple_matches(match_datas: list, puuid: str, processes: int = None) -> list:
     """
     Processes multiple match data objects for a specific player and returns a list of match-level stats.
 
     Args:
         match_datas (list): A list of raw match data dicts (already fetched via API).
         puuid (str): The player's PUUID.
+        processes (int): Spread the matches over this many processes (-1 for every core).
+            None processes them in this process.
 
     Returns:
         list: A list of dictionaries, each containing that player's stats for one match.
     """
-    all_stats = []
-
-    for match_data in match_datas:
-        try:
-            if not match_data:
-                continue
-
-            player_stats = process_match_data(match_data, target_puuid=puuid)
-            if player_stats:
-                all_stats.append(player_stats)
-
-        except Exception as e:
-            print(f" Skipped a match due to error: {e}")
-            continue
-
-    return all_stats
+    results = process_map(_process_one_match, match_datas, processes=processes, puuid=puuid)
+    return [player_stats for player_stats in results if player_stats]
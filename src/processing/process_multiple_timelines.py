@@ -1,12 +1,26 @@
 from .process_match_timeline_data import process_match_timeline
+from .parallel import process_map
 
-def process_multiple_timelines(timeline_list, target_puuid):
+
+def _process_one_timeline(timeline_data: dict, target_puuid: str):
+    """One timeline, with failures isolated to that match (runs in pool workers too)."""
+    try:
+        return process_match_timeline(timeline_data, target_puuid)
+    except Exception as e:
+        match_id = timeline_data.get("metadata", {}).get("matchId", "Unknown")
+        print(f" Error processing timeline: {match_id} — {str(e)}")
+        return None
+
+
+def process_multiple_timelines(timeline_list, target_puuid, processes=None):
     """
     Processes multiple timeline dicts for a specific player using process_match_timeline.
 
     Args:
         timeline_list (list): List of timeline dicts (from Riot API)
         target_puuid (str): The player's PUUID to extract data for
+        processes (int): Spread the timelines over this many processes (-1 for every core).
+            None processes them in this process.
 
     Returns:
         metrics_list (list of dict): Per-match timeline metrics
@@ -17,16 +31,13 @@ def process_multiple_timelines(timeline_list, target_puuid):
     all_positions = []
     all_wards = []
 
-    for timeline_data in timeline_list:
-        try:
-            metrics, positions, wards = process_match_timeline(timeline_data, target_puuid)
-            if metrics:
-                metrics_list.append(metrics)
-                all_positions.extend(positions)
-                all_wards.extend(wards)
-        except Exception as e:
-            match_id = timeline_data.get("metadata", {}).get("matchId", "Unknown")
-            print(f" Error processing timeline: {match_id} — {str(e)}")
+    for result in process_map(_process_one_timeline, timeline_list, processes=processes, target_puuid=target_puuid):
+        if not result:
             continue
+        metrics, positions, wards = result
+        if metrics:
+            metrics_list.append(metrics)
+            all_positions.extend(positions)
+            all_wards.extend(wards)
 
     return metrics_list, all_positions, all_wards
@@ -0,0 +1,143 @@
+import numpy as np
+from .process_match_data import lane_opponents
+
+# Per-minute features read from participantFrames, in array order
+SERIES_FEATURES = (
+    "totalGold", "currentGold", "xp", "level",
+    "cs", "jungleCS", "damageToChampions",
+    "x", "y"
+)
+
+
+def _frame_features(pdata: dict) -> tuple:
+    """One participantFrame as a SERIES_FEATURES tuple (NaN where a value is missing)."""
+    if not pdata:
+        return (np.nan,) * len(SERIES_FEATURES)
+    pos = pdata.get("position") or {}
+    minions, jungle = pdata.get("minionsKilled"), pdata.get("jungleMinionsKilled")
+    return (
+        pdata.get("totalGold", np.nan),
+        pdata.get("currentGold", np.nan),
+        pdata.get("xp", np.nan),
+        pdata.get("level", np.nan),
+        (minions or 0) + (jungle or 0) if minions is not None or jungle is not None else np.nan,
+        jungle if jungle is not None else np.nan,
+        (pdata.get("damageStats") or {}).get("totalDamageDoneToChampions", np.nan),
+        pos.get("x", np.nan),
+        pos.get("y", np.nan),
+    )
+
+
+class TimelineSeries:
+    """
+    Dense per-minute stats of every participant of one match.
+
+    `values` has shape (minutes, participants, features): minute 0 is the first
+    frame, participants follow participantId order and features follow
+    SERIES_FEATURES. Missing values are NaN.
+    """
+
+    def __init__(self, match_id: str, puuids: list, participant_ids: list, team_ids: np.ndarray,
+                 opponents: np.ndarray, values: np.ndarray):
+        self.match_id = match_id
+        self.puuids = puuids
+        self.participant_ids = participant_ids
+        self.team_ids = team_ids      # (participants,) teamId of each participant
+        self.opponents = opponents    # (participants,) index of each lane opponent, -1 if none
+        self.values = values
+
+    @property
+    def minutes(self) -> int:
+        return self.values.shape[0]
+
+    def player_index(self, puuid: str) -> int:
+        return self.puuids.index(puuid)
+
+    def feature(self, name: str) -> np.ndarray:
+        """(minutes, participants) curve of one feature."""
+        return self.values[:, :, SERIES_FEATURES.index(name)]
+
+    def lane_diff(self) -> np.ndarray:
+        """
+        (minutes, participants, features): each participant minus their lane opponent
+        (NaN for participants without one).
+        """
+        opponent_values = self.values[:, np.maximum(self.opponents, 0), :]
+        diff = self.values - opponent_values
+        diff[:, self.opponents < 0, :] = np.nan
+        return diff
+
+    def team_totals(self) -> tuple:
+        """
+        Returns:
+            team_ids (np.ndarray): The teams, sorted.
+            totals (np.ndarray): (minutes, teams, features) sums over each team's participants.
+        """
+        teams = np.unique(self.team_ids)
+        totals = np.stack([np.nansum(self.values[:, self.team_ids == team, :], axis=1) for team in teams], axis=1)
+        return teams, totals
+
+    def team_diff(self) -> np.ndarray:
+        """(minutes, participants, features): own team total minus the enemy team total."""
+        teams, totals = self.team_totals()
+        own = totals[:, np.searchsorted(teams, self.team_ids), :]
+        return 2 * own - totals.sum(axis=1, keepdims=True)
+
+
+def timeline_series(timeline_data: dict, match_data: dict = None) -> TimelineSeries:
+    """
+    Turns a timeline's participantFrames into per-minute arrays for all participants.
+
+    Args:
+        timeline_data (dict): Raw timeline from Riot API.
+        match_data (dict): The match details, used for teams and lane opponents.
+            Without it participants 1-5 are blue, 6-10 red, and N faces N +/- 5.
+
+    Returns:
+        TimelineSeries
+    """
+    info = timeline_data.get("info", {})
+    frames = info.get("frames", [])
+    participants = sorted(info.get("participants", []), key=lambda p: p["participantId"])
+    participant_ids = [p["participantId"] for p in participants]
+    puuids = [p.get("puuid") for p in participants]
+    keys = [str(pid) for pid in participant_ids]
+
+    values = np.array(
+        [[_frame_features(frame.get("participantFrames", {}).get(k)) for k in keys] for frame in frames],
+        dtype=float,
+    ).reshape(len(frames), len(keys), len(SERIES_FEATURES))
+
+    index = {puuid: i for i, puuid in enumerate(puuids)}
+    if match_data:
+        match_participants = match_data.get("info", {}).get("participants", [])
+        teams_by_puuid = {p.get("puuid"): p.get("teamId") for p in match_participants}
+        opponents_by_puuid = {p.get("puuid"): e.get("puuid") if e else None
+                              for p, e in zip(match_participants, lane_opponents(match_participants))}
+        team_ids = np.array([teams_by_puuid.get(puuid, 0) for puuid in puuids])
+        opponents = np.array([index.get(opponents_by_puuid.get(puuid), -1) for puuid in puuids], dtype=int)
+    else:
+        n, half = len(participant_ids), len(participant_ids) // 2
+        team_ids = np.array([100 if i < half else 200 for i in range(n)])
+        opponents = np.array([(i + half) % n for i in range(n)], dtype=int)
+
+    match_id = timeline_data.get("metadata", {}).get("matchId", "Unknown")
+    return TimelineSeries(match_id, puuids, participant_ids, team_ids, opponents, values)
+
+
+def stack_series(series_list: list, minutes: int = None) -> np.ndarray:
+    """
+    Stacks several matches into one (matches, minutes, participants, features) array.
+
+    Shorter games are padded with NaN; longer ones are cut at `minutes`
+    (default: the longest game).
+    """
+    if not series_list:
+        return np.empty((0, minutes or 0, 0, len(SERIES_FEATURES)))
+    minutes = minutes or max(s.minutes for s in series_list)
+    players = max(s.values.shape[1] for s in series_list)
+    stacked = np.full((len(series_list), minutes, players, len(SERIES_FEATURES)), np.nan)
+    for i, s in enumerate(series_list):
+        n = min(minutes, s.minutes)
+        stacked[i, :n, :s.values.shape[1], :] = s.values[:n]
+    return stacked
@@ -0,0 +1,116 @@
+# src/utils/concurrency.py
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from src.utils.rate_limiter import parse_rate_header
+
+# Controller that responses on the current thread/task report to (see adaptive_concurrency)
+_current_controller = contextvars.ContextVar("aimd_controller", default=None)
+
+
+class AimdController:
+    """
+    Additive-increase / multiplicative-decrease limit on in-flight requests.
+
+    Grows the limit by about one per round trip while responses are healthy and
+    X-App-Rate-Limit-Count shows headroom, and cuts it on 429s, 5xx, connection
+    errors or latency climbing well above its baseline. Throughput settles near
+    what Riot actually allows instead of a hand-picked worker count.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1, initial: int = 2, decrease: float = 0.5,
+                 headroom: float = 0.2, latency_factor: float = 2.0, cooldown: float = 1.0):
+        """
+        Args:
+            max_limit (int): Upper bound (the worker pool size).
+            min_limit (int): Lower bound.
+            initial (int): Starting limit.
+            decrease (float): Factor applied to the limit on congestion.
+            headroom (float): Fraction of the tightest app window that must be unused to grow.
+            latency_factor (float): Latency above baseline * factor counts as congestion.
+            cooldown (float): Seconds between two decreases, so one burst of 429s cuts once.
+        """
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max(min_limit, min(initial, max_limit)))
+        self.decrease = decrease
+        self.headroom = headroom
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._last_decrease = 0.0
+        self._latency = {}       # endpoint -> EWMA of response latency
+        self._baseline = {}      # endpoint -> lowest latency EWMA seen, drifting up slowly
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def in_flight_limit(self) -> int:
+        return int(self.limit)
+
+    @staticmethod
+    def _headroom(headers) -> float:
+        """Unused fraction of the tightest app window, or None if the headers are missing."""
+        limits = dict((s, c) for c, s in parse_rate_header(headers.get("X-App-Rate-Limit")))
+        counts = dict((s, c) for c, s in parse_rate_header(headers.get("X-App-Rate-Limit-Count")))
+        fractions = [1 - counts.get(s, 0) / c for s, c in limits.items() if c]
+        return min(fractions) if fractions else None
+
+    def _cut(self, now: float):
+        if now - self._last_decrease >= self.cooldown:
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+            self._last_decrease = now
+            self.decreases += 1
+
+    def on_response(self, status, latency_s: float, headers=None, endpoint: str = None):
+        """
+        Feeds one HTTP response (status None for a connection error) into the controller.
+
+        Latency is tracked per endpoint, since a timeline takes far longer to
+        download than a match-ID page even on an idle connection.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if status is None or status == 429 or status >= 500:
+                self._cut(now)
+                return
+
+            previous = self._latency.get(endpoint)
+            latency = self._latency[endpoint] = latency_s if previous is None else 0.8 * previous + 0.2 * latency_s
+            baseline = self._baseline.get(endpoint)
+            if baseline is None or latency < baseline:
+                baseline = latency
+            else:
+                baseline *= 1.01  # Let the baseline follow a lasting shift in latency
+            self._baseline[endpoint] = baseline
+            if latency > baseline * self.latency_factor:
+                self._cut(now)
+                return
+
+            headroom = self._headroom(headers or {})
+            if headroom is None or headroom >= self.headroom:
+                if self.limit < self.max_limit:
+                    # +1 per round trip: each of the `limit` in-flight responses adds 1/limit
+                    self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                    self.increases += 1
+
+
+@contextmanager
+def adaptive_concurrency(controller: AimdController):
+    """
+    Reports every Riot API response made inside the block (including in worker
+    threads started with contextvars.copy_context()) to `controller`.
+    """
+    token = _current_controller.set(controller)
+    try:
+        yield controller
+    finally:
+        _current_controller.reset(token)
+
+
+def observe_response(status, latency_s: float, headers=None, endpoint: str = None):
+    """Called by the HTTP client after every response; no-op outside adaptive_concurrency."""
+    controller = _current_controller.get()
+    if controller is not None:
+        controller.on_response(status, latency_s, headers, endpoint)
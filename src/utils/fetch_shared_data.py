@@ -2,82 +2,246 @@ from src.api.get_puuid import get_puuid
 from src.api.get_match_history import get_match_history
 from src.api.get_match_details import get_match_details
 from src.api.get_match_timeline import get_match_timeline
+from src.api.client import get_client
 from src.utils.rate_tracker import check_rate_limit, update_rate_limit  # CHANGED: Import from our new tracker
+from src.api.key_pool import get_key_pool
+from src.api.routing import group_by_region
+from src.utils.concurrency import AimdController, adaptive_concurrency
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from tqdm import tqdm
 import time
 
-def fetch_puuid_and_match_ids(region, game_name, tag_line, max_matches=1000):
-    """Fetches PUUID and match IDs with rate limit awareness."""
+def fetch_puuid_and_match_ids(region, game_name, tag_line, max_matches=1000, incremental=False):
+    """
+    Fetches PUUID and match IDs with rate limit awareness.
+
+    With incremental=True only matches newer than the player's newest stored
+    match are returned, so a refresh costs a page or two of history.
+    """
     # Check rate limit before fetching PUUID
-    sleep_time = check_rate_limit('account')
+    sleep_time = check_rate_limit('account', region=region)
     if sleep_time > 0:
-        print(f" Account API limit approaching. Sleeping for {sleep_time}s...")
+        print(f" Account API limit approaching. Sleeping for {sleep_time:.1f}s...")
         time.sleep(sleep_time)
     
     puuid, puuid_rate_info = get_puuid(region, game_name, tag_line)
     
     # Check rate limit before fetching match history
-    sleep_time = check_rate_limit('match_history')
+    sleep_time = check_rate_limit('match_history', region=region)
     if sleep_time > 0:
-        print(f" Match history API limit approaching. Sleeping for {sleep_time}s...")
+        print(f" Match history API limit approaching. Sleeping for {sleep_time:.1f}s...")
         time.sleep(sleep_time)
     
-    match_ids, history_rate_info = get_match_history(region, puuid, max_matches)
+    known_ids = None
+    if incremental:
+        from src.database.reader import get_stored_match_ids  # Only incremental syncs need the database
+        known_ids = frozenset(get_stored_match_ids(puuid))
+        print(f" Incremental sync: {len(known_ids)} matches already stored")
+
+    match_ids, history_rate_info = get_match_history(region, puuid, max_matches, known_ids=known_ids)
     return puuid, match_ids
 
-def fetch_match_and_timeline_data(region, match_ids, include_details=True, include_timeline=True, retries=2):
+def _fetch_single_match(region, match_id, include_details=True, include_timeline=True, retries=2):
     """
-    Fetches match and timeline data with proper rate limiting.
+    Fetches details and/or timeline for one match.
+
+    Returns:
+        tuple: (match_entry, timeline_entry) where each entry is a (data, rate_info)
+               tuple or None if that payload could not be fetched.
     """
+    match_entry = None
+    timeline_entry = None
+
+    if include_details:
+        match_data, match_rate_info = get_match_details(region, match_id)
+        if match_data:
+            match_entry = (match_data, match_rate_info)
+        else:
+            print(f"Match data missing for {match_id}")
+
+    if include_timeline:
+        timeline_data, timeline_rate_info = get_match_timeline(region, match_id)
+        if timeline_data and timeline_data.get("info", {}).get("frames"):
+            timeline_entry = (timeline_data, timeline_rate_info)
+        else:
+            print(f"Timeline empty for {match_id}")
+            # Retry logic for empty timelines
+            for attempt in range(retries - 1):  # Already tried once
+                try:
+                    time.sleep(get_client().retry_policy.backoff_delay(attempt + 1))  # Jittered wait before retry
+                    timeline_data, timeline_rate_info = get_match_timeline(region, match_id)
+                    if timeline_data and timeline_data.get("info", {}).get("frames"):
+                        timeline_entry = (timeline_data, timeline_rate_info)
+                        break
+                except Exception as e:
+                    print(f"Retry {attempt+2} failed for timeline {match_id}: {e}")
+                    continue
+
+    return match_entry, timeline_entry
+
+
+def _remaining_budget(api_types, region):
+    """Returns how many more requests the tightest rate window on `region` allows right now."""
+    pool = get_key_pool()
+    return min((pool.remaining(t, region) for t in api_types), default=float("inf"))
+
+
+def _collect_results(match_ids, results):
+    """Flattens per-match results back into the ordered lists returned by the sequential path."""
     match_datas = []
     timeline_datas = []
+    for match_id in match_ids:
+        match_entry, timeline_entry = results.get(match_id, (None, None))
+        if match_entry:
+            match_datas.append(match_entry)
+        if timeline_entry:
+            timeline_datas.append(timeline_entry)
+    return match_datas, timeline_datas
+
+
+def _fetch_concurrently(region, match_ids, include_details, include_timeline, retries, workers, adaptive=True):
+    """
+    Fetches matches with a bounded thread pool.
+
+    Keeps at most `workers` matches in flight, and fewer when the tracked rate budget
+    is running low, so the pool never outruns the API limits. With adaptive=True the
+    in-flight count is steered by an AIMD controller fed by every response, so it
+    backs off on 429s or rising latency and grows again while there is headroom.
+
+    Returns:
+        dict: {match_id: (match_entry, timeline_entry)}
+    """
+    api_types = [t for t, on in (("match", include_details), ("timeline", include_timeline)) if on]
+    requests_per_match = max(1, len(api_types))
+    results = {}
+    pending = {}
+    queue = deque(match_ids)
+    progress = tqdm(total=len(queue), desc=f"Fetching match & timeline data ({region})")
+    controller = AimdController(max_limit=workers) if adaptive else None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor, adaptive_concurrency(controller):
+        while queue or pending:
+            limit = controller.in_flight_limit if controller else workers
+            budget = _remaining_budget(api_types, region) // requests_per_match
+
+            if queue and budget <= 0 and not pending:
+                # Out of budget with nothing in flight: wait for the window, then probe with one match
+                sleep_time = max(check_rate_limit(t, region=region) for t in api_types)
+                print(f" Match API limit approaching. Sleeping for {sleep_time:.1f}s...")
+                time.sleep(sleep_time)
+                budget = 1
+
+            while queue and len(pending) < min(limit, budget):
+                match_id = queue.popleft()
+                # Run in a copy of the caller's context so request_priority carries over
+                future = executor.submit(contextvars.copy_context().run, _fetch_single_match, region, match_id,
+                                         include_details, include_timeline, retries)
+                pending[future] = match_id
+
+            if not pending:
+                continue
 
-    for match_id in tqdm(match_ids, desc="Fetching match & timeline data"):
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                match_id = pending.pop(future)
+                try:
+                    results[match_id] = future.result()
+                except Exception as e:
+                    print(f"Error with match {match_id}: {e}")
+                progress.update(1)
+            if controller:
+                progress.set_postfix(in_flight=limit)
+
+    progress.close()
+    if controller:
+        print(f" Adaptive concurrency ({region}): settled at {controller.in_flight_limit}/{workers} "
+              f"(+{controller.increases} / -{controller.decreases})")
+    return results
+
+
+def _fetch_sequentially(region, match_ids, include_details, include_timeline, retries):
+    """
+    Fetches matches one at a time, sleeping whenever the rate budget runs out.
+
+    Returns:
+        dict: {match_id: (match_entry, timeline_entry)}
+    """
+    results = {}
+
+    for match_id in tqdm(match_ids, desc=f"Fetching match & timeline data ({region})"):
         try:
             # Check rate limits before each API call
             if include_details:
-                sleep_time = check_rate_limit('match')
+                sleep_time = check_rate_limit('match', region=region)
                 if sleep_time > 0:
-                    print(f" Match API limit approaching. Sleeping for {sleep_time}s...")
+                    print(f" Match API limit approaching. Sleeping for {sleep_time:.1f}s...")
                     time.sleep(sleep_time)
             
             if include_timeline:
-                sleep_time = check_rate_limit('timeline')
+                sleep_time = check_rate_limit('timeline', region=region)
                 if sleep_time > 0:
-                    print(f" Timeline API limit approaching. Sleeping for {sleep_time}s...")
+                    print(f" Timeline API limit approaching. Sleeping for {sleep_time:.1f}s...")
                     time.sleep(sleep_time)
 
-            if include_details:
-                match_data, match_rate_info = get_match_details(region, match_id)
-                if match_data:
-                    match_datas.append((match_data, match_rate_info))  # CHANGED: Store tuple
-                else:
-                    print(f"Match data missing for {match_id}")
-
-            if include_timeline:
-                timeline_data, timeline_rate_info = get_match_timeline(region, match_id)
-                if timeline_data and timeline_data.get("info", {}).get("frames"):
-                    timeline_datas.append((timeline_data, timeline_rate_info))  # CHANGED: Store tuple
-                else:
-                    print(f"Timeline empty for {match_id}")
-                    # Retry logic for empty timelines
-                    for attempt in range(retries - 1):  # Already tried once
-                        try:
-                            time.sleep(1)  # Wait before retry
-                            timeline_data, timeline_rate_info = get_match_timeline(region, match_id)
-                            if timeline_data and timeline_data.get("info", {}).get("frames"):
-                                timeline_datas.append((timeline_data, timeline_rate_info))
-                                break
-                        except Exception as e:
-                            print(f"Retry {attempt+2} failed for timeline {match_id}: {e}")
-                            continue
-
-            # Minimal respectful sleep between matches
-            time.sleep(0.1)
+            # Pacing between matches is handled by the RateLimiter inside the client
+            results[match_id] = _fetch_single_match(region, match_id, include_details, include_timeline, retries)
 
         except Exception as e:
             print(f"Error with match {match_id}: {e}")
             continue
 
-    return match_datas, timeline_datas  # CHANGED: Now returns tuples with rate info
+    return results
+
+
+def _fetch_lane(region, match_ids, include_details, include_timeline, retries, workers, adaptive=True):
+    """Fetches every match of one regional cluster."""
+    if workers and workers > 1:
+        return _fetch_concurrently(region, match_ids, include_details, include_timeline, retries, workers, adaptive)
+    return _fetch_sequentially(region, match_ids, include_details, include_timeline, retries)
+
+
+def fetch_match_and_timeline_data(region, match_ids, include_details=True, include_timeline=True, retries=2, workers=1,
+                                  adaptive=True):
+    """
+    Fetches match and timeline data with proper rate limiting.
+
+    Each match is routed to the regional cluster named by its ID's platform prefix
+    (EUW1_ -> europe, KR_ -> asia, ...). Riot rate-limits each cluster separately,
+    so when the list spans several clusters each one is fetched in its own lane and
+    the lanes run at the same time.
+
+    Args:
+        region (str): Riot API region (e.g., "europe"), used for match IDs whose
+            platform prefix is not recognised.
+        match_ids (list): Match IDs to fetch.
+        include_details (bool): Fetch match details.
+        include_timeline (bool): Fetch match timelines.
+        retries (int): Attempts for timelines that come back empty.
+        workers (int): Max matches fetched concurrently per region. 1 keeps the sequential path.
+        adaptive (bool): Let an AIMD controller pick the in-flight count up to `workers`
+            instead of always running `workers` matches at once.
+
+    Returns:
+        tuple: (match_datas, timeline_datas), lists of (data, rate_info) tuples in match_ids order.
+    """
+    lanes = group_by_region(match_ids, default=region)
+    results = {}
+
+    if len(lanes) <= 1:
+        for lane_region, lane_ids in lanes.items():
+            results.update(_fetch_lane(lane_region, lane_ids, include_details, include_timeline, retries, workers,
+                                       adaptive))
+        return _collect_results(match_ids, results)
+
+    print(f" Fetching {len(match_ids)} matches across {len(lanes)} regions: {', '.join(lanes)}")
+    with ThreadPoolExecutor(max_workers=len(lanes)) as executor:
+        # Each lane runs in a copy of the caller's context so request_priority carries over
+        futures = [executor.submit(contextvars.copy_context().run, _fetch_lane, lane_region, lane_ids,
+                                   include_details, include_timeline, retries, workers, adaptive)
+                   for lane_region, lane_ids in lanes.items()]
+        for future in futures:
+            results.update(future.result())
 
+    return _collect_results(match_ids, results)
@@ -0,0 +1,41 @@
+# src/utils/json_codec.py
+import json
+
+# orjson (in requirements.txt) is several times faster than the stdlib and decodes straight
+# from bytes; the stdlib fallback only keeps installs without it working
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """
+    Decodes a JSON document from bytes (or str).
+
+    Riot responses and cached payloads are passed in as raw bytes. With orjson
+    they are parsed directly, so the multi-megabyte intermediate str that
+    response.json() builds is never created; the stdlib fallback still decodes
+    the bytes to a str internally (but skips response.text's charset detection).
+
+    Args:
+        data (bytes | str): Encoded JSON.
+
+    Returns:
+        Decoded object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Encodes `obj` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def decode_response(response):
+    """Decodes a requests.Response body without going through response.text."""
+    return loads(response.content)
@@ -0,0 +1,157 @@
+# src/utils/match_cache.py
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from src.utils.json_codec import dumps, loads
+from src.utils.paths import project_path
+
+# Cache location and size cap (override with MATCH_CACHE_PATH / MATCH_CACHE_MAX_MB in .env)
+DEFAULT_CACHE_PATH = project_path(os.path.join("data", "cache", "match_cache.sqlite3"))
+DEFAULT_CACHE_MAX_MB = 2048
+
+# How long an empty payload (e.g. a timeline with no frames) is trusted before the API is asked again
+EMPTY_PAYLOAD_TTL_SECONDS = 7 * 24 * 3600
+
+
+class MatchCache:
+    """
+    Disk-backed cache for immutable Riot payloads (match details and timelines).
+
+    A match ID never changes its payload, so entries never expire; they are only
+    evicted least-recently-used first once the compressed total exceeds max_bytes.
+    Backed by SQLite so it survives restarts and can be shared by several processes.
+    """
+
+    def __init__(self, path: str = None, max_bytes: int = None):
+        """
+        Args:
+            path (str): SQLite file holding the cache; defaults to MATCH_CACHE_PATH
+                (relative to the project root) or DEFAULT_CACHE_PATH.
+            max_bytes (int): Cap on the total compressed payload size; defaults to
+                MATCH_CACHE_MAX_MB megabytes.
+        """
+        if path is None:
+            path = project_path(os.getenv("MATCH_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        if max_bytes is None:
+            max_bytes = int(os.getenv("MATCH_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB)) * 1024 * 1024
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._conn() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS payloads (
+                    endpoint TEXT NOT NULL,
+                    match_id TEXT NOT NULL,
+                    data BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL,
+                    PRIMARY KEY (endpoint, match_id)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_payloads_last_access ON payloads (last_access)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS empty_payloads (
+                    endpoint TEXT NOT NULL,
+                    match_id TEXT NOT NULL,
+                    checked_at REAL NOT NULL,
+                    PRIMARY KEY (endpoint, match_id)
+                )
+            """)
+
+    def _conn(self) -> sqlite3.Connection:
+        """One connection per thread; SQLite handles the cross-thread/process locking."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, endpoint: str, match_id: str):
+        """
+        Returns the cached payload, or None on a miss.
+
+        Args:
+            endpoint (str): Payload type ("match" or "timeline").
+            match_id (str): Match ID (e.g. "EUW1_7313131872").
+        """
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT data FROM payloads WHERE endpoint = ? AND match_id = ?", (endpoint, match_id)
+        ).fetchone()
+        if row is None:
+            return None
+        with conn:
+            conn.execute(
+                "UPDATE payloads SET last_access = ? WHERE endpoint = ? AND match_id = ?",
+                (time.time(), endpoint, match_id)
+            )
+        return loads(zlib.decompress(row[0]))
+
+    def put(self, endpoint: str, match_id: str, payload: dict):
+        """Stores a payload compressed, then evicts old entries if over the size cap."""
+        blob = zlib.compress(dumps(payload), 6)
+        conn = self._conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO payloads (endpoint, match_id, data, size, last_access) VALUES (?, ?, ?, ?, ?)",
+                (endpoint, match_id, sqlite3.Binary(blob), len(blob), time.time())
+            )
+        self._evict()
+
+    def contains(self, endpoint: str, match_id: str) -> bool:
+        row = self._conn().execute(
+            "SELECT 1 FROM payloads WHERE endpoint = ? AND match_id = ?", (endpoint, match_id)
+        ).fetchone()
+        return row is not None
+
+    def mark_empty(self, endpoint: str, match_id: str):
+        """Records that the API answered with an empty payload for this match (see known_empty)."""
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO empty_payloads (endpoint, match_id, checked_at) VALUES (?, ?, ?)",
+                (endpoint, match_id, time.time())
+            )
+
+    def known_empty(self, endpoint: str, ttl: float = EMPTY_PAYLOAD_TTL_SECONDS) -> set:
+        """Match IDs whose payload came back empty within the last `ttl` seconds."""
+        rows = self._conn().execute(
+            "SELECT match_id FROM empty_payloads WHERE endpoint = ? AND checked_at > ?", (endpoint, time.time() - ttl)
+        ).fetchall()
+        return {match_id for match_id, in rows}
+
+    def total_bytes(self) -> int:
+        return self._conn().execute("SELECT COALESCE(SUM(size), 0) FROM payloads").fetchone()[0]
+
+    def _evict(self):
+        """Drops least-recently-used entries until the cache fits in max_bytes."""
+        conn = self._conn()
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return
+        with conn:
+            rows = conn.execute("SELECT endpoint, match_id, size FROM payloads ORDER BY last_access").fetchall()
+            for endpoint, match_id, size in rows:
+                if excess <= 0:
+                    break
+                conn.execute("DELETE FROM payloads WHERE endpoint = ? AND match_id = ?", (endpoint, match_id))
+                excess -= size
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_match_cache() -> MatchCache:
+    """Returns the process-wide MatchCache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = MatchCache()
+    return _cache
@@ -0,0 +1,11 @@
+# src/utils/paths.py
+import os
+
+# Repository root: data/ paths resolve against it, so the Streamlit app and CLI
+# scripts share the same files whatever directory they were started from
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def project_path(path: str) -> str:
+    """Resolves a relative path against the project root (absolute paths are kept)."""
+    return os.path.join(PROJECT_ROOT, path)
@@ -0,0 +1,191 @@
+# src/utils/payload_archive.py
+import os
+import struct
+import threading
+import zlib
+from src.utils.json_codec import dumps, loads
+from src.utils.paths import project_path
+
+# zstandard (in requirements.txt) gives a better ratio and much faster decompression
+# than zlib; without it entries are written with zlib and a warning is printed once
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_zlib_warned = False
+
+# Suggested archive location. Archiving is off unless PAYLOAD_ARCHIVE_DIR is set
+# in .env: the SQLite match cache already keeps recent payloads, the archive is
+# for keeping every payload for good (and replaying them without the API).
+DEFAULT_ARCHIVE_DIR = project_path(os.path.join("data", "archive"))
+DEFAULT_PACK_MAX_BYTES = 256 * 1024 * 1024
+
+ENDPOINTS = {"match": 0, "timeline": 1}
+CODEC_ZLIB = 0
+CODEC_ZSTD = 1
+
+# Index record: match ID, endpoint, codec, pack number, offset, compressed length
+INDEX_RECORD = struct.Struct("<32sBBHQI")
+
+
+class PayloadArchive:
+    """
+    Append-only archive of raw Riot payloads (match details and timelines).
+
+    Payloads are compressed one by one and appended to numbered pack files. A
+    fixed-width index file maps each match ID to its pack, offset and length
+    (loaded into memory, then read incrementally as it grows), so reading one
+    match decompresses only that match and reprocessing never needs the network.
+
+    Entries are immutable: storing a match that is already archived is a no-op.
+    Writes are serialised within a process; give each writing process its own
+    directory if several processes archive at the same time.
+    """
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_DIR, pack_max_bytes: int = DEFAULT_PACK_MAX_BYTES):
+        """
+        Args:
+            directory (str): Folder holding index.bin and the pack-*.dat files.
+            pack_max_bytes (int): Size after which a new pack file is started.
+        """
+        self.directory = directory
+        self.pack_max_bytes = pack_max_bytes
+        self.index_path = os.path.join(directory, "index.bin")
+        os.makedirs(directory, exist_ok=True)
+        open(self.index_path, "ab").close()
+        self._lock = threading.RLock()
+        self._entries = {}        # (endpoint, match_id) -> (codec, pack, offset, length)
+        self._indexed_bytes = 0   # Part of index.bin already loaded into _entries
+        self._packs = {}          # pack number -> open read handle
+        self._active_pack = 0     # Highest pack number in the index: the one put() appends to
+        self._active_size = 0     # Bytes of _active_pack referenced by the index
+        self._compressor = zstandard.ZstdCompressor(level=10) if zstandard else None
+        self._decompressor = zstandard.ZstdDecompressor() if zstandard else None
+        self._refresh()
+
+    def _pack_path(self, pack: int) -> str:
+        return os.path.join(self.directory, f"pack-{pack:05d}.dat")
+
+    def _refresh(self):
+        """Loads index records appended since the last refresh (by any process)."""
+        with self._lock:
+            size = os.path.getsize(self.index_path)
+            size -= size % INDEX_RECORD.size   # Ignore a record still being written
+            if size <= self._indexed_bytes:
+                return
+            with open(self.index_path, "rb") as f:
+                f.seek(self._indexed_bytes)
+                records = f.read(size - self._indexed_bytes)
+            for raw_id, endpoint, codec, pack, pack_offset, length in INDEX_RECORD.iter_unpack(records):
+                self._entries[(endpoint, raw_id.rstrip(b"\0").decode("ascii"))] = (codec, pack, pack_offset, length)
+                if pack > self._active_pack:
+                    self._active_pack, self._active_size = pack, 0
+                if pack == self._active_pack:
+                    self._active_size = max(self._active_size, pack_offset + length)
+            self._indexed_bytes = size
+
+    def _compress(self, data: bytes):
+        global _zlib_warned
+        if self._compressor is not None:
+            return CODEC_ZSTD, self._compressor.compress(data)
+        if not _zlib_warned:
+            _zlib_warned = True
+            print(" WARNING: zstandard is not installed; archiving payloads with zlib (larger, slower to read)")
+        return CODEC_ZLIB, zlib.compress(data, 6)
+
+    def _decompress(self, codec: int, blob: bytes) -> bytes:
+        if codec == CODEC_ZSTD:
+            if self._decompressor is None:
+                raise RuntimeError("Archive entry is zstd-compressed; install zstandard to read it")
+            return self._decompressor.decompress(blob)
+        return zlib.decompress(blob)
+
+    def contains(self, endpoint: str, match_id: str) -> bool:
+        key = (ENDPOINTS[endpoint], match_id)
+        if key not in self._entries:
+            self._refresh()
+        return key in self._entries
+
+    def get(self, endpoint: str, match_id: str):
+        """
+        Returns the archived payload, or None if the match was never archived.
+
+        Args:
+            endpoint (str): Payload type ("match" or "timeline").
+            match_id (str): Match ID (e.g. "EUW1_7313131872").
+        """
+        key = (ENDPOINTS[endpoint], match_id)
+        with self._lock:
+            if key not in self._entries:
+                self._refresh()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            codec, pack, offset, length = entry
+            handle = self._packs.get(pack)
+            if handle is None:
+                handle = self._packs[pack] = open(self._pack_path(pack), "rb")
+            handle.seek(offset)
+            blob = handle.read(length)
+        return loads(self._decompress(codec, blob))
+
+    def put(self, endpoint: str, match_id: str, payload: dict) -> bool:
+        """
+        Appends a payload to the current pack file.
+
+        Returns:
+            bool: True if it was written, False if the match was already archived.
+        """
+        raw_id = match_id.encode("ascii")
+        if len(raw_id) > 32:
+            raise ValueError(f"Match ID too long for the archive index: {match_id}")
+        codec, blob = self._compress(dumps(payload))
+        with self._lock:
+            if self.contains(endpoint, match_id):
+                return False
+            pack = self._active_pack
+            if self._active_size and self._active_size + len(blob) > self.pack_max_bytes:
+                pack += 1
+            path = self._pack_path(pack)
+            # Payload first, index last: a crash in between only leaves unreferenced bytes
+            with open(path, "ab") as f:
+                offset = f.tell()
+                f.write(blob)
+            with open(self.index_path, "ab") as f:
+                f.write(INDEX_RECORD.pack(raw_id, ENDPOINTS[endpoint], codec, pack, offset, len(blob)))
+            self._refresh()
+            return True
+
+    def match_ids(self, endpoint: str) -> list:
+        """Every archived match ID for one endpoint, in archive order."""
+        self._refresh()
+        code = ENDPOINTS[endpoint]
+        return [match_id for e, match_id in self._entries if e == code]
+
+    def close(self):
+        with self._lock:
+            for handle in self._packs.values():
+                handle.close()
+            self._packs.clear()
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_payload_archive():
+    """
+    Returns the process-wide PayloadArchive, or None if archiving is disabled
+    (PAYLOAD_ARCHIVE_DIR unset or empty, the default). A relative directory is
+    resolved against the project root.
+    """
+    global _archive
+    directory = os.getenv("PAYLOAD_ARCHIVE_DIR", "")
+    if not directory:
+        return None
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = PayloadArchive(project_path(directory))
+    return _archive
@@ -0,0 +1,204 @@
+# src/utils/rate_ledger.py
+import os
+import sqlite3
+import threading
+import time
+from src.utils.paths import project_path
+from src.utils.rate_limiter import DEFAULT_APP_LIMITS, WINDOW_MARGIN_SECONDS, parse_rate_header
+
+# Shared ledger location (override in .env; set it empty to keep rate state per process).
+# Anchored to the project root so every process on the host finds the same file.
+DEFAULT_LEDGER_PATH = project_path(os.path.join("data", "cache", "rate_ledger.sqlite3"))
+
+# Grants older than this are never needed again (longest Riot window is 10 minutes)
+GRANT_RETENTION_SECONDS = 3600
+
+
+class SharedRateLimiter:
+    """
+    Multi-window rate limiter whose ledger lives in a SQLite file.
+
+    Same interface as RateLimiter, but every permit is granted inside an
+    exclusive SQLite transaction, so Streamlit sessions, pipeline workers and
+    cron jobs on the same host all draw from one budget instead of each
+    assuming they own the whole app limit. Like RateWindow, grants are kept
+    WINDOW_MARGIN_SECONDS past their window.
+    """
+
+    def __init__(self, path: str = DEFAULT_LEDGER_PATH, namespace: str = "default",
+                 app_limits: list = None):
+        """
+        Args:
+            path (str): SQLite file shared by every process.
+            namespace (str): Separate budget inside the same file (e.g. per API key).
+            app_limits (list): App limits assumed until a response reports the real ones.
+        """
+        self.path = path
+        self.namespace = namespace
+        self.default_app_limits = app_limits or DEFAULT_APP_LIMITS
+        self._local = threading.local()
+        self._last_prune = 0.0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                scope TEXT NOT NULL,
+                seconds INTEGER NOT NULL,
+                max_count INTEGER NOT NULL,
+                PRIMARY KEY (scope, seconds)
+            )
+        """)
+        conn.execute("CREATE TABLE IF NOT EXISTS rate_grants (scope TEXT NOT NULL, ts REAL NOT NULL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_rate_grants_scope_ts ON rate_grants (scope, ts)")
+        conn.execute("CREATE TABLE IF NOT EXISTS rate_blocks (scope TEXT PRIMARY KEY, until REAL NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _scopes(self, method: str) -> list:
+        return [f"{self.namespace}:app", f"{self.namespace}:method:{method}"]
+
+    def _limits(self, conn, method: str) -> list:
+        """Returns [(scope, count, seconds), ...] for the app and this method."""
+        app_scope, method_scope = self._scopes(method)
+        rows = conn.execute(
+            "SELECT scope, max_count, seconds FROM rate_limits WHERE scope IN (?, ?)", (app_scope, method_scope)
+        ).fetchall()
+        if not any(scope == app_scope for scope, _, _ in rows):
+            rows += [(app_scope, count, seconds) for count, seconds in self.default_app_limits]
+        return rows
+
+    @staticmethod
+    def _used(conn, scope: str, seconds: int, now: float) -> int:
+        """Grants of `scope` still inside a `seconds` window (plus the margin)."""
+        return conn.execute(
+            "SELECT COUNT(*) FROM rate_grants WHERE scope = ? AND ts > ?", (scope, now - seconds - WINDOW_MARGIN_SECONDS)
+        ).fetchone()[0]
+
+    def _delay(self, conn, method: str, now: float) -> float:
+        delay = 0.0
+        for scope, count, seconds in self._limits(conn, method):
+            # Timestamp of the grant that has to expire before one more request fits
+            row = conn.execute(
+                "SELECT ts FROM rate_grants WHERE scope = ? AND ts > ? ORDER BY ts DESC LIMIT 1 OFFSET ?",
+                (scope, now - seconds - WINDOW_MARGIN_SECONDS, count - 1)
+            ).fetchone()
+            if row is not None:
+                delay = max(delay, row[0] + seconds + WINDOW_MARGIN_SECONDS - now)
+        row = conn.execute(
+            "SELECT MAX(until) FROM rate_blocks WHERE scope IN (?, ?)", tuple(self._scopes(method))
+        ).fetchone()
+        if row[0] is not None:
+            delay = max(delay, row[0] - now)
+        return delay
+
+    def _prune(self, conn, now: float):
+        if now - self._last_prune > 60:
+            conn.execute("DELETE FROM rate_grants WHERE ts < ?", (now - GRANT_RETENTION_SECONDS,))
+            conn.execute("DELETE FROM rate_blocks WHERE until < ?", (now,))
+            self._last_prune = now
+
+    def try_acquire(self, method: str) -> float:
+        """
+        Takes a permit for `method` if one is available right now.
+
+        Returns:
+            float: 0 if the permit was taken, otherwise seconds until one frees up.
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")  # Exclusive across every process using the file
+        try:
+            now = time.time()
+            self._prune(conn, now)
+            delay = self._delay(conn, method, now)
+            if delay <= 0:
+                conn.executemany("INSERT INTO rate_grants (scope, ts) VALUES (?, ?)",
+                                 [(scope, now) for scope in self._scopes(method)])
+            conn.execute("COMMIT")
+            return max(0.0, delay)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def acquire(self, method: str) -> float:
+        """Blocks until a request for `method` is allowed, then records it."""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(method)
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def wait_time(self, method: str) -> float:
+        """Seconds the next request for `method` would have to wait."""
+        return max(0.0, self._delay(self._conn(), method, time.time()))
+
+    def remaining(self, method: str) -> int:
+        """Requests for `method` that fit right now across every window."""
+        conn = self._conn()
+        now = time.time()
+        if self._delay(conn, method, now) > 0:
+            return 0
+        remaining = []
+        for scope, count, seconds in self._limits(conn, method):
+            used = self._used(conn, scope, seconds, now)
+            remaining.append(max(0, count - used))
+        return min(remaining, default=0)
+
+    def block(self, seconds: float, method: str = None):
+        """Stops handing out permits for `seconds`; method=None blocks the whole app."""
+        app_scope, method_scope = self._scopes(method)
+        scope = method_scope if method else app_scope
+        until = time.time() + seconds
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO rate_blocks (scope, until) VALUES (?, ?) "
+            "ON CONFLICT (scope) DO UPDATE SET until = MAX(until, excluded.until)", (scope, until)
+        )
+
+    def update_from_headers(self, method: str, headers):
+        """Refreshes shared limits and counts from a Riot response's headers."""
+        app_scope, method_scope = self._scopes(method)
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            for scope, limit_header, count_header in (
+                (app_scope, "X-App-Rate-Limit", "X-App-Rate-Limit-Count"),
+                (method_scope, "X-Method-Rate-Limit", "X-Method-Rate-Limit-Count"),
+            ):
+                limits = parse_rate_header(headers.get(limit_header))
+                if limits:
+                    conn.execute("DELETE FROM rate_limits WHERE scope = ?", (scope,))
+                    conn.executemany("INSERT INTO rate_limits (scope, seconds, max_count) VALUES (?, ?, ?)",
+                                     [(scope, seconds, count) for count, seconds in limits])
+                # Riot has seen more requests than the ledger holds: pad so nobody over-sends
+                for count, seconds in parse_rate_header(headers.get(count_header)):
+                    logged = self._used(conn, scope, seconds, now)
+                    if count > logged:
+                        conn.executemany("INSERT INTO rate_grants (scope, ts) VALUES (?, ?)",
+                                         [(scope, now)] * (count - logged))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def snapshot(self, method: str) -> list:
+        """Per-window usage for display, in the same shape as RateLimiter.snapshot."""
+        conn = self._conn()
+        now = time.time()
+        rows = []
+        for scope, count, seconds in self._limits(conn, method):
+            used = self._used(conn, scope, seconds, now)
+            kind = "app" if scope.endswith(":app") else "method"
+            rows.append({"scope": kind, "used": min(used, count), "max": count, "seconds": seconds})
+        return rows
@@ -0,0 +1,247 @@
+# src/utils/rate_limiter.py
+import os
+import threading
+import time
+from collections import deque
+from src.utils.paths import project_path
+
+# Riot development key limits, used until the first response tells us the real ones
+DEFAULT_APP_LIMITS = [(20, 1), (100, 120)]
+
+# Grants are stamped when the permit is issued but Riot counts a request when it
+# arrives, so a grant is kept this much longer than its window: otherwise a
+# request that travels faster than the one it replaces lands inside the
+# server's window at every rollover
+WINDOW_MARGIN_SECONDS = 0.25
+
+
+def parse_rate_header(value: str) -> list:
+    """
+    Parses a Riot rate-limit header into (count, window_seconds) pairs.
+
+    Works for both limit headers ("20:1,100:120") and count headers ("3:1,41:120").
+
+    Args:
+        value (str): Raw header value.
+
+    Returns:
+        list: [(int, int), ...] sorted by window length, empty if the header is missing.
+    """
+    pairs = []
+    for part in (value or "").split(","):
+        count, _, window = part.strip().partition(":")
+        if count.isdigit() and window.isdigit():
+            pairs.append((int(count), int(window)))
+    return sorted(pairs, key=lambda p: p[1])
+
+
+class RateWindow:
+    """
+    Sliding-window log for one Riot limit (e.g. 100 requests per 120 seconds).
+
+    Grants expire WINDOW_MARGIN_SECONDS after the window itself (see there).
+    """
+
+    def __init__(self, limit: int, seconds: int, margin: float = WINDOW_MARGIN_SECONDS):
+        self.limit = limit
+        self.seconds = seconds
+        self.margin = margin
+        self.timestamps = deque()
+
+    def _expire(self, now: float):
+        while self.timestamps and self.timestamps[0] <= now - self.seconds - self.margin:
+            self.timestamps.popleft()
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one more request fits in this window (0 if it fits now)."""
+        self._expire(now)
+        if len(self.timestamps) < self.limit:
+            return 0.0
+        return self.timestamps[len(self.timestamps) - self.limit] + self.seconds + self.margin - now
+
+    def remaining(self, now: float) -> int:
+        self._expire(now)
+        return max(0, self.limit - len(self.timestamps))
+
+    def record(self, now: float):
+        self.timestamps.append(now)
+
+    def sync(self, server_count: int, now: float):
+        """
+        Reconciles our log with the count Riot reports.
+
+        If the server has seen more requests than we logged (another process, an
+        earlier run, or requests still in flight elsewhere), pad the log so we
+        don't hand out permits the server will reject.
+        """
+        self._expire(now)
+        missing = server_count - len(self.timestamps)
+        for _ in range(missing):
+            self.timestamps.append(now)
+
+
+class RateLimiter:
+    """
+    Multi-window rate limiter for the Riot API.
+
+    Keeps one sliding window per app limit and per method limit, as advertised by
+    X-App-Rate-Limit / X-Method-Rate-Limit, and blocks callers only as long as the
+    tightest window actually requires.
+    """
+
+    def __init__(self, app_limits: list = None):
+        """
+        Args:
+            app_limits (list): Initial [(count, seconds), ...] app limits.
+        """
+        self._lock = threading.Lock()
+        self.app_windows = [RateWindow(c, s) for c, s in (app_limits or DEFAULT_APP_LIMITS)]
+        self.method_windows = {}
+        self.blocked_until = {}   # scope (None = whole app, or a method) -> monotonic time
+
+    def _blocked_for(self, method: str, now: float) -> float:
+        return max(self.blocked_until.get(None, 0.0), self.blocked_until.get(method, 0.0)) - now
+
+    def block(self, seconds: float, method: str = None):
+        """
+        Stops handing out permits for `seconds` (e.g. after a 429 with Retry-After).
+
+        Args:
+            seconds (float): How long to block.
+            method (str): Block only this method; None blocks the whole app.
+        """
+        until = time.monotonic() + seconds
+        with self._lock:
+            self.blocked_until[method] = max(self.blocked_until.get(method, 0.0), until)
+
+    def _windows_for(self, method: str) -> list:
+        return self.app_windows + self.method_windows.get(method, [])
+
+    def wait_time(self, method: str) -> float:
+        """Seconds the next request for `method` would have to wait."""
+        now = time.monotonic()
+        with self._lock:
+            return max([w.wait_time(now) for w in self._windows_for(method)] + [self._blocked_for(method, now), 0.0])
+
+    def remaining(self, method: str) -> int:
+        """Requests for `method` that fit right now across every window."""
+        now = time.monotonic()
+        with self._lock:
+            if self._blocked_for(method, now) > 0:
+                return 0
+            return min((w.remaining(now) for w in self._windows_for(method)), default=0)
+
+    def try_acquire(self, method: str) -> float:
+        """
+        Takes a permit for `method` if one is available right now.
+
+        Returns:
+            float: 0 if the permit was taken, otherwise seconds until one frees up.
+        """
+        now = time.monotonic()
+        with self._lock:
+            windows = self._windows_for(method)
+            delay = max([w.wait_time(now) for w in windows] + [self._blocked_for(method, now), 0.0])
+            if delay <= 0:
+                for w in windows:
+                    w.record(now)
+            return delay
+
+    def acquire(self, method: str) -> float:
+        """
+        Blocks until a request for `method` is allowed, then records it.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(method)
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def update_from_headers(self, method: str, headers):
+        """
+        Refreshes limits and counts from a Riot response's headers.
+
+        Args:
+            method (str): Method bucket the request belonged to (e.g. "match").
+            headers (Mapping): Response headers.
+        """
+        now = time.monotonic()
+        with self._lock:
+            app_limits = parse_rate_header(headers.get("X-App-Rate-Limit"))
+            if app_limits:
+                self.app_windows = self._resize(self.app_windows, app_limits)
+            method_limits = parse_rate_header(headers.get("X-Method-Rate-Limit"))
+            if method_limits:
+                self.method_windows[method] = self._resize(self.method_windows.get(method, []), method_limits)
+
+            self._sync(self.app_windows, parse_rate_header(headers.get("X-App-Rate-Limit-Count")), now)
+            self._sync(self.method_windows.get(method, []), parse_rate_header(headers.get("X-Method-Rate-Limit-Count")), now)
+
+    @staticmethod
+    def _resize(windows: list, limits: list) -> list:
+        """Rebuilds the window list for new limits, keeping logs of windows that still exist."""
+        existing = {w.seconds: w for w in windows}
+        resized = []
+        for count, seconds in limits:
+            window = existing.get(seconds) or RateWindow(count, seconds)
+            window.limit = count
+            resized.append(window)
+        return resized
+
+    @staticmethod
+    def _sync(windows: list, counts: list, now: float):
+        by_seconds = {w.seconds: w for w in windows}
+        for count, seconds in counts:
+            if seconds in by_seconds:
+                by_seconds[seconds].sync(count, now)
+
+    def snapshot(self, method: str) -> list:
+        """
+        Returns per-window usage for display.
+
+        Returns:
+            list: [{'scope': 'app'|'method', 'used': int, 'max': int, 'seconds': int}, ...]
+        """
+        now = time.monotonic()
+        with self._lock:
+            rows = []
+            for scope, windows in (("app", self.app_windows), ("method", self.method_windows.get(method, []))):
+                for w in windows:
+                    rows.append({"scope": scope, "used": w.limit - w.remaining(now), "max": w.limit, "seconds": w.seconds})
+            return rows
+
+
+def summarize_rate_headers(headers) -> dict:
+    """
+    Collapses Riot's app rate-limit headers to the most utilised window.
+
+    Returns:
+        dict: {'used': int, 'max': int} for the window closest to its limit.
+    """
+    limits = dict((s, c) for c, s in parse_rate_header(headers.get("X-App-Rate-Limit")))
+    counts = dict((s, c) for c, s in parse_rate_header(headers.get("X-App-Rate-Limit-Count")))
+    best = {"used": 0, "max": 20}
+    for seconds, limit in limits.items():
+        used = counts.get(seconds, 0)
+        if used / limit >= best["used"] / best["max"]:
+            best = {"used": used, "max": limit}
+    return best
+
+
+def create_limiter(namespace: str = "default"):
+    """
+    Builds the limiter for one rate budget (one API key).
+
+    By default the budget is shared with every other process on the host through
+    a SQLite ledger (RIOT_RATE_LEDGER_PATH, relative to the project root). Set
+    RIOT_RATE_LEDGER_PATH to an empty value to keep rate state in memory for this
+    process only.
+    """
+    from src.utils.rate_ledger import SharedRateLimiter, DEFAULT_LEDGER_PATH  # Avoids a circular import
+    path = os.getenv("RIOT_RATE_LEDGER_PATH", DEFAULT_LEDGER_PATH)
+    return SharedRateLimiter(project_path(path), namespace=namespace) if path else RateLimiter()
@@ -1,60 +1,53 @@
 # src/utils/rate_tracker.py
-import streamlit as st
+import threading
 import time
 from datetime import datetime
+from src.api.key_pool import get_key_pool
+
+# Headless rate state: a plain process-wide dict, so CLI runs, worker threads and
+# tests share it without Streamlit. The Streamlit app reads it through
+# streamlit_app/components/rate_limits.py.
+API_TYPES = ['account', 'match', 'match_history', 'timeline']
+
+_rate_limits = {}
+_rate_lock = threading.Lock()
 
 def init_rate_tracker():
-    """Initialize rate limit tracker in session state."""
-    if 'rate_limits' not in st.session_state:
-        st.session_state.rate_limits = {
-            'account': {'used': 0, 'max': 20, 'last_update': time.time()},
-            'match': {'used': 0, 'max': 20, 'last_update': time.time()},
-            'match_history': {'used': 0, 'max': 20, 'last_update': time.time()},
-            'timeline': {'used': 0, 'max': 20, 'last_update': time.time()}
-        }
+    """Initialize rate limit tracker state."""
+    with _rate_lock:
+        for api_type in API_TYPES:
+            _rate_limits.setdefault(api_type, {'used': 0, 'max': 20, 'last_update': time.time()})
 
 def update_rate_limit(api_type, used_count, max_count):
     """Update rate limit information for a specific API type."""
-    init_rate_tracker()
-    
-    st.session_state.rate_limits[api_type] = {
-        'used': used_count,
-        'max': max_count,
-        'last_update': time.time(),
-        'updated_at': datetime.now().strftime("%H:%M:%S")
-    }
+    with _rate_lock:
+        _rate_limits[api_type] = {
+            'used': used_count,
+            'max': max_count,
+            'last_update': time.time(),
+            'updated_at': datetime.now().strftime("%H:%M:%S")
+        }
 
 def get_rate_limit_info(api_type):
     """Get current rate limit information for an API type."""
     init_rate_tracker()
-    return st.session_state.rate_limits.get(api_type, {'used': 0, 'max': 20})
+    with _rate_lock:
+        return dict(_rate_limits.get(api_type, {'used': 0, 'max': 20}))
 
-def check_rate_limit(api_type, threshold=0.8):
+def get_all_rate_limits():
+    """Get a snapshot of rate limit information for every API type."""
+    init_rate_tracker()
+    with _rate_lock:
+        return {api_type: dict(info) for api_type, info in _rate_limits.items()}
+
+def check_rate_limit(api_type, threshold=0.8, region=None):
     """
-    Check if we're approaching rate limit and return recommended sleep time.
+    Check how long the next request for api_type on `region` has to wait.
+
+    Backed by the multi-window rate limiters of every active API key, so this
+    covers every app and method window Riot advertises.
+    `threshold` is kept for backward compatibility and is no longer used.
+
     Returns: sleep_time (0 if no sleep needed)
     """
-    info = get_rate_limit_info(api_type)
-    remaining = info['max'] - info['used']
-    
-    if info['used'] >= (info['max'] * threshold):
-        return 10  # Long sleep if close to limit
-    elif remaining <= 3:
-        return 2   # Short sleep if very few left
-    elif remaining <= 5:
-        return 1   # Brief pause if getting low
-    return 0       # No sleep needed
-
-def display_rate_limits():
-    """Display current rate limits in Streamlit sidebar."""
-    init_rate_tracker()
-    
-    st.sidebar.subheader("📊 API Rate Limits")
-    for api_type, info in st.session_state.rate_limits.items():
-        progress = info['used'] / info['max']
-        color = "red" if progress > 0.8 else "orange" if progress > 0.6 else "green"
-        
-        st.sidebar.progress(
-            progress, 
-            text=f"{api_type.upper()}: {info['used']}/{info['max']} (Updated: {info.get('updated_at', 'N/A')})"
-        )
\ No newline at end of file
+    return get_key_pool().wait_time(api_type, region)
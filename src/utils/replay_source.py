@@ -0,0 +1,98 @@
+# src/utils/replay_source.py
+import os
+from src.utils.json_codec import loads
+from src.utils.payload_archive import PayloadArchive
+
+# Rate info attached to replayed payloads, so they look like fetched ones downstream
+REPLAY_RATE_INFO = {"used": 0, "max": 20}
+
+
+class ReplaySource:
+    """
+    Saved match and timeline payloads, read back instead of calling the API.
+
+    `path` is either a PayloadArchive directory (holding index.bin) or a folder
+    laid out like the stub server fixtures:
+
+        <path>/matches/<match_id>.json
+        <path>/timelines/<match_id>.json
+
+    Nothing here touches the network or needs an API key.
+    """
+
+    def __init__(self, path: str):
+        if not os.path.isdir(path):
+            raise ValueError(f" ERROR: Replay source '{path}' is not a directory")
+        self.path = path
+        self.archive = PayloadArchive(path) if os.path.exists(os.path.join(path, "index.bin")) else None
+        self._players = None   # puuid -> [(gameCreation, match_id), ...]
+        self._riot_ids = None  # (game_name, tag_line) lowercased -> puuid
+
+    def _file(self, kind: str, match_id: str) -> str:
+        return os.path.join(self.path, kind, f"{match_id}.json")
+
+    def match_ids(self) -> list:
+        """Every match ID with stored match details."""
+        if self.archive is not None:
+            return self.archive.match_ids("match")
+        folder = os.path.join(self.path, "matches")
+        if not os.path.isdir(folder):
+            return []
+        return [name[:-5] for name in sorted(os.listdir(folder)) if name.endswith(".json")]
+
+    def get(self, endpoint: str, match_id: str):
+        """Returns the stored payload ("match" or "timeline"), or None."""
+        if self.archive is not None:
+            return self.archive.get(endpoint, match_id)
+        path = self._file("matches" if endpoint == "match" else "timelines", match_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return loads(f.read())
+
+    def _build_index(self):
+        """One pass over every stored match: who played it, and when."""
+        players, riot_ids = {}, {}
+        for match_id in self.match_ids():
+            info = (self.get("match", match_id) or {}).get("info", {})
+            created = info.get("gameCreation", 0)
+            for p in info.get("participants", []):
+                puuid = p.get("puuid")
+                if not puuid:
+                    continue
+                players.setdefault(puuid, []).append((created, match_id))
+                if p.get("riotIdGameName") and p.get("riotIdTagline"):
+                    riot_ids[(p["riotIdGameName"].lower(), p["riotIdTagline"].lower())] = puuid
+        self._players, self._riot_ids = players, riot_ids
+
+    def find_puuid(self, game_name: str, tag_line: str) -> str:
+        """Looks a Riot ID up in the stored participants; None if it never appears."""
+        if self._riot_ids is None:
+            self._build_index()
+        return self._riot_ids.get((game_name.lower(), tag_line.lower()))
+
+    def match_ids_for(self, puuid: str, max_matches: int = None) -> list:
+        """The player's stored match IDs, newest first."""
+        if self._players is None:
+            self._build_index()
+        games = sorted(self._players.get(puuid, []), reverse=True)
+        return [match_id for _, match_id in games[:max_matches]]
+
+    def load(self, match_ids: list, include_details: bool = True, include_timeline: bool = True):
+        """
+        Reads payloads in the shape fetch_match_and_timeline_data returns.
+
+        Returns:
+            tuple: (match_datas, timeline_datas), lists of (data, rate_info) tuples.
+        """
+        match_datas, timeline_datas = [], []
+        for match_id in match_ids:
+            if include_details:
+                data = self.get("match", match_id)
+                if data:
+                    match_datas.append((data, REPLAY_RATE_INFO))
+            if include_timeline:
+                data = self.get("timeline", match_id)
+                if data and data.get("info", {}).get("frames"):
+                    timeline_datas.append((data, REPLAY_RATE_INFO))
+        return match_datas, timeline_datas
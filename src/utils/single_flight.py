@@ -0,0 +1,64 @@
+# src/utils/single_flight.py
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.shared = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; anyone asking for the same key
+    while it is in flight waits and receives the same result (or exception).
+    Once the call finishes the key is released, so later calls run again
+    (pair this with a cache for results that should be reused indefinitely).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.coalesced = 0   # Calls answered by someone else's in-flight request
+
+    def do(self, key, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) once per in-flight key and shares the result.
+
+        Args:
+            key: Hashable identity of the work (e.g. a match ID).
+            fn (callable): Work to run if nobody else is already running it.
+
+        Returns:
+            Whatever fn returns.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.shared += 1
+                self.coalesced += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
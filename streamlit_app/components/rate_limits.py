@@ -0,0 +1,23 @@
+"""
+Streamlit adapter for the headless API/rate-state layer.
+"""
+
+import streamlit as st
+from src.api.get_puuid import get_puuid
+from src.utils.rate_tracker import get_all_rate_limits
+
+@st.cache_data(ttl=3600)  # Cache for 1 hour
+def cached_get_puuid(region: str, game_name: str, tag_line: str):
+    """get_puuid cached per Streamlit server, so page reruns don't hit the API."""
+    return get_puuid(region, game_name, tag_line)
+
+def display_rate_limits():
+    """Display current rate limits in Streamlit sidebar."""
+    st.sidebar.subheader("📊 API Rate Limits")
+    for api_type, info in get_all_rate_limits().items():
+        progress = min(1.0, info['used'] / info['max'])
+
+        st.sidebar.progress(
+            progress,
+            text=f"{api_type.upper()}: {info['used']}/{info['max']} (Updated: {info.get('updated_at', 'N/A')})"
+        )
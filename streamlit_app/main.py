@@ -5,7 +5,8 @@ import os
 # Add src to path so we can import your modules
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.utils.rate_tracker import init_rate_tracker, display_rate_limits
+from src.utils.rate_tracker import init_rate_tracker
+from streamlit_app.components.rate_limits import display_rate_limits
 
 # Initialize rate tracker
 init_rate_tracker()
@@ -1,5 +1,6 @@
 import streamlit as st
 from src.data.manager import ensure_player_data
+from src.api.scheduler import request_priority, INTERACTIVE
 
 def main():
     st.title("📥 Get Player Data")
@@ -7,13 +8,15 @@ def main():
     
     game_name = st.text_input("Game Name", placeholder="Nakla")
     tag_line = st.text_input("Tag Line", placeholder="EUW")
-    region = st.selectbox("Region", ["europe", "americas", "asia"])
+    region = st.selectbox("Region", ["europe", "americas", "asia", "sea"])
     max_matches = st.slider("Matches to fetch", 10, 500, 100)
     
     if st.button("Collect Data") and game_name and tag_line:
         with st.spinner(f"Fetching {max_matches} matches from Riot API..."):
             try:
-                ensure_player_data(region, game_name, tag_line, max_matches)
+                # A coach is waiting on this: jump ahead of any background backfill
+                with request_priority(INTERACTIVE):
+                    ensure_player_data(region, game_name, tag_line, max_matches)
                 
                 # ✅ STEP 1: STORE PLAYER IN SESSION STATE
                 st.session_state.current_player = {
@@ -5,7 +5,7 @@ from src.analytics.player_analytics import (
     get_winrate_by_role,
     get_player_average_kda
 )
-from src.api.get_puuid import get_puuid
+from streamlit_app.components.rate_limits import cached_get_puuid
 from streamlit_app.components.charts.overview_charts import win_rate_metrics, side_performance_chart, role_performance_chart
 
 def main():
@@ -22,7 +22,7 @@ def main():
     st.success(f"📊 Analyzing: {player['game_name']}#{player['tag_line']}")
     
     # Get PUUID for analytics
-    puuid, _ = get_puuid(player['region'], player['game_name'], player['tag_line'])
+    puuid, _ = cached_get_puuid(player['region'], player['game_name'], player['tag_line'])
     
     # SECTION 1: Overall Performance
     st.header("🎯 Overall Performance")
@@ -7,6 +7,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from src.utils.rate_tracker import get_rate_limit_info
+from src.api.telemetry import get_telemetry
 
 st.title("⚙️ API Status & Rate Limits")
 
@@ -28,6 +29,34 @@ for api_type in api_types:
         progress = info['used'] / info['max']
         st.progress(progress, text=f"{progress:.0%} utilized")
 
+# Request telemetry since the app started
+st.header("Request Telemetry")
+
+telemetry = get_telemetry().summary()
+if telemetry["endpoints"]:
+    rows = []
+    for endpoint, info in sorted(telemetry["endpoints"].items()):
+        rows.append({
+            "Endpoint": endpoint,
+            "Calls": info["calls"],
+            "Retries": info["retries"],
+            "MB": round(info["bytes"] / 1e6, 2),
+            "Latency p50 (ms)": info["latency"]["p50_ms"],
+            "Latency p95 (ms)": info["latency"]["p95_ms"],
+            "Rate wait mean (ms)": info["rate_wait"]["mean_ms"],
+            "Rate wait p95 (ms)": info["rate_wait"]["p95_ms"],
+            "Statuses": ", ".join(f"{s}: {n}" for s, n in sorted(info["statuses"].items())),
+        })
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    # High rate wait = rate-limit bound; high latency = network bound; big processing stages = CPU bound
+    if telemetry["stages"]:
+        cols = st.columns(len(telemetry["stages"]))
+        for col, (stage, seconds) in zip(cols, sorted(telemetry["stages"].items())):
+            col.metric(label=stage.replace("_", " ").title(), value=f"{seconds:.1f}s")
+else:
+    st.caption("No API requests made in this session yet.")
+
 # Refresh button
 if st.button("🔄 Refresh Rate Limits"):
     st.rerun()
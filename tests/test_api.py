@@ -4,7 +4,6 @@ from src.api.get_match_history import get_match_history
 from src.api.get_match_details import get_match_details
 from src.api.get_match_timeline import get_match_timeline
 from src.utils.rate_tracker import init_rate_tracker, get_rate_limit_info
-import streamlit as st
 
 class TestRiotAPI(unittest.TestCase):
 
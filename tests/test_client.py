@@ -0,0 +1,81 @@
+import os
+import unittest
+from unittest import mock
+from src.api.client import RiotClient
+from src.api.key_pool import FORBIDDEN_ENDPOINTS_TO_DISABLE
+from src.api.retry import RetryPolicy
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b"{}"
+        self.ok = status_code < 400
+
+class FakeSession:
+    """Answers with responder(key, url) and records which key sent each request."""
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None, headers=None):
+        key = headers["X-Riot-Token"]
+        self.calls.append((key, url))
+        return self.responder(key, url)
+
+class TestRiotClient(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ, {"RIOT_RATE_LEDGER_PATH": ""})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = RiotClient(api_keys=["key-a", "key-b"], retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01))
+
+    def use(self, responder):
+        self.client.session = FakeSession(responder)
+        return self.client.session
+
+    def key(self, name):
+        return next(k for k in self.client.key_pool.keys if k.key == name)
+
+    def test_401_disables_key_and_retries_with_another(self):
+        """Test a 401 drops the key at once and the request succeeds on the other key"""
+        session = self.use(lambda key, url: FakeResponse(401 if key == "key-a" else 200))
+        for _ in range(3):
+            self.assertEqual(self.client.get("http://stub/match", method="match").status_code, 200)
+        self.assertFalse(self.key("key-a").active)
+        self.assertTrue(self.key("key-b").active)
+        self.assertEqual(sum(1 for key, _ in session.calls if key == "key-a"), 1)
+
+    def test_403_on_one_endpoint_keeps_key(self):
+        """Test repeated 403s from a single endpoint don't take a healthy key out of the pool"""
+        self.use(lambda key, url: FakeResponse(403 if url.endswith("/forbidden") else 200))
+        for _ in range(10):
+            self.assertEqual(self.client.get("http://stub/forbidden", method="forbidden").status_code, 403)
+        self.assertEqual(len(self.client.key_pool.active_keys()), 2)
+
+    def test_403_on_several_endpoints_disables_key(self):
+        """Test a key refused on several different endpoints is dropped and the request retried"""
+        self.use(lambda key, url: FakeResponse(403 if key == "key-a" else 200))
+        for i in range(FORBIDDEN_ENDPOINTS_TO_DISABLE * 2):
+            self.client.get(f"http://stub/endpoint{i}", method=f"endpoint{i}")
+        self.assertFalse(self.key("key-a").active)
+        self.assertEqual(self.client.get("http://stub/endpoint0", method="endpoint0").status_code, 200)
+
+    def test_429_blocks_scope_by_rate_limit_type(self):
+        """Test only an application 429 blocks the app lane; method, service and untyped 429s block the method"""
+        self.client.key_pool.keys = self.client.key_pool.keys[:1]
+        limiter = self.client.key_pool.keys[0].limiter_for(None)
+        for limit_type in ("application", "method", "service", None):
+            headers = {"Retry-After": "0"}
+            if limit_type:
+                headers["X-Rate-Limit-Type"] = limit_type
+            self.use(lambda key, url, headers=headers: FakeResponse(429, headers))
+            with mock.patch.object(limiter, "block") as block:
+                self.client.get("http://stub/match", method="match")
+            scopes = {call.args[1] for call in block.call_args_list}
+            self.assertEqual(scopes, {None} if limit_type == "application" else {"match"}, limit_type)
+
+if __name__ == "__main__":
+    unittest.main()
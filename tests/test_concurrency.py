@@ -0,0 +1,55 @@
+import unittest
+from src.utils.concurrency import AimdController, adaptive_concurrency, observe_response
+
+HEALTHY = {"X-App-Rate-Limit": "20:1,100:120", "X-App-Rate-Limit-Count": "2:1,10:120"}
+CROWDED = {"X-App-Rate-Limit": "20:1,100:120", "X-App-Rate-Limit-Count": "19:1,10:120"}
+
+class TestAimdController(unittest.TestCase):
+
+    def test_additive_increase_with_headroom(self):
+        """Test the limit grows about one per round trip while there is headroom"""
+        controller = AimdController(max_limit=8, initial=2)
+        for _ in range(2):
+            controller.on_response(200, 0.05, HEALTHY, "match")
+        self.assertEqual(controller.in_flight_limit, 2)
+        controller.on_response(200, 0.05, HEALTHY, "match")
+        self.assertEqual(controller.in_flight_limit, 3)
+        for _ in range(100):
+            controller.on_response(200, 0.05, HEALTHY, "match")
+        self.assertEqual(controller.in_flight_limit, 8)
+
+    def test_no_increase_without_headroom(self):
+        """Test the limit holds when the tightest app window is nearly full"""
+        controller = AimdController(max_limit=8, initial=4)
+        for _ in range(10):
+            controller.on_response(200, 0.05, CROWDED, "match")
+        self.assertEqual(controller.in_flight_limit, 4)
+
+    def test_multiplicative_decrease_once_per_burst(self):
+        """Test a burst of 429s halves the limit once within the cooldown"""
+        controller = AimdController(max_limit=16, initial=8, cooldown=60)
+        for _ in range(5):
+            controller.on_response(429, 0.05, {}, "match")
+        self.assertEqual(controller.in_flight_limit, 4)
+        self.assertEqual(controller.decreases, 1)
+
+    def test_latency_rise_cuts(self):
+        """Test latency far above the endpoint's baseline counts as congestion"""
+        controller = AimdController(max_limit=16, initial=8)
+        for _ in range(5):
+            controller.on_response(200, 0.05, CROWDED, "timeline")
+        for _ in range(10):
+            controller.on_response(200, 0.5, CROWDED, "timeline")
+        self.assertEqual(controller.in_flight_limit, 4)
+
+    def test_observe_response_uses_context(self):
+        """Test responses only reach the controller inside adaptive_concurrency"""
+        controller = AimdController(max_limit=8, initial=4, cooldown=0)
+        observe_response(429, 0.05)
+        self.assertEqual(controller.in_flight_limit, 4)
+        with adaptive_concurrency(controller):
+            observe_response(429, 0.05)
+        self.assertEqual(controller.in_flight_limit, 2)
+
+if __name__ == "__main__":
+    unittest.main()
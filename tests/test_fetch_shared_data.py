@@ -0,0 +1,75 @@
+import random
+import threading
+import time
+import unittest
+from unittest import mock
+from src.utils import fetch_shared_data
+from src.utils.fetch_shared_data import fetch_match_and_timeline_data
+
+# Matches whose details are missing, whose timeline stays empty, or whose fetch raises
+MISSING_DETAILS = {"EUW1_3", "KR_5"}
+EMPTY_TIMELINE = {"EUW1_4", "EUW1_9"}
+FAILING = {"EUW1_6"}
+
+MATCH_IDS = [f"EUW1_{i}" for i in range(1, 13)] + ["KR_5", "KR_6", "NA1_2"]
+
+class TestFetchMatchAndTimelineData(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(7)
+        self.rng_lock = threading.Lock()
+        client = mock.Mock()
+        client.retry_policy.backoff_delay.return_value = 0
+        patches = [
+            mock.patch.object(fetch_shared_data, "get_match_details", side_effect=self.fake_details),
+            mock.patch.object(fetch_shared_data, "get_match_timeline", side_effect=self.fake_timeline),
+            mock.patch.object(fetch_shared_data, "check_rate_limit", return_value=0),
+            mock.patch.object(fetch_shared_data, "_remaining_budget", return_value=1000),
+            mock.patch.object(fetch_shared_data, "get_client", return_value=client),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def jitter(self):
+        # Random latencies so concurrent fetches complete out of order
+        with self.rng_lock:
+            delay = self.rng.uniform(0, 0.01)
+        time.sleep(delay)
+
+    def fake_details(self, region, match_id):
+        self.jitter()
+        if match_id in FAILING:
+            raise RuntimeError("connection reset")
+        if match_id in MISSING_DETAILS:
+            return None, None
+        return {"metadata": {"matchId": match_id}, "region": region}, {"used": 1, "max": 20}
+
+    def fake_timeline(self, region, match_id):
+        self.jitter()
+        if match_id in EMPTY_TIMELINE:
+            return {"metadata": {"matchId": match_id}, "info": {"frames": []}}, {"used": 1, "max": 20}
+        return {"metadata": {"matchId": match_id}, "info": {"frames": [{"timestamp": 0}]}}, {"used": 1, "max": 20}
+
+    def test_workers_match_sequential_output(self):
+        """Test workers=N returns the same ordered lists as workers=1, failures and empties included"""
+        sequential = fetch_match_and_timeline_data("europe", MATCH_IDS, workers=1)
+        for workers, adaptive in ((4, False), (8, True)):
+            concurrent = fetch_match_and_timeline_data("europe", MATCH_IDS, workers=workers, adaptive=adaptive)
+            self.assertEqual(concurrent, sequential)
+
+        match_ids = [data["metadata"]["matchId"] for data, _ in sequential[0]]
+        timeline_ids = [data["metadata"]["matchId"] for data, _ in sequential[1]]
+        expected = [m for m in MATCH_IDS if m not in FAILING]
+        self.assertEqual(match_ids, [m for m in expected if m not in MISSING_DETAILS])
+        self.assertEqual(timeline_ids, [m for m in expected if m not in EMPTY_TIMELINE])
+        self.assertEqual({data["region"] for data, _ in sequential[0]}, {"europe", "asia", "americas"})
+
+    def test_details_or_timelines_only(self):
+        """Test include_details / include_timeline give the same output on both paths"""
+        for flags in ({"include_timeline": False}, {"include_details": False}):
+            self.assertEqual(fetch_match_and_timeline_data("europe", MATCH_IDS, workers=4, **flags),
+                             fetch_match_and_timeline_data("europe", MATCH_IDS, workers=1, **flags))
+
+if __name__ == "__main__":
+    unittest.main()
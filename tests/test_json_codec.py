@@ -0,0 +1,25 @@
+import unittest
+from unittest import mock
+from src.utils import json_codec
+from src.processing.process_match_timeline_data import iter_events
+
+class TestJsonCodec(unittest.TestCase):
+
+    def test_round_trip_from_bytes(self):
+        """Test payloads survive dumps/loads with and without orjson"""
+        payload = {"metadata": {"matchId": "EUW1_1"}, "info": {"frames": [{"events": [{"type": "PAUSE_END"}]}]}}
+        self.assertEqual(json_codec.loads(json_codec.dumps(payload)), payload)
+        with mock.patch.object(json_codec, "orjson", None):
+            encoded = json_codec.dumps(payload)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(json_codec.loads(encoded), payload)
+
+    def test_iter_events_walks_frames_in_order(self):
+        """Test timeline events are yielded in place without a flattened copy"""
+        frames = [{"events": [{"timestamp": 0}]}, {}, {"events": [{"timestamp": 60000}, {"timestamp": 61000}]}]
+        events = list(iter_events(frames))
+        self.assertEqual([e["timestamp"] for e in events], [0, 60000, 61000])
+        self.assertIs(events[0], frames[0]["events"][0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from src.api.key_pool import ApiKeyPool, FORBIDDEN_ENDPOINTS_TO_DISABLE
+from src.utils.rate_limiter import RateLimiter
+
+class TestApiKeyPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = ApiKeyPool(["RGAPI-a", "RGAPI-b"], limiter_factory=lambda name: RateLimiter(app_limits=[(2, 60)]))
+
+    def test_routes_to_key_with_most_budget(self):
+        """Test permits alternate to whichever key has the most remaining budget"""
+        used = [self.pool.try_acquire_key("match")[1].key for _ in range(4)]
+        self.assertEqual(sorted(used), ["RGAPI-a", "RGAPI-a", "RGAPI-b", "RGAPI-b"])
+        self.assertEqual(self.pool.remaining("match"), 0)
+
+        delay, api_key = self.pool.try_acquire_key("match")
+        self.assertIsNone(api_key)
+        self.assertGreater(delay, 0)
+
+    def test_disabled_keys_leave_rotation(self):
+        """Test a key rejected with 401/403 is no longer handed out"""
+        self.pool.disable(self.pool.keys[0], "HTTP 403")
+        self.assertEqual([k.key for k in self.pool.active_keys()], ["RGAPI-b"])
+        self.assertEqual(self.pool.try_acquire_key("match")[1].key, "RGAPI-b")
+
+        self.pool.disable(self.pool.keys[1], "HTTP 401")
+        with self.assertRaises(ValueError):
+            self.pool.try_acquire_key("match")
+
+    def test_403s_disable_only_across_endpoints(self):
+        """Test a key goes after 403s on several endpoints, and a success in between resets the count"""
+        api_key = self.pool.keys[0]
+        for _ in range(5):
+            self.assertFalse(self.pool.record_forbidden(api_key, "match"))
+        for i in range(FORBIDDEN_ENDPOINTS_TO_DISABLE - 2):
+            self.pool.record_forbidden(api_key, f"endpoint{i}")
+        self.pool.record_success(api_key)
+        self.assertFalse(self.pool.record_forbidden(api_key, "timeline"))
+        self.assertTrue(api_key.active)
+
+        for i in range(FORBIDDEN_ENDPOINTS_TO_DISABLE):
+            disabled = self.pool.record_forbidden(api_key, f"other{i}")
+        self.assertTrue(disabled)
+        self.assertFalse(api_key.active)
+
+    def test_regions_have_separate_budgets(self):
+        """Test exhausting one region leaves the other regions' budgets untouched"""
+        for _ in range(4):
+            self.pool.try_acquire_key("match", "europe")
+        self.assertEqual(self.pool.remaining("match", "europe"), 0)
+        self.assertEqual(self.pool.remaining("match", "asia"), 4)
+        self.assertEqual(self.pool.try_acquire_key("match", "asia")[0], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.utils.match_cache import MatchCache, DEFAULT_CACHE_PATH
+from src.utils.paths import PROJECT_ROOT
+
+class TestMatchCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """Test a stored payload comes back unchanged and survives a reopen"""
+        payload = {"metadata": {"matchId": "EUW1_1"}, "info": {"queueId": 420}}
+        MatchCache(self.path).put("match", "EUW1_1", payload)
+
+        cache = MatchCache(self.path)
+        self.assertEqual(cache.get("match", "EUW1_1"), payload)
+        self.assertIsNone(cache.get("timeline", "EUW1_1"))  # Endpoints are cached separately
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted once over the size cap"""
+        cache = MatchCache(self.path, max_bytes=10**9)
+        payload = {"info": {"frames": [os.urandom(64).hex() for _ in range(20)]}}
+        cache.put("timeline", "A", payload)
+        entry_size = cache.total_bytes()
+        cache.max_bytes = entry_size * 2 + 100
+
+        cache.put("timeline", "B", payload)
+        cache.get("timeline", "A")  # A is now more recent than B
+        cache.put("timeline", "C", payload)
+
+        self.assertTrue(cache.contains("timeline", "A"))
+        self.assertFalse(cache.contains("timeline", "B"))
+        self.assertTrue(cache.contains("timeline", "C"))
+
+    def test_empty_payloads_expire(self):
+        """Test matches recorded as empty are reported until their TTL runs out"""
+        cache = MatchCache(self.path)
+        cache.mark_empty("timeline", "EUW1_1")
+        self.assertEqual(cache.known_empty("timeline"), {"EUW1_1"})
+        self.assertEqual(cache.known_empty("match"), set())
+        self.assertEqual(cache.known_empty("timeline", ttl=-1), set())
+
+    def test_path_independent_of_working_directory(self):
+        """Test the cache path is read at construction and anchored to the project root"""
+        self.assertEqual(os.path.dirname(os.path.dirname(os.path.dirname(DEFAULT_CACHE_PATH))), PROJECT_ROOT)
+        with mock.patch.dict(os.environ, {"MATCH_CACHE_PATH": self.path, "MATCH_CACHE_MAX_MB": "1"}):
+            cache = MatchCache()
+        self.assertEqual(cache.path, self.path)
+        self.assertEqual(cache.max_bytes, 1024 * 1024)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from src.api.stub_server import RiotStubServer
+from src.processing.match_fields import MATCH_FIELDS, build_match_stats_row
+from src.processing.process_match_data import process_match_data
+
+class TestMatchFields(unittest.TestCase):
+
+    def setUp(self):
+        self.match = RiotStubServer().generate_match("EUW1_7700000001")
+        self.participant = self.match["info"]["participants"][0]
+        self.stats = process_match_data(self.match, self.participant["puuid"])
+
+    def test_spec_names_are_unique(self):
+        """Test every field has its own output name and column"""
+        self.assertEqual(len({f.output for f in MATCH_FIELDS}), len(MATCH_FIELDS))
+        self.assertEqual(len({f.column for f in MATCH_FIELDS}), len(MATCH_FIELDS))
+
+    def test_extraction_follows_spec(self):
+        """Test extracted stats follow MATCH_FIELDS order and read the right sources"""
+        self.assertEqual(list(self.stats), [f.output for f in MATCH_FIELDS])
+        self.assertEqual(self.stats["championName"], self.participant["championName"])
+        self.assertEqual(self.stats["side"], "blue" if self.participant["teamId"] == 100 else "red")
+
+    def test_missing_values_fall_back_to_defaults(self):
+        """Test missing participant and challenge values use the spec defaults"""
+        self.participant.pop("item3", None)
+        self.participant["challenges"] = {}
+        stats = process_match_data(self.match, self.participant["puuid"])
+        self.assertEqual(stats["item3"], 0)
+        self.assertEqual(stats["challenges.kda"], 0)
+
+    def test_row_maps_columns_and_converts_booleans(self):
+        """Test rows use match_stats columns, convert booleans and drop None values"""
+        stats = dict(self.stats, win=1, firstTowerKill="false", lane=None)
+        row = build_match_stats_row(stats)
+        self.assertEqual(row["match_id"], stats["matchId"])
+        self.assertEqual(row["challenges_kda"], stats["challenges.kda"])
+        self.assertIs(row["win"], True)
+        self.assertIs(row["firsttowerkill"], False)
+        self.assertNotIn("lane", row)
+
+if __name__ == "__main__":
+    unittest.main()
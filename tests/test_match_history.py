@@ -0,0 +1,60 @@
+import unittest
+from unittest import mock
+from src.api import get_match_history as history_module
+from src.api.get_match_history import get_match_history
+
+HISTORY = [f"EUW1_{n}" for n in range(300, 0, -1)]  # Newest first
+
+class FakeResponse:
+    def __init__(self, batch):
+        self.batch = batch
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.batch
+
+class TestMatchHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.client = mock.Mock()
+        self.client.get.side_effect = self.fake_get
+        patcher = mock.patch.object(history_module, "get_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_get(self, url, params=None, method=None, region=None):
+        return FakeResponse(HISTORY[params["start"]:params["start"] + params["count"]])
+
+    def pages_requested(self):
+        return [call.kwargs["params"]["start"] for call in self.client.get.call_args_list]
+
+    def test_full_history_without_known_ids(self):
+        """Test an empty known_ids set falls back to paging the whole requested history"""
+        match_ids, _ = get_match_history("europe", "puuid-1", max_matches=250, known_ids=frozenset())
+        self.assertEqual(match_ids, HISTORY[:250])
+        self.assertEqual(self.pages_requested(), [0, 100, 200])
+
+    def test_stops_at_first_known_id(self):
+        """Test paging stops at the newest stored match, inside a page"""
+        known = frozenset(HISTORY[130:])
+        match_ids, _ = get_match_history("europe", "puuid-1", max_matches=300, known_ids=known)
+        self.assertEqual(match_ids, HISTORY[:130])
+        self.assertEqual(self.pages_requested(), [0, 100])
+
+    def test_known_id_first_on_a_page(self):
+        """Test a known ID at the very start of a page ends the sync without another request"""
+        known = frozenset(HISTORY[100:])
+        match_ids, _ = get_match_history("europe", "puuid-1", max_matches=300, known_ids=known)
+        self.assertEqual(match_ids, HISTORY[:100])
+        self.assertEqual(self.pages_requested(), [0, 100])
+
+        self.client.get.reset_mock()
+        match_ids, _ = get_match_history("europe", "puuid-1", max_matches=300, known_ids=frozenset(HISTORY))
+        self.assertEqual(match_ids, [])
+        self.assertEqual(self.pages_requested(), [0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from src.api.stub_server import RiotStubServer
+from src.processing.parallel import process_map
+from src.processing.process_multiple_matches import process_multiple_matches
+from src.processing.process_multiple_timelines import process_multiple_timelines
+
+def square(x, offset=0):
+    return x * x + offset
+
+class TestParallelProcessing(unittest.TestCase):
+
+    def setUp(self):
+        stub = RiotStubServer()
+        match_ids = [f"EUW1_{7500000000 + i}" for i in range(8)]
+        self.matches = [stub.generate_match(m) for m in match_ids]
+        self.timelines = [stub.generate_timeline(m) for m in match_ids]
+        self.puuid = self.matches[0]["info"]["participants"][0]["puuid"]
+
+    def test_process_map_keeps_order(self):
+        """Test results come back in input order, pooled or serial"""
+        items = list(range(50))
+        self.assertEqual(process_map(square, items, processes=2, offset=1), [x * x + 1 for x in items])
+        self.assertEqual(process_map(square, items), [x * x for x in items])
+
+    def test_matches_match_serial_results(self):
+        """Test pooled match processing gives the serial results"""
+        serial = process_multiple_matches(self.matches, self.puuid)
+        self.assertEqual(process_multiple_matches(self.matches, self.puuid, processes=2), serial)
+
+    def test_timelines_match_serial_results(self):
+        """Test pooled timeline processing gives the serial results"""
+        serial = process_multiple_timelines(self.timelines, self.puuid)
+        self.assertEqual(process_multiple_timelines(self.timelines, self.puuid, processes=2), serial)
+
+    def test_failures_stay_per_match(self):
+        """Test a broken timeline is skipped without losing the others"""
+        broken = {"metadata": {"matchId": "EUW1_broken"}, "info": {"participants": [{"puuid": self.puuid, "participantId": 1}],
+                                                                    "frames": []}}
+        timelines = [self.timelines[0], broken, self.timelines[0]]
+        metrics, _, _ = process_multiple_timelines(timelines, self.puuid, processes=2)
+        self.assertEqual([m["matchId"] for m in metrics], [self.timelines[0]["metadata"]["matchId"]] * 2)
+
+if __name__ == "__main__":
+    unittest.main()
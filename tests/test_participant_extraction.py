@@ -0,0 +1,46 @@
+import unittest
+from src.api.stub_server import RiotStubServer
+from src.processing.process_match_data import process_match_data, process_match_data_all, lane_opponents
+from src.processing.process_match_timeline_data import process_match_timeline, process_match_timeline_all
+
+class TestParticipantExtraction(unittest.TestCase):
+
+    def setUp(self):
+        stub = RiotStubServer()
+        self.match_ids = [f"EUW1_{7200000000 + i}" for i in range(5)]
+        self.matches = [stub.generate_match(m) for m in self.match_ids]
+        self.timelines = [stub.generate_timeline(m) for m in self.match_ids]
+
+    def test_match_stats_for_everyone_match_single_player_extraction(self):
+        """Test batch match stats equal the single-player extraction for all ten players"""
+        for match_data in self.matches:
+            everyone = process_match_data_all(match_data)
+            self.assertEqual(len(everyone), 10)
+            for puuid, stats in everyone.items():
+                self.assertEqual(stats, process_match_data(match_data, puuid))
+
+    def test_lane_opponents_pair_across_teams(self):
+        """Test lane opponents pair same positions across teams and None without one"""
+        participants = [
+            {"puuid": "a", "teamId": 100, "individualPosition": "TOP"},
+            {"puuid": "b", "teamId": 100, "individualPosition": "JUNGLE"},
+            {"puuid": "c", "teamId": 200, "individualPosition": "TOP"},
+        ]
+        opponents = lane_opponents(participants)
+        self.assertEqual([o["puuid"] if o else None for o in opponents], ["c", None, "a"])
+
+    def test_non_ranked_match_is_skipped(self):
+        """Test matches outside ranked solo queue give no stats"""
+        match_data = dict(self.matches[0], info=dict(self.matches[0]["info"], queueId=450))
+        self.assertEqual(process_match_data_all(match_data), {})
+
+    def test_timelines_for_everyone_match_single_player_extraction(self):
+        """Test batch timeline metrics equal the single-player extraction for all ten players"""
+        for timeline_data in self.timelines:
+            everyone = process_match_timeline_all(timeline_data)
+            self.assertEqual(len(everyone), 10)
+            for puuid, result in everyone.items():
+                self.assertEqual(result, process_match_timeline(timeline_data, puuid))
+
+if __name__ == "__main__":
+    unittest.main()
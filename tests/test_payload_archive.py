@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.utils import payload_archive
+from src.utils.payload_archive import PayloadArchive
+
+class TestPayloadArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmpdir.name, "archive")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip_and_reopen(self):
+        """Test archived payloads are readable by match ID after a reopen"""
+        archive = PayloadArchive(self.directory)
+        self.assertTrue(archive.put("match", "EUW1_1", {"info": {"gameId": 1}}))
+        self.assertTrue(archive.put("timeline", "EUW1_1", {"info": {"frames": []}}))
+        self.assertFalse(archive.put("match", "EUW1_1", {"info": {"gameId": 2}}))
+        archive.close()
+
+        reopened = PayloadArchive(self.directory)
+        self.assertEqual(reopened.get("match", "EUW1_1"), {"info": {"gameId": 1}})
+        self.assertEqual(reopened.get("timeline", "EUW1_1"), {"info": {"frames": []}})
+        self.assertIsNone(reopened.get("match", "EUW1_2"))
+        self.assertEqual(reopened.match_ids("match"), ["EUW1_1"])
+        reopened.close()
+
+    def test_rolls_over_to_new_pack(self):
+        """Test a full pack file starts a new one and old entries stay readable"""
+        archive = PayloadArchive(self.directory, pack_max_bytes=1)
+        for n in range(3):
+            archive.put("match", f"EUW1_{n}", {"info": {"gameId": n, "pad": "x" * 100}})
+        packs = sorted(f for f in os.listdir(self.directory) if f.startswith("pack-"))
+        self.assertEqual(len(packs), 3)
+        self.assertEqual(archive.get("match", "EUW1_0")["info"]["gameId"], 0)
+        archive.close()
+
+    def test_reopen_appends_to_last_pack(self):
+        """Test a reopened archive keeps filling its last pack and rolls over from there"""
+        payload = {"info": {"pad": "x" * 100}}
+        archive = PayloadArchive(self.directory, pack_max_bytes=1)
+        archive.put("match", "EUW1_0", payload)
+        archive.put("match", "EUW1_1", payload)
+        archive.close()
+
+        reopened = PayloadArchive(self.directory, pack_max_bytes=1)
+        self.assertEqual(reopened._active_pack, 1)
+        self.assertEqual(reopened._active_size, os.path.getsize(reopened._pack_path(1)))
+        reopened.put("match", "EUW1_2", payload)
+        self.assertEqual(reopened._entries[(0, "EUW1_2")][1], 2)
+        reopened.pack_max_bytes = 1024 * 1024
+        reopened.put("match", "EUW1_3", payload)
+        self.assertEqual(reopened._entries[(0, "EUW1_3")][1], 2)
+        self.assertEqual(reopened.get("match", "EUW1_0"), payload)
+        reopened.close()
+
+    def test_archiving_is_opt_in(self):
+        """Test no archive is used unless PAYLOAD_ARCHIVE_DIR is set"""
+        with mock.patch.object(payload_archive, "_archive", None):
+            with mock.patch.dict(os.environ, {}, clear=False):
+                os.environ.pop("PAYLOAD_ARCHIVE_DIR", None)
+                self.assertIsNone(payload_archive.get_payload_archive())
+            with mock.patch.dict(os.environ, {"PAYLOAD_ARCHIVE_DIR": ""}):
+                self.assertIsNone(payload_archive.get_payload_archive())
+            with mock.patch.dict(os.environ, {"PAYLOAD_ARCHIVE_DIR": self.directory}):
+                archive = payload_archive.get_payload_archive()
+                self.assertEqual(archive.directory, self.directory)
+                archive.close()
+
+    def test_zlib_entries_readable_without_zstandard(self):
+        """Test the zlib fallback writes entries any install can read and warns once"""
+        archive = PayloadArchive(self.directory)
+        archive._compressor = None
+        with mock.patch.object(payload_archive, "_zlib_warned", False), mock.patch("builtins.print") as printed:
+            archive.put("match", "EUW1_1", {"info": {"gameId": 1}})
+            archive.put("match", "EUW1_2", {"info": {"gameId": 2}})
+        self.assertEqual(printed.call_count, 1)
+        self.assertIn("zstandard", printed.call_args[0][0])
+        archive._decompressor = None
+        self.assertEqual(archive.get("match", "EUW1_1"), {"info": {"gameId": 1}})
+        archive.close()
+
+if __name__ == "__main__":
+    unittest.main()
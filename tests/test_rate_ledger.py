@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.utils.paths import PROJECT_ROOT
+from src.utils.rate_ledger import SharedRateLimiter, DEFAULT_LEDGER_PATH
+from src.utils.rate_limiter import create_limiter
+
+def _grab_permits(path, n, results):
+    limiter = SharedRateLimiter(path, app_limits=[(10, 60)])
+    results.put(sum(1 for _ in range(n) if limiter.try_acquire("match") == 0))
+
+class TestSharedRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "ledger.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_budget_shared_between_limiters(self):
+        """Test two limiters on the same ledger draw from one budget"""
+        first = SharedRateLimiter(self.path, app_limits=[(3, 60)])
+        second = SharedRateLimiter(self.path, app_limits=[(3, 60)])
+        self.assertEqual(first.try_acquire("match"), 0)
+        self.assertEqual(second.try_acquire("match"), 0)
+        self.assertEqual(first.try_acquire("timeline"), 0)
+        self.assertGreater(second.try_acquire("match"), 50)
+        self.assertEqual(first.remaining("match"), 0)
+
+    def test_budget_shared_between_processes(self):
+        """Test concurrent processes never get more permits than the app limit"""
+        results = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=_grab_permits, args=(self.path, 8, results)) for _ in range(3)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        self.assertEqual(sum(results.get() for _ in workers), 10)
+
+    def test_headers_update_shared_limits(self):
+        """Test limits and counts reported by Riot are visible to other limiters"""
+        SharedRateLimiter(self.path).update_from_headers("match", {
+            "X-App-Rate-Limit": "20:1,100:120",
+            "X-App-Rate-Limit-Count": "1:1,100:120",
+        })
+        other = SharedRateLimiter(self.path)
+        self.assertEqual(other.remaining("match"), 0)
+        self.assertGreater(other.wait_time("match"), 100)
+
+    def test_ledger_path_independent_of_working_directory(self):
+        """Test processes started from different directories open the same ledger"""
+        self.assertTrue(DEFAULT_LEDGER_PATH.startswith(PROJECT_ROOT + os.sep))
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+        paths = []
+        with mock.patch("src.utils.rate_ledger.SharedRateLimiter", lambda path, namespace: paths.append(path)), \
+                mock.patch.dict(os.environ, {"RIOT_RATE_LEDGER_PATH": os.path.join("data", "ledger.sqlite3")}):
+            for directory in (PROJECT_ROOT, self.tmpdir.name):
+                os.chdir(directory)
+                create_limiter("key")
+        self.assertEqual(paths, [os.path.join(PROJECT_ROOT, "data", "ledger.sqlite3")] * 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from src.api.client import RiotClient
+from src.api.retry import RetryPolicy
+from src.api.stub_server import RiotStubServer
+from src.utils.rate_limiter import RateLimiter, RateWindow, parse_rate_header, summarize_rate_headers
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_parse_rate_header(self):
+        """Test parsing every window of a Riot rate-limit header"""
+        self.assertEqual(parse_rate_header("100:120,20:1"), [(20, 1), (100, 120)])
+        self.assertEqual(parse_rate_header(None), [])
+        self.assertEqual(parse_rate_header("garbage"), [])
+
+    def test_window_wait_time(self):
+        """Test a full window reports the time until its oldest request expires"""
+        window = RateWindow(2, 10)
+        window.record(0.0)
+        window.record(1.0)
+        self.assertAlmostEqual(window.wait_time(5.0), 5.0 + window.margin)
+        self.assertEqual(window.wait_time(10.5), 0.0)
+
+    def test_update_from_headers_tracks_all_windows(self):
+        """Test app and method windows are both built from response headers"""
+        limiter = RateLimiter()
+        limiter.update_from_headers("match", {
+            "X-App-Rate-Limit": "20:1,100:120",
+            "X-App-Rate-Limit-Count": "1:1,99:120",
+            "X-Method-Rate-Limit": "2000:10",
+            "X-Method-Rate-Limit-Count": "1:10",
+        })
+        scopes = {(row["scope"], row["seconds"]): row for row in limiter.snapshot("match")}
+        self.assertEqual(scopes[("app", 120)]["used"], 99)
+        self.assertEqual(scopes[("method", 10)]["max"], 2000)
+        # The 120s window only has one request left, even though the 1s window has 19
+        self.assertEqual(limiter.remaining("match"), 1)
+
+    def test_acquire_does_not_oversleep(self):
+        """Test acquire only waits as long as the tightest window requires"""
+        limiter = RateLimiter(app_limits=[(2, 1)])
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire("match")
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.9)
+        self.assertLess(elapsed, 1.5)
+
+    def test_no_429s_across_window_rollovers(self):
+        """Test neither limiter draws a 429 from the stub when its 1s window rolls over"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for ledger_path in ("", os.path.join(tmpdir, "ledger.sqlite3")):
+                with self.subTest(shared=bool(ledger_path)), \
+                        mock.patch.dict(os.environ, {"RIOT_RATE_LEDGER_PATH": ledger_path}), \
+                        RiotStubServer(app_limits="5:1,100:120", latency_ms=20) as server:
+                    # No retries, so a 429 is returned instead of being waited out
+                    client = RiotClient(api_keys=["key-a"], retry_policy=RetryPolicy(max_attempts=1))
+                    url = f"{server.base_url}/lol/match/v5/matches/EUW1_7000000001"
+                    with ThreadPoolExecutor(max_workers=4) as executor:
+                        statuses = list(executor.map(lambda _: client.get(url, method="match").status_code, range(16)))
+                    client.close()
+                    self.assertEqual(statuses, [200] * 16)
+
+    def test_summarize_rate_headers(self):
+        """Test the summary reports the most utilised app window"""
+        info = summarize_rate_headers({"X-App-Rate-Limit": "20:1,100:120", "X-App-Rate-Limit-Count": "3:1,90:120"})
+        self.assertEqual(info, {"used": 90, "max": 100})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import unittest
+from src.utils.payload_archive import PayloadArchive
+from src.utils.replay_source import ReplaySource
+
+def match(match_id, created, players):
+    participants = [{"puuid": puuid, "riotIdGameName": name, "riotIdTagline": "EUW"} for puuid, name in players]
+    return {"metadata": {"matchId": match_id}, "info": {"gameCreation": created, "participants": participants}}
+
+def timeline(match_id):
+    return {"metadata": {"matchId": match_id}, "info": {"frames": [{"timestamp": 0}]}}
+
+PAYLOADS = [
+    match("EUW1_1", 100, [("p-a", "Alpha"), ("p-b", "Beta")]),
+    match("EUW1_2", 300, [("p-a", "Alpha")]),
+    match("EUW1_3", 200, [("p-b", "Beta")]),
+]
+
+class TestReplaySource(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _check(self, source):
+        self.assertEqual(source.find_puuid("alpha", "euw"), "p-a")
+        self.assertIsNone(source.find_puuid("Gamma", "EUW"))
+        self.assertEqual(source.match_ids_for("p-a"), ["EUW1_2", "EUW1_1"])
+        match_datas, timeline_datas = source.load(["EUW1_2", "EUW1_1"])
+        self.assertEqual([d["metadata"]["matchId"] for d, _ in match_datas], ["EUW1_2", "EUW1_1"])
+        self.assertEqual([d["metadata"]["matchId"] for d, _ in timeline_datas], ["EUW1_2"])
+
+    def test_json_folder(self):
+        """Test a matches/ + timelines/ folder replays in newest-first order"""
+        for kind in ("matches", "timelines"):
+            os.makedirs(os.path.join(self.tmpdir.name, kind))
+        for payload in PAYLOADS:
+            with open(os.path.join(self.tmpdir.name, "matches", f"{payload['metadata']['matchId']}.json"), "w") as f:
+                json.dump(payload, f)
+        with open(os.path.join(self.tmpdir.name, "timelines", "EUW1_2.json"), "w") as f:
+            json.dump(timeline("EUW1_2"), f)
+        self._check(ReplaySource(self.tmpdir.name))
+
+    def test_payload_archive(self):
+        """Test a payload archive directory replays the same way"""
+        archive = PayloadArchive(self.tmpdir.name)
+        for payload in PAYLOADS:
+            archive.put("match", payload["metadata"]["matchId"], payload)
+        archive.put("timeline", "EUW1_2", timeline("EUW1_2"))
+        archive.close()
+        self._check(ReplaySource(self.tmpdir.name))
+
+if __name__ == "__main__":
+    unittest.main()
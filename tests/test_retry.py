@@ -0,0 +1,44 @@
+import time
+import unittest
+from src.api.retry import RetryPolicy, RetryStats
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retry_after_is_honoured(self):
+        """Test a 429 waits exactly as long as Retry-After says"""
+        policy = RetryPolicy()
+        self.assertEqual(policy.retry_delay(0, FakeResponse(429, {"Retry-After": "7"})), 7.0)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test 5xx backoff stays between 0 and the capped exponential delay"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        for attempt in range(6):
+            delay = policy.retry_delay(attempt, FakeResponse(503))
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4.0, 2 ** attempt))
+
+    def test_gives_up_on_attempts_and_deadline(self):
+        """Test retries stop after max_attempts or once the deadline would be passed"""
+        policy = RetryPolicy(max_attempts=3, deadline=10)
+        now = time.monotonic()
+        self.assertTrue(policy.should_retry(0, now, 1))
+        self.assertFalse(policy.should_retry(2, now, 1))
+        self.assertFalse(policy.should_retry(0, now, 11))
+
+    def test_stats_summary(self):
+        """Test retries and give-ups are reported per endpoint"""
+        stats = RetryStats()
+        stats.record_retry("match", "429")
+        stats.record_retry("match", "429")
+        stats.record_give_up("timeline")
+        summary = stats.summary()
+        self.assertEqual(summary["match"]["retries"], {"429": 2})
+        self.assertEqual(summary["timeline"]["gave_up"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
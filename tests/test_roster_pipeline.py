@@ -0,0 +1,38 @@
+import unittest
+from unittest import mock
+from src.pipelines import roster_pipeline
+
+HISTORIES = {"A": ["EUW1_3", "EUW1_2", "EUW1_1"], "B": ["EUW1_4", "EUW1_3", "EUW1_1"]}
+
+def fake_ids(region, game_name, tag_line, max_matches, incremental):
+    return f"puuid-{game_name}", HISTORIES[game_name]
+
+def fake_fetch(region, match_ids, include_details=True, include_timeline=True, workers=1):
+    payloads = [({"metadata": {"matchId": m}}, {"used": 0, "max": 20}) for m in match_ids]
+    return payloads, (payloads if include_timeline else [])
+
+class TestRosterPipeline(unittest.TestCase):
+
+    def test_parse_riot_id(self):
+        """Test Riot IDs are split on the last '#'"""
+        self.assertEqual(roster_pipeline.parse_riot_id("Nakla#EUW"), ("Nakla", "EUW"))
+        self.assertEqual(roster_pipeline.parse_riot_id(("Nakla", "EUW")), ("Nakla", "EUW"))
+        with self.assertRaises(ValueError):
+            roster_pipeline.parse_riot_id("Nakla")
+
+    @mock.patch.object(roster_pipeline, "run_player_timeline_pipeline")
+    @mock.patch.object(roster_pipeline, "run_player_pipeline")
+    @mock.patch.object(roster_pipeline, "fetch_match_and_timeline_data", side_effect=fake_fetch)
+    @mock.patch.object(roster_pipeline, "fetch_puuid_and_match_ids", side_effect=fake_ids)
+    def test_shared_matches_fetched_once(self, _ids, fetch, run_matches, run_timelines):
+        """Test each unique match is fetched once and fanned out to every player in it"""
+        summary = roster_pipeline.run_roster_pipeline("europe", ["A#EUW", "B#EUW"], save=False)
+
+        fetch.assert_called_once()
+        self.assertEqual(fetch.call_args[0][1], ["EUW1_3", "EUW1_2", "EUW1_1", "EUW1_4"])
+        self.assertEqual((summary["unique_matches"], summary["player_matches"]), (4, 6))
+        per_player = {c[0][0]: [d["metadata"]["matchId"] for d in c[0][1]] for c in run_matches.call_args_list}
+        self.assertEqual(per_player, {"puuid-A": HISTORIES["A"], "puuid-B": HISTORIES["B"]})
+
+if __name__ == "__main__":
+    unittest.main()
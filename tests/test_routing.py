@@ -0,0 +1,41 @@
+import os
+import unittest
+from unittest import mock
+from src.api import get_puuid as get_puuid_module
+from src.api.routing import region_for_match, region_for_platform, group_by_region, account_region
+
+class TestRouting(unittest.TestCase):
+
+    def test_region_from_match_id(self):
+        """Test match IDs are routed by their platform prefix"""
+        self.assertEqual(region_for_match("EUW1_7313131872"), "europe")
+        self.assertEqual(region_for_match("KR_7012345678"), "asia")
+        self.assertEqual(region_for_match("NA1_5012345678"), "americas")
+        self.assertEqual(region_for_match("OC1_612345678"), "sea")
+        self.assertEqual(region_for_platform("euw1"), "europe")
+        self.assertEqual(region_for_match("XX_1", default="europe"), "europe")
+
+    def test_group_keeps_order(self):
+        """Test grouping splits by region and keeps each group's order"""
+        groups = group_by_region(["KR_2", "EUW1_1", "KR_1", "EUN1_3"])
+        self.assertEqual(groups, {"asia": ["KR_2", "KR_1"], "europe": ["EUW1_1", "EUN1_3"]})
+
+    def test_sea_account_lookups_go_to_asia(self):
+        """Test account-v1 is never called on "sea", which doesn't serve it"""
+        self.assertEqual(account_region("sea"), "asia")
+        self.assertEqual(account_region("europe"), "europe")
+
+        response = mock.Mock(headers={})
+        response.json.return_value = {"puuid": "p-1"}
+        client = mock.Mock()
+        client.get.return_value = response
+        with mock.patch.object(get_puuid_module, "get_client", return_value=client), \
+                mock.patch.dict(os.environ, {"RIOT_API_BASE_URL": ""}):
+            puuid, _ = get_puuid_module.get_puuid("sea", "Name", "SG2")
+        self.assertEqual(puuid, "p-1")
+        url = client.get.call_args.args[0]
+        self.assertIn("asia.api.riotgames.com", url)
+        self.assertEqual(client.get.call_args.kwargs["region"], "asia")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import threading
+import time
+import unittest
+from src.api.key_pool import ApiKeyPool
+from src.api.scheduler import PriorityScheduler, INTERACTIVE, REFRESH, BACKFILL, request_priority, current_priority
+from src.utils.rate_limiter import RateLimiter
+
+class TestPriorityScheduler(unittest.TestCase):
+
+    def setUp(self):
+        pool = ApiKeyPool(["RGAPI-test"], limiter_factory=lambda name: RateLimiter())
+        self.scheduler = PriorityScheduler(key_pool=pool, backfill_share=0.2, history=10)
+
+    def test_interactive_served_first(self):
+        """Test an interactive request jumps ahead of earlier backfill and refresh requests"""
+        self.scheduler._waiting = {0: (BACKFILL, "match", None), 1: (REFRESH, "match", None), 2: (INTERACTIVE, "account", None)}
+        self.scheduler._recent.extend([BACKFILL] * 5)
+        self.assertEqual(self.scheduler._next_ticket(), 2)
+
+    def test_backfill_minimum_share(self):
+        """Test backfill is served once its share of recent grants drops below the minimum"""
+        self.scheduler._waiting = {0: (BACKFILL, "match", None), 1: (INTERACTIVE, "match", None)}
+        self.scheduler._recent.extend([INTERACTIVE] * 9 + [BACKFILL])
+        self.assertEqual(self.scheduler._next_ticket(), 0)
+
+    def test_regions_have_separate_lanes(self):
+        """Test a request waiting on one region does not hold up another region"""
+        self.scheduler._waiting = {0: (INTERACTIVE, "match", "europe"), 1: (BACKFILL, "match", "asia")}
+        self.assertEqual(self.scheduler._next_ticket("europe"), 0)
+        self.assertEqual(self.scheduler._next_ticket("asia"), 1)
+        self.assertIsNone(self.scheduler._next_ticket("americas"))
+
+    def test_blocked_method_does_not_hold_up_other_methods(self):
+        """Test a request for a blocked method does not delay another method in the same region"""
+        api_key = self.scheduler.key_pool.keys[0]
+        api_key.limiter_for("europe").block(1.5, "match")
+        waits = {}
+
+        def acquire(method, priority):
+            waits[method] = self.scheduler.acquire(method, priority=priority, region="europe")[1]
+
+        blocked = threading.Thread(target=acquire, args=("match", INTERACTIVE))
+        blocked.start()
+        while not self.scheduler._waiting:
+            time.sleep(0.01)
+        acquire("timeline", BACKFILL)
+        self.assertLess(waits["timeline"], 0.5)
+        blocked.join()
+        self.assertGreater(waits["match"], 1.0)
+
+    def test_skips_tickets_whose_method_is_blocked(self):
+        """Test the most urgent ticket is passed over while its method is blocked"""
+        self.scheduler.key_pool.keys[0].limiter_for(None).block(60, "match")
+        self.scheduler._waiting = {0: (INTERACTIVE, "match", None), 1: (BACKFILL, "timeline", None)}
+        self.assertEqual(self.scheduler._next_ticket(), 1)
+        self.scheduler._waiting = {0: (INTERACTIVE, "match", None)}
+        self.assertEqual(self.scheduler._next_ticket(), 0)
+
+    def test_acquire_records_grants(self):
+        """Test acquire uses the priority set by request_priority"""
+        with request_priority(BACKFILL):
+            self.assertEqual(current_priority(), BACKFILL)
+            api_key, _ = self.scheduler.acquire("match")
+        self.assertEqual(api_key.key, "RGAPI-test")
+        self.assertEqual(current_priority(), REFRESH)
+        self.assertEqual(self.scheduler.granted[BACKFILL], 1)
+
+if __name__ == "__main__":
+    unittest.main()
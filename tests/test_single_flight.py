@@ -0,0 +1,43 @@
+import threading
+import time
+import unittest
+from src.utils.single_flight import SingleFlight
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test concurrent requests for the same key run the work once"""
+        flight = SingleFlight()
+        calls = []
+
+        def fetch(match_id):
+            calls.append(match_id)
+            time.sleep(0.1)
+            return {"matchId": match_id}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("EUW1_1", fetch, "EUW1_1")))
+                   for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(calls, ["EUW1_1"])
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(flight.coalesced, 4)
+
+    def test_errors_are_shared_and_key_released(self):
+        """Test waiters see the leader's exception and the key can be retried afterwards"""
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            flight.do("k", fail)
+        self.assertEqual(flight.do("k", lambda: 42), 42)
+
+if __name__ == "__main__":
+    unittest.main()
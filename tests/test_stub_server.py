@@ -0,0 +1,80 @@
+import json
+import time
+import unittest
+import urllib.error
+import urllib.request
+import requests
+from src.api.stub_server import RiotStubServer
+
+class TestStubServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = RiotStubServer(app_limits="5:1,100:120")
+        self.base_url = self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def get(self, path):
+        request = urllib.request.Request(self.base_url + path, headers={"X-Riot-Token": "test"})
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read()), response.headers
+
+    def test_player_flow(self):
+        """Test account -> match ids -> match -> timeline against generated data"""
+        account, headers = self.get("/riot/account/v1/accounts/by-riot-id/Nakla/EUW")
+        self.assertEqual(headers["X-App-Rate-Limit"], "5:1,100:120")
+        self.assertEqual(headers["X-App-Rate-Limit-Count"], "1:1,1:120")
+
+        ids, _ = self.get(f"/lol/match/v5/matches/by-puuid/{account['puuid']}/ids?start=0&count=3")
+        self.assertEqual(len(ids), 3)
+        self.assertTrue(ids[0].startswith("EUW1_"))
+
+        match, _ = self.get(f"/lol/match/v5/matches/{ids[0]}")
+        self.assertIn(account["puuid"], match["metadata"]["participants"])
+
+        timeline, _ = self.get(f"/lol/match/v5/matches/{ids[0]}/timeline")
+        self.assertGreater(len(timeline["info"]["frames"]), 20)
+
+    def test_rate_limit_enforced(self):
+        """Test a 429 with Retry-After once the app limit is exceeded"""
+        for _ in range(5):
+            self.get("/lol/match/v5/matches/EUW1_7000000001")
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            self.get("/lol/match/v5/matches/EUW1_7000000001")
+        self.assertEqual(ctx.exception.code, 429)
+        self.assertEqual(ctx.exception.headers["X-Rate-Limit-Type"], "application")
+        self.assertIsNotNone(ctx.exception.headers["Retry-After"])
+
+    def test_keep_alive_requests_are_fast(self):
+        """Test requests reusing one connection don't stall on Nagle / delayed ACK (~40 ms each)"""
+        server = RiotStubServer(enforce_limits=False)
+        base_url = server.start()
+        try:
+            with requests.Session() as session:
+                session.get(f"{base_url}/lol/match/v5/matches/EUW1_7000000001").raise_for_status()
+                durations = []
+                for _ in range(10):
+                    started = time.perf_counter()
+                    session.get(f"{base_url}/lol/match/v5/matches/EUW1_7000000001").raise_for_status()
+                    durations.append(time.perf_counter() - started)
+        finally:
+            server.stop()
+        self.assertLess(sorted(durations)[len(durations) // 2], 0.02)
+        self.assertLess(sum(durations) / len(durations), 0.03)
+
+    def test_match_payload_does_not_depend_on_earlier_calls(self):
+        """Test a match returns the same payload before and after other players' histories are fetched"""
+        self.server.enforce_limits = False
+        before, _ = self.get("/lol/match/v5/matches/EUW1_7000000042")
+        for name in ("Nakla", "Caps", "Faker"):
+            account, _ = self.get(f"/riot/account/v1/accounts/by-riot-id/{name}/EUW")
+            ids, _ = self.get(f"/lol/match/v5/matches/by-puuid/{account['puuid']}/ids?start=0&count=100")
+            match, _ = self.get(f"/lol/match/v5/matches/{ids[0]}")
+            self.assertIn(account["puuid"], match["metadata"]["participants"])
+        after, _ = self.get("/lol/match/v5/matches/EUW1_7000000042")
+        self.assertEqual(before, after)
+        self.assertEqual(RiotStubServer().generate_match("EUW1_7000000042"), after)
+
+if __name__ == "__main__":
+    unittest.main()
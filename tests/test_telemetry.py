@@ -0,0 +1,33 @@
+import unittest
+from src.api.telemetry import Histogram, Telemetry
+
+class TestTelemetry(unittest.TestCase):
+
+    def test_histogram_percentiles(self):
+        """Test percentiles come from bucket bounds and never exceed the max seen"""
+        hist = Histogram(bounds=(10, 100, 1000))
+        for value in [5] * 90 + [500] * 10:
+            hist.observe(value)
+        self.assertEqual(hist.percentile(0.5), 10)
+        self.assertEqual(hist.percentile(0.95), 500)
+        self.assertEqual(hist.snapshot()["buckets"], {"<=10ms": 90, "<=1000ms": 10})
+
+    def test_records_per_endpoint(self):
+        """Test responses, calls and stages are aggregated per endpoint"""
+        telemetry = Telemetry()
+        telemetry.record_response("match", 429, 0.05, 80)
+        telemetry.record_response("match", 200, 0.12, 20000)
+        telemetry.record_call("match", retries=1, rate_wait_s=1.5)
+        with telemetry.stage("process_matches"):
+            pass
+
+        summary = telemetry.summary()
+        match = summary["endpoints"]["match"]
+        self.assertEqual((match["calls"], match["responses"], match["retries"]), (1, 2, 1))
+        self.assertEqual(match["bytes"], 20080)
+        self.assertEqual(match["statuses"], {"429": 1, "200": 1})
+        self.assertEqual(match["rate_wait"]["mean_ms"], 1500.0)
+        self.assertIn("process_matches", summary["stages"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import random
+import unittest
+from benchmarks.bench_timeline_processing import rescan_counters
+from src.api.stub_server import RiotStubServer
+from src.processing.process_match_timeline_data import aggregate_events, aggregate_events_all, iter_events
+
+def scan_firsts(frames, pid):
+    """Reference: first matching event per one-time metric, each found with its own scan."""
+    def first(e_type, condition):
+        return next((e.get("timestamp") for e in iter_events(frames)
+                     if e.get("type") == e_type and condition(e)), None)
+    skill = next(({1: "Q", 2: "W", 3: "E"}.get(e.get("skillSlot")) for e in iter_events(frames)
+                  if e.get("type") == "SKILL_LEVEL_UP" and e.get("participantId") == pid), None)
+    return {
+        "firstItemTime": first("ITEM_PURCHASED", lambda e: e.get("participantId") == pid),
+        "firstSkillUsed": skill,
+        "firstWardTime": first("WARD_PLACED", lambda e: e.get("creatorId") == pid),
+        "firstKillTime": first("CHAMPION_KILL", lambda e: e.get("killerId") == pid),
+        "firstDeathTime": first("CHAMPION_KILL", lambda e: e.get("victimId") == pid),
+    }
+
+class TestTimelineAggregation(unittest.TestCase):
+
+    def setUp(self):
+        self.stub = RiotStubServer()
+        self.rng = random.Random(3)
+        self.timelines = [self.perturbed_timeline(f"EUW1_{7800000000 + i}") for i in range(12)]
+
+    def perturbed_timeline(self, match_id):
+        """A generated timeline with some events moved onto (or just past) 5-minute marks or missing a timestamp."""
+        timeline = self.stub.generate_timeline(match_id)
+        for frame in timeline["info"]["frames"]:
+            for event in frame["events"]:
+                roll = self.rng.random()
+                if roll < 0.05:
+                    event["timestamp"] = event["timestamp"] // 300000 * 300000   # Exactly on a 5-minute mark
+                elif roll < 0.07:
+                    event["timestamp"] = event["timestamp"] // 300000 * 300000 + 1
+                elif roll < 0.08:
+                    del event["timestamp"]
+        return timeline
+
+    def assert_matches_scan(self, frames):
+        timepoints = list(range(5, len(frames), 5))
+        everyone = aggregate_events_all(frames, list(range(1, 11)), timepoints)
+        for pid in range(1, 11):
+            counters, firsts, ward_events = aggregate_events(frames, pid, timepoints)
+            self.assertEqual(counters, rescan_counters(frames, pid, timepoints))
+            self.assertEqual({k: firsts.get(k) for k in scan_firsts(frames, pid)}, scan_firsts(frames, pid))
+            self.assertEqual(ward_events, [e for e in iter_events(frames)
+                                           if e["type"] == "WARD_PLACED" and e.get("creatorId") == pid])
+            self.assertEqual(everyone[pid], (counters, firsts, ward_events))
+
+    def test_prefix_sums_match_per_timepoint_scan(self):
+        """Test the single-pass counters and first events equal the old per-timepoint scans"""
+        for timeline in self.timelines:
+            self.assert_matches_scan(timeline["info"]["frames"])
+
+    def test_long_game_matches_per_timepoint_scan(self):
+        """Test a 40+ minute game, where a per-timepoint scan costs the most, aggregates the same"""
+        match_number = 7810000000
+        while True:
+            match_number += 1
+            frames = self.perturbed_timeline(f"EUW1_{match_number}")["info"]["frames"]
+            if len(frames) - 1 >= 40:
+                break
+        self.assert_matches_scan(frames)
+
+if __name__ == "__main__":
+    unittest.main()
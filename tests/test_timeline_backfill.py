@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src.pipelines import timeline_backfill
+from src.utils.match_cache import MatchCache
+
+class TestTimelineBackfill(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache = MatchCache(os.path.join(tmpdir.name, "cache.sqlite3"))
+        patcher = mock.patch.object(timeline_backfill, "get_match_cache", return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch("src.database.reader.get_stored_timeline_match_ids", return_value={"EUW1_3"})
+    @mock.patch("src.database.reader.get_stored_match_ids", return_value={"EUW1_1", "EUW1_2", "EUW1_3", "EUW1_10"})
+    def test_ensure_timelines_fetches_newest_missing(self, _matches, _timelines):
+        """Test only matches without stored timelines are fetched, newest first"""
+        with mock.patch.object(timeline_backfill, "fetch_timelines") as fetch:
+            fetched = timeline_backfill.ensure_timelines("europe", "puuid-1", limit=2)
+        self.assertEqual(fetched, ["EUW1_10", "EUW1_2"])
+        fetch.assert_called_once_with("europe", "puuid-1", ["EUW1_10", "EUW1_2"], save=True, workers=1)
+
+    @mock.patch("src.database.reader.get_stored_timeline_match_ids", return_value=set())
+    @mock.patch("src.database.reader.get_stored_match_ids", return_value={"EUW1_1", "EUW1_2"})
+    def test_empty_timelines_fetched_once(self, _matches, _timelines):
+        """Test a timeline that came back empty is not requested again by later backfills"""
+        from src.api import get_match_timeline as module
+        response = mock.Mock(content=b'{"info": {"frames": []}}', headers={})
+        client = mock.Mock(get=mock.Mock(return_value=response))
+        with mock.patch.object(module, "get_client", return_value=client), \
+                mock.patch.object(module, "get_match_cache", return_value=self.cache), \
+                mock.patch.object(module, "get_payload_archive", return_value=None):
+            module.get_match_timeline("europe", "EUW1_1")
+        self.assertEqual(client.get.call_count, 1)
+
+        with mock.patch.object(timeline_backfill, "fetch_timelines") as fetch:
+            self.assertEqual(timeline_backfill.ensure_timelines("europe", "puuid-4"), ["EUW1_2"])
+        fetch.assert_called_once_with("europe", "puuid-4", ["EUW1_2"], save=True, workers=1)
+
+    def test_backfill_runs_at_backfill_priority(self):
+        """Test deferred timelines are fetched in the background at BACKFILL priority"""
+        from src.api.scheduler import current_priority, BACKFILL
+        seen = []
+        with mock.patch.object(timeline_backfill, "ensure_timelines",
+                               side_effect=lambda *a, **k: seen.append((current_priority(), a[2])) or []):
+            thread = timeline_backfill.start_timeline_backfill("europe", "puuid-2", ["EUW1_1"])
+            thread.join()
+            thread = timeline_backfill.start_timeline_backfill("europe", "puuid-2")
+            thread.join()
+        self.assertEqual(seen, [(BACKFILL, ["EUW1_1"]), (BACKFILL, None)])
+        self.assertFalse(timeline_backfill.backfill_running("puuid-2"))
+
+    def test_sync_without_new_matches_recovers_missing_timelines(self):
+        """Test an incremental sync with nothing new still backfills stored matches lacking timelines"""
+        from src.pipelines import full_pipeline
+        with mock.patch.object(full_pipeline, "fetch_puuid_and_match_ids", return_value=("puuid-3", [])), \
+                mock.patch.object(full_pipeline, "save_player"), \
+                mock.patch.object(full_pipeline, "start_timeline_backfill", return_value="thread") as start:
+            backfill = full_pipeline.run_full_pipeline("europe", "Name", "EUW", incremental=True)
+        self.assertEqual(backfill, "thread")
+        start.assert_called_once_with("europe", "puuid-3", workers=1)
+
+if __name__ == "__main__":
+    unittest.main()
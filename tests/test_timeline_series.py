@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+from src.api.stub_server import RiotStubServer
+from src.processing.process_match_timeline_data import process_match_timeline
+from src.processing.timeline_series import SERIES_FEATURES, timeline_series, stack_series
+
+class TestTimelineSeries(unittest.TestCase):
+
+    def setUp(self):
+        stub = RiotStubServer()
+        self.match_ids = [f"EUW1_{7400000000 + i}" for i in range(3)]
+        self.matches = [stub.generate_match(m) for m in self.match_ids]
+        self.timelines = [stub.generate_timeline(m) for m in self.match_ids]
+
+    def test_shape_and_snapshots_agree_with_flat_metrics(self):
+        """Test the series shape and its 5-minute values match the flat timeline metrics"""
+        timeline_data = self.timelines[0]
+        series = timeline_series(timeline_data, self.matches[0])
+        frames = timeline_data["info"]["frames"]
+        self.assertEqual(series.values.shape, (len(frames), 10, len(SERIES_FEATURES)))
+
+        puuid = series.puuids[3]
+        metrics, _, _ = process_match_timeline(timeline_data, puuid)
+        i = series.player_index(puuid)
+        for t in range(5, len(frames) - 1, 5):
+            self.assertEqual(series.feature("totalGold")[t, i], metrics[f"goldAt{t}Min"])
+            self.assertEqual(series.feature("cs")[t, i], metrics[f"csAt{t}Min"])
+
+    def test_lane_diff_uses_match_positions(self):
+        """Test lane diffs pair players by their match position"""
+        series = timeline_series(self.timelines[0], self.matches[0])
+        participants = self.matches[0]["info"]["participants"]
+        top = [series.player_index(p["puuid"]) for p in participants if p["individualPosition"] == "TOP"]
+        diff = series.lane_diff()
+        np.testing.assert_array_equal(diff[:, top[0], :], series.values[:, top[0], :] - series.values[:, top[1], :])
+        np.testing.assert_array_equal(diff[:, top[0], :], -diff[:, top[1], :])
+
+    def test_team_diff_is_own_minus_enemy(self):
+        """Test team diffs are own team total minus enemy team total"""
+        series = timeline_series(self.timelines[0])
+        gold = series.feature("totalGold")
+        blue, red = gold[:, :5].sum(axis=1), gold[:, 5:].sum(axis=1)
+        diff = series.team_diff()[:, :, SERIES_FEATURES.index("totalGold")]
+        np.testing.assert_array_equal(diff[:, 0], blue - red)
+        np.testing.assert_array_equal(diff[:, 9], red - blue)
+
+    def test_stack_pads_shorter_games(self):
+        """Test stacking pads shorter games with NaN to the longest one"""
+        series = [timeline_series(t) for t in self.timelines]
+        stacked = stack_series(series)
+        longest = max(s.minutes for s in series)
+        self.assertEqual(stacked.shape, (3, longest, 10, len(SERIES_FEATURES)))
+        for i, s in enumerate(series):
+            self.assertTrue(np.isnan(stacked[i, s.minutes:]).all())
+            np.testing.assert_array_equal(stacked[i, :s.minutes], s.values)
+
+if __name__ == "__main__":
+    unittest.main()